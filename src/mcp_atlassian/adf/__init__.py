@@ -29,9 +29,9 @@ from .types import (
     ElementPath
 )
 from .validator import ADFValidator
-from .reader import ADFReader, get_page_with_full_formatting
+from .reader import ADFReader, get_page_with_full_formatting, get_pages_with_full_formatting
 from .finder import ADFFinder, find_element_in_adf
-from .writer import ADFWriter, UpdateOperation, update_page_preserving_formatting
+from .writer import ADFWriter, UpdateOperation, update_page_preserving_formatting, update_pages_preserving_formatting
 from .colors import ColorFormatter, preserve_color_formatting, analyze_document_colors, standardize_document_colors
 from .tables import TableManager, preserve_table_structure, analyze_table_structure, validate_table_integrity
 from .macros import MacroManager, preserve_macro_parameters, analyze_document_macros, create_macro, validate_macro
@@ -61,7 +61,8 @@ __all__ = [
     "CONFLUENCE_COLORS", "EMPTY_ADF_DOCUMENT", "DEFAULT_PARAGRAPH", "ERROR_MESSAGES",
     
     # Functions
-    "get_page_with_full_formatting", "find_element_in_adf", "update_page_preserving_formatting",
+    "get_page_with_full_formatting", "get_pages_with_full_formatting",
+    "find_element_in_adf", "update_page_preserving_formatting", "update_pages_preserving_formatting",
     "preserve_color_formatting", "analyze_document_colors", "standardize_document_colors",
     "preserve_table_structure", "analyze_table_structure", "validate_table_integrity",
     "preserve_macro_parameters", "analyze_document_macros", "create_macro", "validate_macro"
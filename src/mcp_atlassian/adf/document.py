@@ -36,18 +36,23 @@ class ADFDocument:
     ADF documents while preserving all formatting information.
     """
     
-    def __init__(self, data: Optional[Dict[str, Any]] = None):
+    def __init__(self, data: Optional[Dict[str, Any]] = None, *, build_element_map: bool = True):
         """
         Initialize ADF document.
         
         Args:
             data: Raw ADF document data. If None, creates empty document.
+                The dict is kept by reference, not copied. The document never
+                mutates it; edits replace it with a fresh serialization.
+            build_element_map: Whether to build the element map right away.
+                When False the map is built on first use.
         """
         if data is None:
             data = copy.deepcopy(EMPTY_ADF_DOCUMENT)
         
-        # Validate and store raw data
-        self._raw_data = data
+        # Store raw data by reference (see the aliasing note above). Edits drop
+        # it, and it is re-serialized from the model on next use.
+        self._raw_data_cache: Optional[Dict[str, Any]] = data
         # Import here to avoid circular import
         from .validator import ADFValidator
         self._validator = ADFValidator()
@@ -62,7 +67,11 @@ class ADFDocument:
         
         # Create element map for fast lookup
         self._element_map: Dict[str, ElementPath] = {}
-        self._build_element_map()
+        self._element_map_stale = True
+        # Bumped on every change so callers can tell cached lookups are stale
+        self._mutation_version = 0
+        if build_element_map:
+            self._build_element_map()
     
     @classmethod
     def from_json(cls, json_str: str) -> 'ADFDocument':
@@ -74,9 +83,9 @@ class ADFDocument:
             raise ValueError(f"Invalid JSON: {e}")
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ADFDocument':
+    def from_dict(cls, data: Dict[str, Any], *, build_element_map: bool = True) -> 'ADFDocument':
         """Create ADF document from dictionary."""
-        return cls(data)
+        return cls(data, build_element_map=build_element_map)
     
     @classmethod
     def empty(cls) -> 'ADFDocument':
@@ -103,6 +112,17 @@ class ADFDocument:
         """Get raw ADF data."""
         return dict(self._raw_data)
     
+    @property
+    def _raw_data(self) -> Dict[str, Any]:
+        """Raw ADF data, serialized from the model again if it was edited."""
+        if self._raw_data_cache is None:
+            self._raw_data_cache = self.to_dict()
+        return self._raw_data_cache
+    
+    @_raw_data.setter
+    def _raw_data(self, data: Dict[str, Any]) -> None:
+        self._raw_data_cache = data
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
         result = self._model.model_dump(exclude_none=True, exclude_unset=True)
@@ -132,26 +152,49 @@ class ADFDocument:
         """Build map of elements for fast navigation."""
         self._element_map.clear()
         self._build_element_map_recursive(self._model.content, [])
+        self._element_map_stale = False
     
-    def _build_element_map_recursive(self, content: List[Any], path: List[int]) -> None:
-        """Recursively build element map."""
-        for i, node in enumerate(content):
-            current_path = path + [i]
+    def _ensure_element_map(self) -> Dict[str, ElementPath]:
+        """Get the element map, building it first if it is missing or stale."""
+        if self._element_map_stale:
+            self._build_element_map()
+        return self._element_map
+    
+    def _mark_modified(self) -> None:
+        """Record an edit: bump the mutation version and drop derived data."""
+        self._element_map_stale = True
+        self._raw_data_cache = None
+        self._mutation_version += 1
+    
+    def _build_element_map_recursive(
+        self,
+        content: List[Any],
+        path: List[int],
+        element_map: Optional[Dict[str, ElementPath]] = None,
+        start: int = 0
+    ) -> None:
+        """Recursively build element map, into element_map if one is given."""
+        if element_map is None:
+            element_map = self._element_map
+        for i, node in enumerate(content, start):
+            # The path is extended in place and copied only when stored
+            path.append(i)
             
             # Create unique key for this element
-            element_key = f"path_{'.'.join(map(str, current_path))}"
+            element_key = f"path_{'.'.join(map(str, path))}"
             
             # Store element path info
             element_info = ElementPath(
-                path=current_path,
+                path=list(path),
                 type=getattr(node, 'type', 'unknown'),
                 text_content=getattr(node, 'text', None)
             )
-            self._element_map[element_key] = element_info
+            element_map[element_key] = element_info
             
             # Recurse into child content
             if hasattr(node, 'content') and node.content:
-                self._build_element_map_recursive(node.content, current_path)
+                self._build_element_map_recursive(node.content, path, element_map)
+            path.pop()
     
     def find_elements(self, criteria: SearchCriteria) -> List[SearchResult]:
         """
@@ -290,11 +333,8 @@ class ADFDocument:
                 if 0 <= target_index < len(current_content):
                     del current_content[target_index]
             
-            # Rebuild element map after changes
-            self._build_element_map()
-            
-            # Update raw data
-            self._raw_data = self.to_dict()
+            # Element map and raw data are rebuilt lazily after changes
+            self._mark_modified()
             
             return True
             
@@ -329,8 +369,7 @@ class ADFDocument:
         if not self._model.content:
             # If document is empty, just add the paragraph
             self._model.content.append(ADFNodeModel.model_validate(paragraph))
-            self._build_element_map()
-            self._raw_data = self.to_dict()
+            self._mark_modified()
             return True
         
         return self.update_element(update)
@@ -376,11 +415,13 @@ class ADFDocument:
         """Clear all content from document."""
         self._model.content.clear()
         self._element_map.clear()
+        self._element_map_stale = False
+        self._mutation_version += 1
         self._raw_data = copy.deepcopy(EMPTY_ADF_DOCUMENT)
     
     def __str__(self) -> str:
         """String representation."""
-        return f"ADFDocument(version={self.version}, elements={len(self._element_map)})"
+        return f"ADFDocument(version={self.version}, elements={len(self._ensure_element_map())})"
     
     def __repr__(self) -> str:
         """Detailed representation."""
@@ -427,9 +468,8 @@ class ADFDocument:
             else:
                 parent[element_index] = new_element
             
-            # Update raw data and element map
-            self._raw_data = self.to_dict()
-            self._build_element_map()
+            # Raw data and the element map are rebuilt lazily
+            self._mark_modified()
             return True
         except (IndexError, TypeError):
             return False
@@ -451,9 +491,8 @@ class ADFDocument:
                 
             parent.insert(insert_index, element_to_insert)
             
-            # Update raw data and element map
-            self._raw_data = self.to_dict()
-            self._build_element_map()
+            # Raw data and the element map are rebuilt lazily
+            self._mark_modified()
             return True
         except (IndexError, TypeError):
             return False
@@ -471,9 +510,8 @@ class ADFDocument:
             
             parent.pop(element_index)
             
-            # Update raw data and element map
-            self._raw_data = self.to_dict()
-            self._build_element_map()
+            # Raw data and the element map are rebuilt lazily
+            self._mark_modified()
             return True
         except (IndexError, TypeError):
             return False
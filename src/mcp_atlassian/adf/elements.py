@@ -5,7 +5,7 @@ This module provides specialized classes for different ADF node types,
 making it easier to work with specific elements while maintaining type safety.
 """
 
-from typing import Any, Dict, List, Optional, Union, Literal
+from typing import Annotated, Any, Dict, List, Optional, Union, Literal
 from pydantic import Field, field_validator
 
 from .types import BaseADFModel, ADFNodeModel, ADFMarkModel
@@ -60,7 +60,7 @@ class TextElement(BaseADFModel):
 class ParagraphElement(ADFNodeModel):
     """Paragraph element."""
     type: Literal["paragraph"] = "paragraph"
-    content: List[Union[TextElement, 'InlineElement']] = Field(default_factory=list)
+    content: List[Annotated[Union[TextElement, 'InlineElement'], Field(discriminator="type")]] = Field(default_factory=list)
     
     def add_text(self, text: str, marks: Optional[List[ADFMarkModel]] = None) -> TextElement:
         """Add text to paragraph."""
@@ -81,7 +81,7 @@ class HeadingElement(ADFNodeModel):
     """Heading element."""
     type: Literal["heading"] = "heading"
     attrs: Dict[str, int] = Field(default_factory=lambda: {"level": 1})
-    content: List[Union[TextElement, 'InlineElement']] = Field(default_factory=list)
+    content: List[Annotated[Union[TextElement, 'InlineElement'], Field(discriminator="type")]] = Field(default_factory=list)
     
     @field_validator('attrs')
     @classmethod
@@ -162,7 +162,7 @@ class TableElement(ADFNodeModel):
 class TableRowElement(ADFNodeModel):
     """Table row element."""
     type: Literal["tableRow"] = "tableRow"
-    content: List[Union['TableCellElement', 'TableHeaderElement']] = Field(default_factory=list)
+    content: List[Annotated[Union['TableCellElement', 'TableHeaderElement'], Field(discriminator="type")]] = Field(default_factory=list)
     
     def add_cell(self, is_header: bool = False) -> Union['TableCellElement', 'TableHeaderElement']:
         """Add cell to row."""
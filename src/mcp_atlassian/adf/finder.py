@@ -25,6 +25,9 @@ class ADFFinder:
     text-based search, attribute matching, and recursive element discovery.
     """
     
+    # Criteria that test a single node; several of them are combined with AND
+    _NODE_CRITERIA_KEYS = ("text", "node_type", "attributes", "marks")
+    
     def __init__(self, adf_document: Optional[ADFDocument] = None):
         """
         Initialize ADF finder.
@@ -91,6 +94,10 @@ class ADFFinder:
         if criteria.get("json_path"):
             results.extend(self._search_by_json_path(criteria["json_path"], target_document))
         
+        # Combined node criteria: every requested check must match
+        elif sum(1 for key in self._NODE_CRITERIA_KEYS if criteria.get(key)) > 1:
+            self._search_with_predicate(target_document.content, [], self._compile_criteria(criteria), results)
+        
         # Text content search
         elif criteria.get("text"):
             results.extend(self._search_by_text_content(criteria["text"], target_document))
@@ -111,9 +118,9 @@ class ADFFinder:
         elif criteria.get("index") is not None:
             results.extend(self._search_by_index(criteria["index"], target_document))
         
-        # General recursive search for complex criteria
+        # No node criteria: every element matches
         else:
-            results.extend(self._search_recursive(criteria, target_document.content, []))
+            self._search_with_predicate(target_document.content, [], self._compile_criteria(criteria), results)
         
         # Add context information if requested
         if include_context:
@@ -402,49 +409,6 @@ class ADFFinder:
         find_by_index_recursive(document.content, [], 1)
         return results
     
-    def _search_recursive(
-        self,
-        criteria: SearchCriteria,
-        nodes: List[Any],
-        path: List[int]
-    ) -> List[SearchResult]:
-        """
-        Perform recursive search with complex criteria.
-        
-        Args:
-            criteria: Search criteria
-            nodes: Current nodes to search
-            path: Current path in document
-            
-        Returns:
-            List of matching elements
-        """
-        results = []
-        
-        for i, node in enumerate(nodes):
-            current_path = path + [i]
-            
-            # Check if node matches all criteria
-            if self._node_matches_complex_criteria(node, criteria):
-                result = SearchResult(
-                    node=node.model_dump() if hasattr(node, 'model_dump') else node,  # type: ignore
-                    path=ElementPath(
-                        path=current_path,
-                        type=getattr(node, 'type', 'unknown'),
-                        text_content=getattr(node, 'text', None)
-                    ),
-                    parent=None,  # Will be filled by add_context_to_results
-                    index=i
-                )
-                results.append(result)
-            
-            # Recurse into child content
-            child_content = getattr(node, 'content', None) or (node.get('content') if isinstance(node, dict) else None)
-            if child_content:
-                results.extend(self._search_recursive(criteria, child_content, current_path))
-        
-        return results
-    
     def _search_with_predicate(
         self,
         nodes: List[Any],
@@ -521,50 +485,71 @@ class ADFFinder:
             if child_content:
                 self._search_text_recursive(child_content, current_path, text_predicate, results)
     
-    def _node_matches_complex_criteria(self, node: Any, criteria: SearchCriteria) -> bool:
+    def _compile_criteria(self, criteria: SearchCriteria) -> Callable[[Any], bool]:
         """
-        Check if node matches complex search criteria.
+        Compile complex search criteria into a node predicate.
+        
+        The criteria are read once here, so the predicate only runs the
+        checks that were actually requested.
         
         Args:
-            node: Node to test
             criteria: Search criteria
             
         Returns:
-            True if node matches all criteria
+            Function returning True if a node matches all criteria
         """
+        checks: List[Callable[[Any], bool]] = []
+        
         # Text content check
         if criteria.get("text"):
-            node_text = getattr(node, 'text', None) or (node.get('text') if isinstance(node, dict) else None)
-            if not node_text or criteria["text"].lower() not in node_text.lower():
-                return False
+            search_text = criteria["text"].lower()
+            
+            def text_matches(node: Any) -> bool:
+                node_text = getattr(node, 'text', None) or (node.get('text') if isinstance(node, dict) else None)
+                return bool(node_text) and search_text in node_text.lower()
+            
+            checks.append(text_matches)
         
         # Node type check
         if criteria.get("node_type"):
-            node_type = getattr(node, 'type', None) or (node.get('type') if isinstance(node, dict) else None)
-            if node_type != criteria["node_type"]:
-                return False
+            required_type = criteria["node_type"]
+            
+            def type_matches(node: Any) -> bool:
+                node_type = getattr(node, 'type', None) or (node.get('type') if isinstance(node, dict) else None)
+                return node_type == required_type
+            
+            checks.append(type_matches)
         
         # Attributes check
         if criteria.get("attributes"):
-            node_attrs = getattr(node, 'attrs', None) or (node.get('attrs') if isinstance(node, dict) else {})
-            for key, value in criteria["attributes"].items():
-                if node_attrs.get(key) != value:
-                    return False
+            required_attrs = list(criteria["attributes"].items())
+            
+            def attributes_match(node: Any) -> bool:
+                node_attrs = getattr(node, 'attrs', None) or (node.get('attrs') if isinstance(node, dict) else None)
+                return bool(node_attrs) and all(node_attrs.get(key) == value for key, value in required_attrs)
+            
+            checks.append(attributes_match)
         
         # Marks check
         if criteria.get("marks"):
-            node_marks = getattr(node, 'marks', None) or (node.get('marks') if isinstance(node, dict) else [])
-            mark_types = set()
-            for mark in node_marks:
-                mark_type = getattr(mark, 'type', None) or (mark.get('type') if isinstance(mark, dict) else None)
-                if mark_type:
-                    mark_types.add(mark_type)
+            required_marks = list(criteria["marks"])
             
-            for required_mark in criteria["marks"]:
-                if required_mark not in mark_types:
-                    return False
+            def marks_match(node: Any) -> bool:
+                node_marks = getattr(node, 'marks', None) or (node.get('marks') if isinstance(node, dict) else None) or []
+                mark_types = set()
+                for mark in node_marks:
+                    mark_type = getattr(mark, 'type', None) or (mark.get('type') if isinstance(mark, dict) else None)
+                    if mark_type:
+                        mark_types.add(mark_type)
+                return all(required_mark in mark_types for required_mark in required_marks)
+            
+            checks.append(marks_match)
         
-        return True
+        if not checks:
+            return lambda node: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda node: all(check(node) for check in checks)
     
     def _parse_simple_json_path(self, json_path: str) -> List[Union[str, int]]:
         """
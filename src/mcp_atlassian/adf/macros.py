@@ -12,7 +12,8 @@ macro structures in Atlassian Document Format, including:
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
+import sys
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union, Callable
 from dataclasses import dataclass
 from enum import Enum
 
@@ -23,6 +24,16 @@ from .elements import ExtensionElement, BodiedExtensionElement
 
 logger = logging.getLogger("mcp-atlassian.adf.macros")
 
+# Parameter formats whose conversion currently leaves parameters unchanged
+_IDENTITY_CONVERSIONS = frozenset({"v2", "legacy"})
+
+# Node types that represent macros
+_EXT_NODE_TYPES = frozenset({
+    sys.intern("extension"),
+    sys.intern("bodiedExtension"),
+    sys.intern("inlineExtension"),
+})
+
 
 class MacroType(Enum):
     """Common Confluence macro types."""
@@ -60,15 +71,15 @@ class MacroType(Enum):
     PAGE_TREE = "pagetree"
     
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MacroInfo:
     """Information about a macro."""
     name: str
     extension_type: str
     extension_key: str
     is_bodied: bool
-    required_parameters: List[str]
-    optional_parameters: List[str]
+    required_parameters: FrozenSet[str]
+    optional_parameters: FrozenSet[str]
     deprecated: bool = False
     replacement: Optional[str] = None
     
@@ -102,64 +113,64 @@ class MacroManager:
             extension_type="com.atlassian.confluence.macro.core",
             extension_key="toc",
             is_bodied=False,
-            required_parameters=[],
-            optional_parameters=["outline", "style", "maxLevel", "minLevel", "include", "exclude"]
+            required_parameters=frozenset(),
+            optional_parameters=frozenset({"outline", "style", "maxLevel", "minLevel", "include", "exclude"})
         ),
         "code": MacroInfo(
             name="Code Block",
             extension_type="com.atlassian.confluence.macro.core",
             extension_key="code",
             is_bodied=True,
-            required_parameters=[],
-            optional_parameters=["language", "title", "theme", "linenumbers", "collapse"]
+            required_parameters=frozenset(),
+            optional_parameters=frozenset({"language", "title", "theme", "linenumbers", "collapse"})
         ),
         "expand": MacroInfo(
             name="Expand",
             extension_type="com.atlassian.confluence.macro.core",
             extension_key="expand",
             is_bodied=True,
-            required_parameters=[],
-            optional_parameters=["title"]
+            required_parameters=frozenset(),
+            optional_parameters=frozenset({"title"})
         ),
         "include": MacroInfo(
             name="Include Page",
             extension_type="com.atlassian.confluence.macro.core",
             extension_key="include",
             is_bodied=False,
-            required_parameters=["page"],
-            optional_parameters=["space"]
+            required_parameters=frozenset({"page"}),
+            optional_parameters=frozenset({"space"})
         ),
         "excerpt": MacroInfo(
             name="Excerpt",
             extension_type="com.atlassian.confluence.macro.core",
             extension_key="excerpt",
             is_bodied=True,
-            required_parameters=[],
-            optional_parameters=["atlassian-macro-output-type"]
+            required_parameters=frozenset(),
+            optional_parameters=frozenset({"atlassian-macro-output-type"})
         ),
         "jira": MacroInfo(
             name="Jira Issues",
             extension_type="com.atlassian.jira.integration",
             extension_key="jira",
             is_bodied=False,
-            required_parameters=[],
-            optional_parameters=["server", "jqlQuery", "serverId", "key", "columns", "count"]
+            required_parameters=frozenset(),
+            optional_parameters=frozenset({"server", "jqlQuery", "serverId", "key", "columns", "count"})
         ),
         "status": MacroInfo(
             name="Status",
             extension_type="com.atlassian.confluence.macro.core", 
             extension_key="status",
             is_bodied=False,
-            required_parameters=[],
-            optional_parameters=["colour", "title", "subtle"]
+            required_parameters=frozenset(),
+            optional_parameters=frozenset({"colour", "title", "subtle"})
         ),
         "chart": MacroInfo(
             name="Chart",
             extension_type="com.atlassian.confluence.extra.chart",
             extension_key="chart",
             is_bodied=True,
-            required_parameters=["type"],
-            optional_parameters=["title", "width", "height", "colors", "dataOrientation"]
+            required_parameters=frozenset({"type"}),
+            optional_parameters=frozenset({"title", "width", "height", "colors", "dataOrientation"})
         )
     }
     
@@ -239,12 +250,18 @@ class MacroManager:
         logger.debug(f"Applied {len(params_to_preserve)} parameters to target macro")
         return target_macro
         
-    def analyze_document_macros(self, document: Optional[ADFDocument] = None) -> MacroAnalysis:
+    def analyze_document_macros(
+        self,
+        document: Optional[ADFDocument] = None,
+        *,
+        validate: bool = False
+    ) -> MacroAnalysis:
         """
         Analyze all macros in the document.
         
         Args:
             document: Document to analyze (uses instance document if not provided)
+            validate: Whether to validate each macro and report invalid ones
             
         Returns:
             Comprehensive macro analysis
@@ -263,8 +280,9 @@ class MacroManager:
             "parameter_usage": {}
         }
         
-        # Find all macros in document
-        self._find_macros_recursive(target_document.content, [], analysis_data)
+        # Find all macros in document. Parsed content holds generic node models
+        # without the extension accessors, so the raw dicts are walked instead.
+        self._find_macros_recursive(target_document._raw_data.get("content", []), [], analysis_data, validate)
         
         # Calculate statistics
         total_macros = len(analysis_data["macros"])
@@ -378,17 +396,17 @@ class MacroManager:
         """
         logger.debug(f"Converting macro parameters to format: {target_format}")
         
+        if target_format in _IDENTITY_CONVERSIONS:
+            logger.debug("No-op parameter conversion")
+            return macro
+        
         current_params = macro.attrs.get("parameters", {})
         if not current_params:
             logger.debug("No parameters to convert")
             return macro
         
         # Convert parameters based on target format
-        if target_format == "v2":
-            converted_params = self._convert_to_v2_format(current_params, macro.extension_key)
-        elif target_format == "legacy":
-            converted_params = self._convert_to_legacy_format(current_params, macro.extension_key)
-        elif target_format == "normalized":
+        if target_format == "normalized":
             converted_params = self._normalize_parameters(current_params, macro.extension_key)
         else:
             logger.warning(f"Unknown parameter format: {target_format}")
@@ -567,17 +585,20 @@ class MacroManager:
         self,
         nodes: List[Any],
         path: List[int],
-        analysis_data: Dict[str, Any]
+        analysis_data: Dict[str, Any],
+        validate: bool = False
     ) -> None:
         """Recursively find macros for analysis."""
+        # Siblings are either all raw dicts or all parsed models
+        is_dict = bool(nodes) and type(nodes[0]) is dict
         for i, node in enumerate(nodes):
             current_path = path + [i]
             
-            node_type = getattr(node, 'type', None) or (node.get('type') if isinstance(node, dict) else None)
+            node_type = node.get('type') if is_dict else getattr(node, 'type', None)
             
-            if node_type in ("extension", "bodiedExtension", "inlineExtension"):
+            if node_type in _EXT_NODE_TYPES:
                 # Convert to element if needed
-                if isinstance(node, dict):
+                if is_dict:
                     if node_type == "bodiedExtension":
                         macro = BodiedExtensionElement.model_validate(node)
                     else:
@@ -596,20 +617,21 @@ class MacroManager:
                 for param_name in parameters:
                     analysis_data["parameter_usage"][param_name] = analysis_data["parameter_usage"].get(param_name, 0) + 1
                 
-                # Validate macro
-                validation = self.validate_macro(macro)
-                if not validation["is_valid"]:
-                    element_path = ElementPath(
-                        path=current_path,
-                        type=node_type,
-                        text_content=None
-                    )
-                    analysis_data["invalid_macros"].append((element_path, f"Validation failed: {len(validation['errors'])} errors"))
+                # Validate macro (only when requested, it is the costly part)
+                if validate:
+                    validation = self.validate_macro(macro)
+                    if not validation["is_valid"]:
+                        element_path = ElementPath(
+                            path=current_path,
+                            type=node_type,
+                            text_content=None
+                        )
+                        analysis_data["invalid_macros"].append((element_path, f"Validation failed: {len(validation['errors'])} errors"))
             
             # Recurse into child content
-            child_content = getattr(node, 'content', None) or (node.get('content') if isinstance(node, dict) else None)
+            child_content = node.get('content') if is_dict else getattr(node, 'content', None)
             if child_content:
-                self._find_macros_recursive(child_content, current_path, analysis_data)
+                self._find_macros_recursive(child_content, current_path, analysis_data, validate)
     
     def _find_macros_for_search_recursive(
         self,
@@ -620,14 +642,16 @@ class MacroManager:
         extension_key: Optional[str]
     ) -> None:
         """Recursively find macros for search."""
+        # Siblings are either all raw dicts or all parsed models
+        is_dict = bool(nodes) and type(nodes[0]) is dict
         for i, node in enumerate(nodes):
             current_path = path + [i]
             
-            node_type = getattr(node, 'type', None) or (node.get('type') if isinstance(node, dict) else None)
+            node_type = node.get('type') if is_dict else getattr(node, 'type', None)
             
-            if node_type in ("extension", "bodiedExtension", "inlineExtension"):
+            if node_type in _EXT_NODE_TYPES:
                 # Convert to element if needed
-                if isinstance(node, dict):
+                if is_dict:
                     if node_type == "bodiedExtension":
                         macro = BodiedExtensionElement.model_validate(node)
                     else:
@@ -649,7 +673,7 @@ class MacroManager:
                 results.append((element_path, macro))
             
             # Recurse into child content  
-            child_content = getattr(node, 'content', None) or (node.get('content') if isinstance(node, dict) else None)
+            child_content = node.get('content') if is_dict else getattr(node, 'content', None)
             if child_content:
                 self._find_macros_for_search_recursive(child_content, current_path, results, macro_type, extension_key)
     
@@ -679,16 +703,6 @@ class MacroManager:
         }
         return defaults.get(macro_type, {})
     
-    def _convert_to_v2_format(self, params: Dict[str, Any], extension_key: Optional[str]) -> Dict[str, Any]:
-        """Convert parameters to v2 format."""
-        # This is a placeholder - real implementation would have specific conversion logic
-        return params.copy()
-    
-    def _convert_to_legacy_format(self, params: Dict[str, Any], extension_key: Optional[str]) -> Dict[str, Any]:
-        """Convert parameters to legacy format."""
-        # This is a placeholder - real implementation would have specific conversion logic
-        return params.copy()
-    
     def _normalize_parameters(self, params: Dict[str, Any], extension_key: Optional[str]) -> Dict[str, Any]:
         """Normalize parameter values."""
         normalized = {}
@@ -735,19 +749,21 @@ class MacroManager:
     
     def _migrate_macros_recursive(self, nodes: List[Any], migration_notes: List[str]) -> None:
         """Recursively migrate deprecated macros."""
+        # Siblings are either all raw dicts or all parsed models
+        is_dict = bool(nodes) and type(nodes[0]) is dict
         for node in nodes:
-            node_type = getattr(node, 'type', None) or (node.get('type') if isinstance(node, dict) else None)
+            node_type = node.get('type') if is_dict else getattr(node, 'type', None)
             
-            if node_type in ("extension", "bodiedExtension", "inlineExtension"):
-                extension_key = getattr(node, 'extension_key', None) or (
-                    node.get('attrs', {}).get('extensionKey') if isinstance(node, dict) else None
+            if node_type in _EXT_NODE_TYPES:
+                extension_key = (
+                    node.get('attrs', {}).get('extensionKey') if is_dict else getattr(node, 'extension_key', None)
                 )
                 
                 if extension_key and extension_key in self.KNOWN_MACROS:
                     macro_info = self.KNOWN_MACROS[extension_key]
                     if macro_info.deprecated and macro_info.replacement:
                         # Migrate to replacement
-                        if isinstance(node, dict):
+                        if is_dict:
                             if 'attrs' not in node:
                                 node['attrs'] = {}
                             node['attrs']['extensionKey'] = macro_info.replacement
@@ -759,12 +775,16 @@ class MacroManager:
                         migration_notes.append(f"Migrated '{extension_key}' to '{macro_info.replacement}'")
             
             # Recurse into child content
-            child_content = getattr(node, 'content', None) or (node.get('content') if isinstance(node, dict) else None)
+            child_content = node.get('content') if is_dict else getattr(node, 'content', None)
             if child_content:
                 self._migrate_macros_recursive(child_content, migration_notes)
 
 
-# Convenience functions for direct usage
+# Convenience functions for direct usage. They share one manager, which holds
+# no per-call state; documents are passed to it explicitly.
+_DEFAULT_MANAGER = MacroManager()
+
+
 def preserve_macro_parameters(
     source_macro: Union[ExtensionElement, BodiedExtensionElement],
     target_macro: Union[ExtensionElement, BodiedExtensionElement],
@@ -779,8 +799,7 @@ def preserve_macro_parameters(
     
     This implements the preserveMacros function from the technical specification.
     """
-    manager = MacroManager()
-    return manager.preserve_macro_parameters(
+    return _DEFAULT_MANAGER.preserve_macro_parameters(
         source_macro,
         target_macro,
         preserve_all_parameters=preserve_all_parameters,
@@ -790,12 +809,11 @@ def preserve_macro_parameters(
     )
 
 
-def analyze_document_macros(document: ADFDocument) -> MacroAnalysis:
+def analyze_document_macros(document: ADFDocument, *, validate: bool = False) -> MacroAnalysis:
     """
     Convenience function to analyze document macros.
     """
-    manager = MacroManager(document)
-    return manager.analyze_document_macros()
+    return _DEFAULT_MANAGER.analyze_document_macros(document, validate=validate)
 
 
 def create_macro(
@@ -806,8 +824,7 @@ def create_macro(
     """
     Convenience function to create a macro.
     """
-    manager = MacroManager()
-    return manager.create_macro(macro_type, parameters, content)
+    return _DEFAULT_MANAGER.create_macro(macro_type, parameters, content)
 
 
 def validate_macro(
@@ -816,5 +833,4 @@ def validate_macro(
     """
     Convenience function to validate a macro.
     """
-    manager = MacroManager()
-    return manager.validate_macro(macro)
+    return _DEFAULT_MANAGER.validate_macro(macro)
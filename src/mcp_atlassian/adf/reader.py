@@ -5,15 +5,70 @@ This module provides the getPageWithFullFormatting functionality for obtaining
 Confluence page content in ADF format while preserving all formatting elements.
 """
 
+import copy
+import json
 import logging
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from .document import ADFDocument
 from .types import ADFNode, ElementPath, ValidationResult
+from .validator import ADFValidator
 from .constants import NODE_TYPES, MARK_TYPES, PANEL_TYPES
 
 logger = logging.getLogger("mcp-atlassian.adf.reader")
 
+# Maximum number of page versions kept in the analysis cache
+ANALYSIS_CACHE_SIZE = 128
+
+# Default number of page requests kept in flight by batch retrieval
+MAX_CONCURRENT_PAGE_FETCHES = 8
+
+
+@dataclass(slots=True)
+class AnalysisAccumulator:
+    """Running totals collected while walking a document for formatting analysis."""
+    # Colors are appended per mark and deduplicated once in to_dict()
+    text_colors: List[str] = field(default_factory=list)
+    background_colors: List[str] = field(default_factory=list)
+    tables: List[Dict[str, Any]] = field(default_factory=list)
+    macros: List[Dict[str, Any]] = field(default_factory=list)
+    panels: List[Dict[str, Any]] = field(default_factory=list)
+    formatting_marks: Dict[str, int] = field(default_factory=dict)
+    total_elements: int = 0
+    formatted_text_nodes: int = 0
+    complex_elements: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the totals into the formatting analysis result dictionary."""
+        # Unique colors in order of first use
+        text_colors = list(dict.fromkeys(self.text_colors))
+        background_colors = list(dict.fromkeys(self.background_colors))
+        return {
+            "colors": {
+                "text_colors": text_colors,
+                "background_colors": background_colors
+            },
+            "tables": self.tables,
+            "macros": self.macros,
+            "panels": self.panels,
+            "formatting_marks": self.formatting_marks,
+            "statistics": {
+                "total_elements": self.total_elements,
+                "formatted_text_nodes": self.formatted_text_nodes,
+                "complex_elements": self.complex_elements,
+                "unique_text_colors": len(text_colors),
+                "unique_background_colors": len(background_colors),
+                "total_tables": len(self.tables),
+                "total_macros": len(self.macros),
+                "total_panels": len(self.panels)
+            }
+        }
+
 
 class ADFReader:
     """
@@ -31,7 +86,9 @@ class ADFReader:
             confluence_client: Optional Confluence client instance
         """
         self.confluence_client = confluence_client
-        self.formatting_analysis_cache: Dict[str, Dict[str, Any]] = {}
+        self.formatting_analysis_cache: OrderedDict[Tuple[str, Any], Dict[str, Any]] = OrderedDict()
+        # One validator is reused for every page this reader validates
+        self.validator = ADFValidator()
     
     def get_page_with_full_formatting(
         self, 
@@ -77,49 +134,174 @@ class ADFReader:
             # Step 1: Retrieve page data in ADF format
             page_data = self.confluence_client.get_page_adf(page_id)
             
-            # Step 2: Parse ADF content into structured document
-            adf_document = self._parse_adf_content(page_data)
-            
-            # Step 3: Analyze formatting elements if requested
-            formatting_metadata = {}
-            if analyze_formatting:
-                formatting_metadata = self._analyze_formatting_elements(adf_document)
-            
-            # Step 4: Create element map if requested
-            element_map = {}
-            if create_element_map:
-                element_map = self._create_element_map(adf_document)
-            
-            # Step 5: Validate structure if requested
-            validation_result = None
-            if validate_structure:
-                validation_result = self._validate_adf_structure(adf_document)
-            
-            # Step 6: Extract page metadata
-            page_metadata = self._extract_page_metadata(page_data)
-            
-            result = {
-                "adf_document": adf_document,
-                "formatting_metadata": formatting_metadata,
-                "element_map": element_map,
-                "validation_result": validation_result,
-                "page_metadata": page_metadata,
-                "retrieval_timestamp": self._get_current_timestamp(),
-                "format_type": "adf"
-            }
-            
-            logger.info(
-                f"Successfully retrieved page {page_id}: "
-                f"{len(element_map)} elements, "
-                f"validation {'passed' if validation_result and validation_result.get('is_valid') else 'failed'}"
+            return self._build_page_result(
+                page_id,
+                page_data,
+                analyze_formatting=analyze_formatting,
+                create_element_map=create_element_map,
+                validate_structure=validate_structure
             )
             
-            return result
-            
         except Exception as e:
             logger.error(f"Failed to retrieve page {page_id} with ADF formatting: {e}")
             raise RuntimeError(f"Page retrieval failed: {e}") from e
     
+    def get_pages_with_full_formatting(
+        self,
+        page_ids: List[str],
+        *,
+        analyze_formatting: bool = True,
+        create_element_map: bool = True,
+        validate_structure: bool = True,
+        max_concurrent_fetches: int = MAX_CONCURRENT_PAGE_FETCHES
+    ) -> List[Dict[str, Any]]:
+        """
+        Get several Confluence pages in ADF format with full formatting preservation.
+        
+        Page fetches run concurrently on a bounded thread pool while pages that
+        have already arrived are parsed and analyzed, so network latency
+        overlaps with analysis.
+        
+        Args:
+            page_ids: IDs of the Confluence pages to retrieve
+            analyze_formatting: Whether to analyze and catalog formatting elements
+            create_element_map: Whether to create element map for navigation
+            validate_structure: Whether to validate ADF structure
+            max_concurrent_fetches: Maximum number of page requests in flight
+            
+        Returns:
+            List of results in the same order as page_ids, each shaped like
+            the result of get_page_with_full_formatting
+            
+        Raises:
+            ValueError: If any page_id is invalid or client not configured
+            RuntimeError: If retrieval of any page fails
+        """
+        if not page_ids or not all(page_id and isinstance(page_id, str) for page_id in page_ids):
+            raise ValueError("Valid page_ids are required")
+        
+        if not self.confluence_client:
+            raise ValueError("Confluence client is required for page retrieval")
+        
+        if max_concurrent_fetches < 1:
+            raise ValueError("max_concurrent_fetches must be at least 1")
+        
+        logger.info(f"Retrieving {len(page_ids)} pages with full ADF formatting")
+        
+        results = []
+        workers = min(max_concurrent_fetches, len(page_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.confluence_client.get_page_adf, page_id)
+                for page_id in page_ids
+            ]
+            try:
+                # Analysis stays on this thread, so the cache is never shared
+                for page_id, future in zip(page_ids, futures):
+                    try:
+                        results.append(self._build_page_result(
+                            page_id,
+                            future.result(),
+                            analyze_formatting=analyze_formatting,
+                            create_element_map=create_element_map,
+                            validate_structure=validate_structure
+                        ))
+                    except Exception as e:
+                        logger.error(f"Failed to retrieve page {page_id} with ADF formatting: {e}")
+                        raise RuntimeError(f"Page retrieval failed for {page_id}: {e}") from e
+            finally:
+                for future in futures:
+                    future.cancel()
+        
+        return results
+    
+    def _build_page_result(
+        self,
+        page_id: str,
+        page_data: Dict[str, Any],
+        *,
+        analyze_formatting: bool,
+        create_element_map: bool,
+        validate_structure: bool
+    ) -> Dict[str, Any]:
+        """
+        Parse and analyze raw page data that has already been retrieved.
+        
+        Args:
+            page_id: ID of the retrieved page
+            page_data: Raw page data from API
+            analyze_formatting: Whether to analyze and catalog formatting elements
+            create_element_map: Whether to create element map for navigation
+            validate_structure: Whether to validate ADF structure
+            
+        Returns:
+            Page result as described in get_page_with_full_formatting
+        """
+        # Step 2: Parse ADF content into structured document
+        adf_document = self._parse_adf_content(page_data)
+        
+        # Results for an unchanged page version are reused from the analysis
+        # cache. Callers get copies, so the cached results are never mutated.
+        cache_entry = self._get_cache_entry(page_id, page_data)
+        
+        # Step 3: Analyze formatting elements if requested. The same pass
+        # fills the element map so the document is only walked once.
+        formatting_metadata = {}
+        element_map = {}
+        if analyze_formatting:
+            if "formatting_metadata" not in cache_entry:
+                cached_map: Dict[str, ElementPath] = {}
+                cache_entry["formatting_metadata"] = self._analyze_formatting_elements(
+                    adf_document, element_map=cached_map
+                )
+                cache_entry["element_map"] = cached_map
+            formatting_metadata = copy.deepcopy(cache_entry["formatting_metadata"])
+        
+        # Step 4: Create element map if requested (a separate walk only if
+        # no analysis pass has produced it)
+        if create_element_map:
+            if "element_map" not in cache_entry:
+                cache_entry["element_map"] = dict(self._create_element_map(adf_document))
+            # Only the path lists are mutable; a deepcopy of the map costs ten times more
+            adf_document._element_map.update(
+                (key, ElementPath(
+                    path=list(element_path["path"]),
+                    type=element_path["type"],
+                    text_content=element_path["text_content"]
+                ))
+                for key, element_path in cache_entry["element_map"].items()
+            )
+            adf_document._element_map_stale = False
+            element_map = adf_document._element_map
+        
+        # Step 5: Validate structure if requested
+        validation_result = None
+        if validate_structure:
+            if "validation_result" not in cache_entry:
+                cache_entry["validation_result"] = self._validate_adf_structure(adf_document)
+            validation_result = copy.deepcopy(cache_entry["validation_result"])
+        
+        # Step 6: Extract page metadata
+        page_metadata = self._extract_page_metadata(page_data)
+        
+        result = {
+            "adf_document": adf_document,
+            "formatting_metadata": formatting_metadata,
+            "element_map": element_map,
+            "validation_result": validation_result,
+            "page_metadata": page_metadata,
+            "retrieval_timestamp": self._get_current_timestamp(),
+            "format_type": "adf"
+        }
+        
+        logger.info(
+            f"Successfully retrieved page {page_id}: "
+            f"{len(element_map)} elements, "
+            f"validation {'passed' if validation_result and validation_result.get('is_valid') else 'failed'}"
+        )
+        
+        return result
+    
     def _parse_adf_content(self, page_data: Dict[str, Any]) -> ADFDocument:
         """
         Parse raw page data into structured ADF document.
@@ -139,6 +321,9 @@ class ADFReader:
                 if isinstance(body, dict):
                     if "atlas_doc_format" in body:
                         adf_content = body["atlas_doc_format"]
+                        # API v2 wraps the document as {"representation": ..., "value": ...}
+                        if isinstance(adf_content, dict) and "type" not in adf_content and "value" in adf_content:
+                            adf_content = adf_content["value"]
                     elif "representation" in body and body["representation"] == "atlas_doc_format":
                         adf_content = body.get("value", body)
                     elif "value" in body:
@@ -146,6 +331,10 @@ class ADFReader:
                 else:
                     adf_content = body
             
+            # API v2 delivers the document serialized as a JSON string
+            if isinstance(adf_content, (str, bytes)):
+                adf_content = json.loads(adf_content)
+            
             # If no ADF content found, try to extract from root
             if adf_content is None:
                 if "version" in page_data and "type" in page_data and "content" in page_data:
@@ -158,10 +347,11 @@ class ADFReader:
                         "content": []
                     }
             
-            # Parse into ADFDocument
-            adf_document = ADFDocument.from_dict(adf_content)
+            # Parse into ADFDocument; the element map is only built when requested.
+            # The page body dict is shared with the document rather than copied.
+            adf_document = ADFDocument.from_dict(adf_content, build_element_map=False)
             
-            logger.debug(f"Parsed ADF document: {adf_document}")
+            logger.debug(f"Parsed ADF document: {adf_document!r}")
             return adf_document
             
         except Exception as e:
@@ -169,12 +359,49 @@ class ADFReader:
             # Return minimal valid document
             return ADFDocument.empty()
     
-    def _analyze_formatting_elements(self, adf_document: ADFDocument) -> Dict[str, Any]:
+    def _get_cache_entry(self, page_id: str, page_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the analysis cache entry for a page version.
+        
+        Entries are keyed by page ID and version number, so each version of a
+        page is analyzed, mapped and validated at most once. The cache keeps
+        the most recently used entries up to ANALYSIS_CACHE_SIZE. Page data
+        without a version number gets a fresh entry that is not cached.
+        
+        Args:
+            page_id: ID of the retrieved page
+            page_data: Raw page data from API
+            
+        Returns:
+            Mutable cache entry dictionary for this page version
+        """
+        version = page_data.get("version")
+        version_number = version.get("number") if isinstance(version, dict) else None
+        if version_number is None:
+            return {}
+        key = (page_id, version_number)
+        
+        cache = self.formatting_analysis_cache
+        entry = cache.get(key)
+        if entry is None:
+            entry = cache[key] = {}
+            if len(cache) > ANALYSIS_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return entry
+    
+    def _analyze_formatting_elements(
+        self,
+        adf_document: ADFDocument,
+        element_map: Optional[Dict[str, ElementPath]] = None
+    ) -> Dict[str, Any]:
         """
         Analyze and catalog all formatting elements in the document.
         
         Args:
             adf_document: Parsed ADF document
+            element_map: Optional map to fill with element paths during the same pass
             
         Returns:
             Dictionary with formatting analysis:
@@ -187,153 +414,148 @@ class ADFReader:
         """
         logger.debug("Analyzing formatting elements in ADF document")
         
-        analysis: Dict[str, Any] = {
-            "colors": {
-                "text_colors": set(),
-                "background_colors": set()
-            },
-            "tables": [],
-            "macros": [],
-            "panels": [],
-            "formatting_marks": {},
-            "statistics": {
-                "total_elements": 0,
-                "formatted_text_nodes": 0,
-                "complex_elements": 0
-            }
-        }
-        
-        # Recursively analyze all nodes
-        self._analyze_node_recursive(adf_document.content, analysis, [])
-        
-        # Convert sets to lists for JSON serialization
-        text_colors = analysis["colors"]["text_colors"]
-        background_colors = analysis["colors"]["background_colors"]
-        analysis["colors"]["text_colors"] = list(text_colors) if isinstance(text_colors, set) else text_colors
-        analysis["colors"]["background_colors"] = list(background_colors) if isinstance(background_colors, set) else background_colors
+        analysis = AnalysisAccumulator()
         
-        # Calculate summary statistics
-        analysis["statistics"]["unique_text_colors"] = len(analysis["colors"]["text_colors"])
-        analysis["statistics"]["unique_background_colors"] = len(analysis["colors"]["background_colors"])
-        analysis["statistics"]["total_tables"] = len(analysis["tables"])
-        analysis["statistics"]["total_macros"] = len(analysis["macros"])
-        analysis["statistics"]["total_panels"] = len(analysis["panels"])
+        # Recursively analyze the raw dict tree. The model only has content
+        # when the raw data parsed cleanly, so an unparsable body is skipped.
+        content: List[Dict[str, Any]] = adf_document._raw_data["content"] if adf_document._model.content else []
+        self._analyze_node_recursive(content, analysis, [], element_map)
         
-        logger.debug(f"Formatting analysis complete: {analysis['statistics']}")
-        return analysis
+        result = analysis.to_dict()
+        logger.debug(f"Formatting analysis complete: {result['statistics']}")
+        return result
     
     def _analyze_node_recursive(
         self, 
-        nodes: List[Any], 
-        analysis: Dict[str, Any], 
-        path: List[int]
+        nodes: List[Dict[str, Any]], 
+        analysis: AnalysisAccumulator, 
+        path: List[int],
+        element_map: Optional[Dict[str, ElementPath]] = None
     ) -> None:
         """
-        Recursively analyze nodes for formatting elements.
+        Analyze raw ADF node dicts and all their descendants for formatting elements.
+        
+        Nodes are visited in document order using an explicit stack of sibling
+        iterators instead of Python recursion, so deep documents neither pay
+        per-level call overhead nor hit the recursion limit. The path list is
+        extended and restored in place, and only copied when a handler or the
+        element map has to keep it. Type-specific analysis is dispatched
+        through _NODE_HANDLERS.
         
         Args:
-            nodes: List of ADF nodes to analyze
-            analysis: Analysis dictionary to update
+            nodes: List of ADF node dicts to analyze
+            analysis: Analysis accumulator to update
             path: Current path in document
+            element_map: Optional map to fill with element paths
         """
-        for i, node in enumerate(nodes):
-            current_path = path + [i]
-            analysis["statistics"]["total_elements"] += 1
-            
-            node_type = getattr(node, 'type', None) or (node.get('type') if isinstance(node, dict) else None)
-            
-            if not node_type:
+        # Nodes are tallied in a local counter and added to the accumulator once
+        total_elements = 0
+        
+        # While a sibling list is being walked, path holds the indices of its ancestors
+        stack = [enumerate(nodes)]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                if stack:
+                    path.pop()
                 continue
             
-            # Analyze text nodes with marks
-            if node_type == "text":
-                self._analyze_text_node(node, analysis, current_path)
+            i, node = entry
+            path.append(i)
+            total_elements += 1
             
-            # Analyze tables
-            elif node_type == "table":
-                self._analyze_table_node(node, analysis, current_path)
+            node_type = node.get("type")
             
-            # Analyze panels
-            elif node_type == "panel":
-                self._analyze_panel_node(node, analysis, current_path)
+            if element_map is not None:
+                element_map[f"path_{'.'.join(map(str, path))}"] = ElementPath(
+                    path=list(path),
+                    type=node_type or "unknown",
+                    text_content=node.get("text")
+                )
             
-            # Analyze macros (extensions)
-            elif node_type in ("extension", "bodiedExtension", "inlineExtension"):
-                self._analyze_macro_node(node, analysis, current_path)
+            child_content = None
+            if node_type:
+                handler = self._NODE_HANDLERS.get(node_type)
+                if handler:
+                    handler(self, node, analysis, path)
+                
+                child_content = node.get("content")
             
-            # Recurse into child content
-            child_content = getattr(node, 'content', None) or (node.get('content') if isinstance(node, dict) else None)
+            # Descend into child content, keeping this node's index in the path
             if child_content:
-                self._analyze_node_recursive(child_content, analysis, current_path)
+                stack.append(enumerate(child_content))
+            else:
+                path.pop()
+        
+        analysis.total_elements += total_elements
     
-    def _analyze_text_node(self, node: Any, analysis: Dict[str, Any], path: List[int]) -> None:
+    def _analyze_text_node(self, node: Dict[str, Any], analysis: AnalysisAccumulator, path: List[int]) -> None:
         """Analyze text node for formatting marks."""
-        marks = getattr(node, 'marks', None) or (node.get('marks') if isinstance(node, dict) else [])
+        marks = node.get("marks")
         
         if marks:
-            analysis["statistics"]["formatted_text_nodes"] += 1
+            analysis.formatted_text_nodes += 1
+            formatting_marks = analysis.formatting_marks
             
             for mark in marks:
-                mark_type = getattr(mark, 'type', None) or (mark.get('type') if isinstance(mark, dict) else None)
+                mark_type = mark.get("type")
                 if not mark_type:
                     continue
                 
                 # Count formatting marks
-                analysis["formatting_marks"][mark_type] = analysis["formatting_marks"].get(mark_type, 0) + 1
+                formatting_marks[mark_type] = formatting_marks.get(mark_type, 0) + 1
                 
-                # Extract colors
-                mark_attrs = getattr(mark, 'attrs', None) or (mark.get('attrs') if isinstance(mark, dict) else {})
+                # Extract colors. Pages reuse a small palette, so interning lets
+                # repeated colors share one string object in the color lists.
+                mark_attrs = mark.get("attrs")
                 if mark_type == "textColor" and mark_attrs:
                     color = mark_attrs.get("color")
                     if color:
-                        analysis["colors"]["text_colors"].add(color)
+                        analysis.text_colors.append(
+                            sys.intern(color) if isinstance(color, str) else color
+                        )
                 elif mark_type == "backgroundColor" and mark_attrs:
                     color = mark_attrs.get("color")
                     if color:
-                        analysis["colors"]["background_colors"].add(color)
+                        analysis.background_colors.append(
+                            sys.intern(color) if isinstance(color, str) else color
+                        )
     
-    def _analyze_table_node(self, node: Any, analysis: Dict[str, Any], path: List[int]) -> None:
+    def _analyze_table_node(self, node: Dict[str, Any], analysis: AnalysisAccumulator, path: List[int]) -> None:
         """Analyze table node structure."""
-        analysis["statistics"]["complex_elements"] += 1
+        analysis.complex_elements += 1
         
-        content = getattr(node, 'content', None) or (node.get('content') if isinstance(node, dict) else [])
+        content = node.get("content")
         rows = len(content) if content else 0
         
-        # Count columns (assuming first row represents column count)
+        # Column count and header detection both come from the first row
         cols = 0
-        if content:
-            first_row = content[0]
-            first_row_content = getattr(first_row, 'content', None) or (first_row.get('content') if isinstance(first_row, dict) else [])
-            cols = len(first_row_content) if first_row_content else 0
+        has_header = False
+        first_row_content = (content[0].get("content") or []) if content else []
+        if first_row_content:
+            cols = len(first_row_content)
+            has_header = first_row_content[0].get("type") == "tableHeader"
         
         table_info = {
-            "path": path,
+            "path": list(path),
             "rows": rows,
             "columns": cols,
-            "has_header": False,  # Will be determined by checking first row cell types
+            "has_header": has_header,
             "dimensions": f"{rows}x{cols}"
         }
         
-        # Check for table headers
-        if content:
-            first_row = content[0]
-            first_row_content = getattr(first_row, 'content', None) or (first_row.get('content') if isinstance(first_row, dict) else [])
-            if first_row_content:
-                first_cell = first_row_content[0]
-                first_cell_type = getattr(first_cell, 'type', None) or (first_cell.get('type') if isinstance(first_cell, dict) else None)
-                table_info["has_header"] = first_cell_type == "tableHeader"
-        
-        analysis["tables"].append(table_info)
+        analysis.tables.append(table_info)
     
-    def _analyze_panel_node(self, node: Any, analysis: Dict[str, Any], path: List[int]) -> None:
+    def _analyze_panel_node(self, node: Dict[str, Any], analysis: AnalysisAccumulator, path: List[int]) -> None:
         """Analyze panel (info, warning, etc.) node."""
-        analysis["statistics"]["complex_elements"] += 1
+        analysis.complex_elements += 1
         
-        attrs = getattr(node, 'attrs', None) or (node.get('attrs') if isinstance(node, dict) else {})
+        attrs = node.get("attrs")
         panel_type = attrs.get("panelType", "unknown") if attrs else "unknown"
         
         panel_info = {
-            "path": path,
+            "path": list(path),
             "type": panel_type,
             "valid_type": panel_type in PANEL_TYPES
         }
@@ -341,38 +563,88 @@ class ADFReader:
         if panel_type in PANEL_TYPES:
             panel_info.update(PANEL_TYPES[panel_type])
         
-        analysis["panels"].append(panel_info)
+        analysis.panels.append(panel_info)
     
-    def _analyze_macro_node(self, node: Any, analysis: Dict[str, Any], path: List[int]) -> None:
+    def _analyze_macro_node(self, node: Dict[str, Any], analysis: AnalysisAccumulator, path: List[int]) -> None:
         """Analyze macro (extension) node."""
-        analysis["statistics"]["complex_elements"] += 1
+        analysis.complex_elements += 1
         
-        attrs = getattr(node, 'attrs', None) or (node.get('attrs') if isinstance(node, dict) else {})
+        attrs = node.get("attrs")
         
         macro_info = {
-            "path": path,
+            "path": list(path),
             "extension_type": attrs.get("extensionType") if attrs else None,
             "extension_key": attrs.get("extensionKey") if attrs else None,
             "parameters": attrs.get("parameters", {}) if attrs else {},
-            "node_type": getattr(node, 'type', None) or (node.get('type') if isinstance(node, dict) else None)
+            "node_type": node["type"]
         }
         
-        analysis["macros"].append(macro_info)
+        analysis.macros.append(macro_info)
+    
+    # Node types with a dedicated analysis step. Handlers that keep the path
+    # copy it, since the walk reuses one path list for every node.
+    _NODE_HANDLERS = {
+        "text": _analyze_text_node,
+        "table": _analyze_table_node,
+        "panel": _analyze_panel_node,
+        "extension": _analyze_macro_node,
+        "bodiedExtension": _analyze_macro_node,
+        "inlineExtension": _analyze_macro_node
+    }
     
-    def _create_element_map(self, adf_document: ADFDocument) -> Dict[str, ElementPath]:
+    def _create_element_map(
+        self,
+        adf_document: ADFDocument,
+        root_paths: Optional[List[List[int]]] = None
+    ) -> Dict[str, ElementPath]:
         """
         Create element map for fast navigation.
         
         Args:
             adf_document: Parsed ADF document
+            root_paths: Optional paths of the subtrees to map. Only those
+                subtrees are walked; overlapping paths map the whole document.
             
         Returns:
             Dictionary mapping element identifiers to their paths
         """
         logger.debug("Creating element map for ADF document")
         
-        # Use the built-in element map from ADFDocument
-        return adf_document._element_map
+        if root_paths is None or self._paths_overlap(root_paths):
+            # Use the built-in element map from ADFDocument, building it if deferred
+            return adf_document._ensure_element_map()
+        
+        element_map: Dict[str, ElementPath] = {}
+        for root_path in root_paths:
+            siblings = adf_document._get_parent_at_path(root_path[:-1])
+            index = root_path[-1]
+            if siblings is None or not 0 <= index < len(siblings):
+                logger.debug(f"Skipping element map root {root_path}: no element at path")
+                continue
+            adf_document._build_element_map_recursive(
+                siblings[index:index + 1], root_path[:-1], element_map, start=index
+            )
+        
+        return element_map
+    
+    def _paths_overlap(self, paths: List[List[int]]) -> bool:
+        """
+        Check whether any path is empty or a prefix of (or equal to) another.
+        
+        Args:
+            paths: Element paths to check
+            
+        Returns:
+            True if the subtrees at these paths are not disjoint
+        """
+        ordered = sorted(tuple(path) for path in paths)
+        if ordered and not ordered[0]:
+            return True
+        # After sorting, a prefix always sorts directly before some path it covers
+        return any(
+            ordered[i + 1][:len(ordered[i])] == ordered[i]
+            for i in range(len(ordered) - 1)
+        )
     
     def _validate_adf_structure(self, adf_document: ADFDocument) -> ValidationResult:
         """
@@ -386,7 +658,7 @@ class ADFReader:
         """
         logger.debug("Validating ADF document structure")
         
-        validation_result = adf_document._validator.validate_with_details(adf_document.raw_data)
+        validation_result = self.validator.validate_with_details(adf_document._raw_data)
         
         logger.debug(
             f"Validation complete: {validation_result.get('is_valid', False)}, "
@@ -420,8 +692,7 @@ class ADFReader:
     
     def _get_current_timestamp(self) -> str:
         """Get current timestamp for tracking."""
-        import datetime
-        return datetime.datetime.now().isoformat()
+        return datetime.now().isoformat()
 
 
 # Convenience function for direct usage
@@ -455,3 +726,36 @@ def get_page_with_full_formatting(
         create_element_map=create_element_map,
         validate_structure=validate_structure
     )
+
+
+def get_pages_with_full_formatting(
+    confluence_client,
+    page_ids: List[str],
+    *,
+    analyze_formatting: bool = True,
+    create_element_map: bool = True,
+    validate_structure: bool = True,
+    max_concurrent_fetches: int = MAX_CONCURRENT_PAGE_FETCHES
+) -> List[Dict[str, Any]]:
+    """
+    Convenience function to get several pages with full formatting.
+    
+    Args:
+        confluence_client: Confluence client instance
+        page_ids: IDs of the pages to retrieve
+        analyze_formatting: Whether to analyze formatting elements
+        create_element_map: Whether to create element navigation map
+        validate_structure: Whether to validate ADF structure
+        max_concurrent_fetches: Maximum number of page requests in flight
+        
+    Returns:
+        Complete page data for each page, in the order of page_ids
+    """
+    reader = ADFReader(confluence_client)
+    return reader.get_pages_with_full_formatting(
+        page_ids,
+        analyze_formatting=analyze_formatting,
+        create_element_map=create_element_map,
+        validate_structure=validate_structure,
+        max_concurrent_fetches=max_concurrent_fetches
+    )
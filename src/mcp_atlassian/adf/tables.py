@@ -11,7 +11,9 @@ table structures in Atlassian Document Format, including:
 - Bulk table operations and transformations
 """
 
+import copy
 import logging
+from functools import partial
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
 from dataclasses import dataclass
 
@@ -22,8 +24,11 @@ from .elements import TableElement, TableRowElement, TableCellElement, TableHead
 
 logger = logging.getLogger("mcp-atlassian.adf.tables")
 
+# Builds the error entry reported for an invalid table cell
+_cell_error = partial(ValidationError, severity="error", node_type="tableCell")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TableDimensions:
     """Table dimensions information."""
     rows: int
@@ -34,17 +39,26 @@ class TableDimensions:
     merged_cells: int
     
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CellSpanInfo:
     """Information about cell spanning."""
     row: int
     column: int
     colspan: int
     rowspan: int
-    covers_cells: List[Tuple[int, int]]  # List of (row, col) tuples this cell covers
+    
+    @property
+    def covers_cells(self) -> List[Tuple[int, int]]:
+        """List of (row, col) tuples this cell covers, computed on access."""
+        return [
+            (r, c)
+            for r in range(self.row, self.row + self.rowspan)
+            for c in range(self.column, self.column + self.colspan)
+            if (r, c) != (self.row, self.column)
+        ]
     
 
-@dataclass  
+@dataclass(frozen=True, slots=True)
 class TableAnalysis:
     """Comprehensive table analysis results."""
     dimensions: TableDimensions
@@ -65,6 +79,8 @@ class TableManager:
     analysis, validation, and bulk operations on table elements.
     """
     
+    __slots__ = ("document", "table_cache")
+    
     def __init__(self, document: Optional[ADFDocument] = None):
         """
         Initialize table manager.
@@ -135,7 +151,7 @@ class TableManager:
         if isinstance(table, dict):
             table_dict = table
         elif hasattr(table, 'model_dump'):
-            table_dict = table.model_dump()
+            table_dict = self._project_table_for_analysis(table)
         else:
             table_dict = table
             
@@ -144,17 +160,37 @@ class TableManager:
         if not content:
             return self._create_empty_table_analysis()
         
-        # Analyze dimensions
-        dimensions = self._calculate_table_dimensions(content)
-        
-        # Analyze headers
-        has_headers = self._detect_table_headers(content)
-        
-        # Check if table is regular (all rows same column count)
-        is_regular = self._is_regular_table(content)
+        # Collect dimensions, spans and span errors in a single pass over the cells
+        column_counts: List[int] = []
+        cell_spans: List[CellSpanInfo] = []
+        validation_errors: List[str] = []
+        for row_idx, row in enumerate(content):
+            row_content = row.get('content', [])
+            column_counts.append(len(row_content))
+            for col_idx, cell in enumerate(row_content):
+                cell_attrs = cell.get('attrs')
+                if not cell_attrs:
+                    continue  # No attrs means no spans
+                colspan = cell_attrs.get('colspan', 1)
+                rowspan = cell_attrs.get('rowspan', 1)
+                if colspan > 1 or rowspan > 1:
+                    cell_spans.append(CellSpanInfo(row_idx, col_idx, colspan, rowspan))
+                    if colspan < 1 or rowspan < 1:
+                        validation_errors.append(f"Invalid span at ({row_idx}, {col_idx})")
+        
+        # Headers are detected from the first row only
+        has_headers = self._is_header_row(content[0])
+        dimensions = TableDimensions(
+            rows=len(content),
+            columns=max(column_counts),
+            header_rows=1 if has_headers else 0,
+            header_columns=0,  # Would need more analysis
+            total_cells=sum(column_counts),
+            merged_cells=len(cell_spans)
+        )
         
-        # Analyze cell spans
-        cell_spans = self._analyze_cell_spans(content)
+        # Regular tables have the same column count in every row
+        is_regular = len(set(column_counts)) <= 1
         
         # Extract column widths and layout
         attrs = table_dict.get('attrs', {})
@@ -163,12 +199,9 @@ class TableManager:
         
         # Calculate accessibility score
         accessibility_score = self._calculate_table_accessibility_score(
-            dimensions, has_headers, is_regular, cell_spans
+            dimensions, has_headers, is_regular
         )
         
-        # Validate table structure
-        validation_errors = self._validate_table_structure(content, cell_spans)
-        
         analysis = TableAnalysis(
             dimensions=dimensions,
             has_headers=has_headers,
@@ -264,34 +297,25 @@ class TableManager:
         logger.debug(f"Inserting table row at index {row_index}")
         
         # Determine column count
+        source_row = None
         if copy_structure_from is not None and 0 <= copy_structure_from < len(table.content):
             source_row = table.content[copy_structure_from]
             column_count = len(source_row.content)
         else:
             # Use maximum column count from existing rows
-            column_count = max(len(row.content) for row in table.content) if table.content else 1
-        
-        # Create new row
-        new_row = TableRowElement()
-        
-        # Add cells to match column count
-        for col_idx in range(column_count):
-            if is_header:
-                cell = TableHeaderElement()
-            else:
-                cell = TableCellElement()
-            new_row.content.append(cell)
-        
-        # Copy structure if specified
-        if copy_structure_from is not None and 0 <= copy_structure_from < len(table.content):
-            source_row = table.content[copy_structure_from]
-            for i, source_cell in enumerate(source_row.content):
-                if i < len(new_row.content):
-                    # Copy spans but not content
-                    target_cell = new_row.content[i]
-                    if hasattr(source_cell, 'attrs'):
-                        span_attrs = {k: v for k, v in source_cell.attrs.items() 
-                                    if k in ['colspan', 'rowspan']}
+            column_count = max([len(row.content) for row in table.content]) if table.content else 1
+        
+        # Create new row with cells to match column count
+        cell_class = TableHeaderElement if is_header else TableCellElement
+        new_row = TableRowElement(content=[cell_class() for _ in range(column_count)])
+        
+        # Copy spans but not content if a source row was given
+        if source_row is not None:
+            for target_cell, source_cell in zip(new_row.content, source_row.content):
+                source_attrs = source_cell.attrs
+                if source_attrs:
+                    span_attrs = {k: source_attrs[k] for k in ('colspan', 'rowspan') if k in source_attrs}
+                    if span_attrs:
                         target_cell.attrs.update(span_attrs)
         
         # Insert row
@@ -320,18 +344,17 @@ class TableManager:
         """
         logger.debug(f"Inserting table column at index {col_index}")
         
-        # Insert cell into each row
-        for row in table.content:
-            # Determine cell type - header if this is first row or is_header specified
-            is_first_row = table.content[0] == row
-            should_be_header = is_header or (is_first_row and self._detect_table_headers([row.content]))
-            
-            if should_be_header:
-                cell = TableHeaderElement()
-            else:
-                cell = TableCellElement()
-            
-            row.content.insert(col_index, cell)
+        # Cells are headers if requested, or in the first row of a table with a header row
+        cell_class = TableHeaderElement if is_header else TableCellElement
+        first_row_cell_class = TableHeaderElement if self._first_row_has_headers(table) else cell_class
+        
+        # Insert cell into each row, with the cell class fixed for all rows after the first
+        rows = iter(table.content)
+        first_row = next(rows, None)
+        if first_row is not None:
+            first_row.content.insert(col_index, first_row_cell_class())
+        for row in rows:
+            row.content.insert(col_index, cell_class())
         
         logger.debug(f"Inserted column into {len(table.content)} rows")
         return table
@@ -370,7 +393,7 @@ class TableManager:
         
         for row in table.content:
             if 0 <= col_index < len(row.content):
-                row.content.pop(col_index)
+                del row.content[col_index]
                 deleted_cells += 1
                 
         logger.debug(f"Deleted column {col_index}, removed {deleted_cells} cells")
@@ -417,34 +440,25 @@ class TableManager:
         if rowspan > 1:
             main_cell.attrs["rowspan"] = rowspan
             
-        # Collect content from cells to be merged
+        # Move content out of the merged cells in one pass over the range
         merged_content = []
         for row_idx in range(start_row, end_row + 1):
+            row_cells = table.content[row_idx].content
             for col_idx in range(start_col, end_col + 1):
                 if row_idx == start_row and col_idx == start_col:
                     continue  # Skip main cell
                     
-                cell = table.content[row_idx].content[col_idx]
-                if hasattr(cell, 'content') and cell.content:
+                cell = row_cells[col_idx]
+                if cell.content:
                     merged_content.extend(cell.content)
+                
+                # Clear cell content; the main cell's spans record the merge
+                cell.content = []
         
         # Add merged content to main cell
         if merged_content:
             main_cell.content.extend(merged_content)
         
-        # Remove the merged cells (mark for deletion)
-        for row_idx in range(start_row, end_row + 1):
-            row = table.content[row_idx]
-            for col_idx in range(start_col, end_col + 1):
-                if row_idx == start_row and col_idx == start_col:
-                    continue  # Skip main cell
-                    
-                # Clear cell content and mark as merged
-                if col_idx < len(row.content):
-                    cell = row.content[col_idx]
-                    cell.content = []
-                    cell.attrs["__merged"] = True  # Temporary marker
-        
         logger.debug(f"Merged cells with spans: {colspan}x{rowspan}")
         return table
         
@@ -464,16 +478,11 @@ class TableManager:
         table.content = [row for row in table.content if self._has_content_in_row(row)]
         
         # Normalize column counts
-        max_cols = max(len(row.content) for row in table.content) if table.content else 0
-        for row in table.content:
-            while len(row.content) < max_cols:
-                row.content.append(TableCellElement())
-        
-        # Clean up merged cell markers
-        for row in table.content:
-            for cell in row.content:
-                if "__merged" in cell.attrs:
-                    del cell.attrs["__merged"]
+        column_counts = [len(row.content) for row in table.content]
+        max_cols = max(column_counts, default=0)
+        for row, count in zip(table.content, column_counts):
+            if count < max_cols:
+                row.content.extend(TableCellElement() for _ in range(max_cols - count))
         
         # Optimize attributes
         if not table.attrs:
@@ -507,28 +516,32 @@ class TableManager:
         if len(set(column_counts)) > 1:
             warnings.append(ValidationError(message="Inconsistent column counts across rows", path=[], severity="warning", node_type="table"))
         
-        # Check cell spans
+        # Check cell spans against the table bounds, computed once
+        max_columns = max(column_counts)
+        row_count = len(table.content)
         for row_idx, row in enumerate(table.content):
             for col_idx, cell in enumerate(row.content):
-                if hasattr(cell, 'attrs') and cell.attrs:
-                    colspan = cell.attrs.get('colspan', 1)
-                    rowspan = cell.attrs.get('rowspan', 1)
+                cell_attrs = cell.attrs
+                if cell_attrs:
+                    colspan = cell_attrs.get('colspan', 1)
+                    rowspan = cell_attrs.get('rowspan', 1)
+                    if colspan == 1 and rowspan == 1:
+                        continue  # A single cell always fits the table
                     
                     # Validate spans are reasonable
                     if colspan < 1:
-                        errors.append(ValidationError(message=f"Invalid colspan {colspan} at ({row_idx}, {col_idx})", path=[row_idx, col_idx], severity="error", node_type="tableCell"))
+                        errors.append(_cell_error(message=f"Invalid colspan {colspan} at ({row_idx}, {col_idx})", path=[row_idx, col_idx]))
                     if rowspan < 1:
-                        errors.append(ValidationError(message=f"Invalid rowspan {rowspan} at ({row_idx}, {col_idx})", path=[row_idx, col_idx], severity="error", node_type="tableCell"))
+                        errors.append(_cell_error(message=f"Invalid rowspan {rowspan} at ({row_idx}, {col_idx})", path=[row_idx, col_idx]))
                     
                     # Check if spans exceed table bounds
-                    if col_idx + colspan > max(column_counts):
-                        errors.append(ValidationError(message=f"Colspan exceeds table width at ({row_idx}, {col_idx})", path=[row_idx, col_idx], severity="error", node_type="tableCell"))
-                    if row_idx + rowspan > len(table.content):
-                        errors.append(ValidationError(message=f"Rowspan exceeds table height at ({row_idx}, {col_idx})", path=[row_idx, col_idx], severity="error", node_type="tableCell"))
+                    if col_idx + colspan > max_columns:
+                        errors.append(_cell_error(message=f"Colspan exceeds table width at ({row_idx}, {col_idx})", path=[row_idx, col_idx]))
+                    if row_idx + rowspan > row_count:
+                        errors.append(_cell_error(message=f"Rowspan exceeds table height at ({row_idx}, {col_idx})", path=[row_idx, col_idx]))
         
         # Check accessibility
-        analysis = self.analyze_table_structure(table)
-        if not analysis.has_headers:
+        if not self._first_row_has_headers(table):
             warnings.append(ValidationError(message="Table lacks header row for accessibility", path=[], severity="warning", node_type="table"))
         
         is_valid = len(errors) == 0
@@ -542,12 +555,20 @@ class TableManager:
         logger.debug(f"Table validation: {'valid' if is_valid else 'invalid'}, {len(errors)} errors, {len(warnings)} warnings")
         return result
         
-    def find_tables_in_document(self, document: Optional[ADFDocument] = None) -> List[Tuple[ElementPath, TableElement]]:
+    def find_tables_in_document(
+        self,
+        document: Optional[ADFDocument] = None,
+        *,
+        materialize: bool = True
+    ) -> List[Tuple[ElementPath, Union[TableElement, Dict[str, Any]]]]:
         """
         Find all tables in document.
         
         Args:
             document: Document to search (uses instance document if not provided)
+            materialize: Whether to validate each table into a TableElement.
+                When False the raw table dicts are returned, which is much
+                cheaper for read-only use such as analyze_table_structure.
             
         Returns:
             List of (path, table) tuples
@@ -556,8 +577,11 @@ class TableManager:
         if not target_document:
             raise ValueError("No document provided for table search")
         
-        tables: List[Tuple[ElementPath, TableElement]] = []
-        self._find_tables_recursive(target_document.content, [], tables)
+        # Walk the raw dict tree; the parsed model holds generic nodes rather
+        # than table elements. An unparsable body has no model content.
+        content = target_document._raw_data["content"] if target_document._model.content else []
+        tables: List[Tuple[ElementPath, Union[TableElement, Dict[str, Any]]]] = []
+        self._find_tables_recursive(content, [], tables, materialize=materialize)
         
         logger.debug(f"Found {len(tables)} tables in document")
         return tables
@@ -578,33 +602,32 @@ class TableManager:
         logger.debug("Applying table structure to target")
         return target_table
         
-    def _calculate_table_dimensions(self, content: List[Any]) -> TableDimensions:
-        """Calculate table dimensions."""
-        if not content:
-            return TableDimensions(0, 0, 0, 0, 0, 0)
-            
-        rows = len(content)
-        columns = max(len(row.get('content', [])) for row in content) if content else 0
-        
-        # Count header rows/columns (simplified)
-        header_rows = 1 if content and self._is_header_row(content[0]) else 0
-        header_columns = 0  # Would need more analysis
-        
-        # Count total and merged cells
-        total_cells = sum(len(row.get('content', [])) for row in content)
-        merged_cells = sum(
-            1 for row in content 
-            for cell in row.get('content', [])
-            if cell.get('attrs', {}).get('colspan', 1) > 1 or cell.get('attrs', {}).get('rowspan', 1) > 1
-        )
+    def _project_table_for_analysis(self, table: ADFNodeModel) -> Dict[str, Any]:
+        """
+        Extract the fields the analysis reads from a table model.
         
-        return TableDimensions(rows, columns, header_rows, header_columns, total_cells, merged_cells)
+        A full model_dump() would also serialize the content tree of every
+        cell, which the analysis never looks at.
         
-    def _detect_table_headers(self, content: List[Any]) -> bool:
-        """Detect if table has headers."""
-        if not content:
-            return False
-        return self._is_header_row(content[0])
+        Args:
+            table: Table model
+            
+        Returns:
+            Table dict holding only table attrs and per-cell type and attrs
+        """
+        return {
+            'attrs': copy.deepcopy(table.attrs) if table.attrs else {},
+            'content': [
+                {'content': [{'type': cell.type, 'attrs': cell.attrs} for cell in row.content or ()]}
+                for row in table.content or ()
+            ]
+        }
+        
+    def _first_row_has_headers(self, table: TableElement) -> bool:
+        """Check if the first row of a table model contains a header cell."""
+        return bool(table.content) and any(
+            cell.type == "tableHeader" for cell in table.content[0].content
+        )
         
     def _is_header_row(self, row: Any) -> bool:
         """Check if row is a header row."""
@@ -613,42 +636,11 @@ class TableManager:
             return False
         return any(cell.get('type') == 'tableHeader' for cell in row_content)
         
-    def _is_regular_table(self, content: List[Any]) -> bool:
-        """Check if table has regular structure."""
-        if not content:
-            return True
-        column_counts = [len(row.get('content', [])) for row in content]
-        return len(set(column_counts)) <= 1
-        
-    def _analyze_cell_spans(self, content: List[Any]) -> List[CellSpanInfo]:
-        """Analyze cell span information."""
-        spans = []
-        
-        for row_idx, row in enumerate(content):
-            for col_idx, cell in enumerate(row.get('content', [])):
-                attrs = cell.get('attrs', {})
-                colspan = attrs.get('colspan', 1)
-                rowspan = attrs.get('rowspan', 1)
-                
-                if colspan > 1 or rowspan > 1:
-                    # Calculate covered cells
-                    covers_cells = []
-                    for r in range(row_idx, row_idx + rowspan):
-                        for c in range(col_idx, col_idx + colspan):
-                            if (r, c) != (row_idx, col_idx):
-                                covers_cells.append((r, c))
-                    
-                    span_info = CellSpanInfo(row_idx, col_idx, colspan, rowspan, covers_cells)
-                    spans.append(span_info)
-        
-        return spans
-        
     def _calculate_table_accessibility_score(
         self,
         dimensions: TableDimensions,
         has_headers: bool,
-        is_regular: bool,
-        cell_spans: List[CellSpanInfo]
+        is_regular: bool
     ) -> float:
         """Calculate accessibility score for table."""
         score = 1.0
@@ -666,26 +658,11 @@ class TableManager:
             score -= 0.1
         
         # Penalty for complex spans
-        if len(cell_spans) > dimensions.total_cells * 0.2:  # More than 20% spanning cells
+        if dimensions.merged_cells > dimensions.total_cells * 0.2:  # More than 20% spanning cells
             score -= 0.2
         
         return max(0.0, min(1.0, score))
         
-    def _validate_table_structure(self, content: List[Any], cell_spans: List[CellSpanInfo]) -> List[str]:
-        """Validate table structure."""
-        errors = []
-        
-        # Basic validation
-        if not content:
-            errors.append("Empty table content")
-            
-        # Span validation
-        for span in cell_spans:
-            if span.colspan < 1 or span.rowspan < 1:
-                errors.append(f"Invalid span at ({span.row}, {span.column})")
-                
-        return errors
-        
     def _create_empty_table_analysis(self) -> TableAnalysis:
         """Create analysis for empty table."""
         return TableAnalysis(
@@ -701,32 +678,53 @@ class TableManager:
         
     def _has_content_in_row(self, row: TableRowElement) -> bool:
         """Check if row has any content."""
-        for cell in row.content:
-            if hasattr(cell, 'content') and cell.content:
-                return True
-        return False
+        return any(cell.content for cell in row.content)
         
     def _find_tables_recursive(
         self,
         nodes: List[Any],
         path: List[int],
-        results: List[Tuple[ElementPath, TableElement]]
+        results: List[Tuple[ElementPath, Union[TableElement, Dict[str, Any]]]],
+        *,
+        materialize: bool = True
     ) -> None:
-        """Recursively find tables in content."""
-        for i, node in enumerate(nodes):
-            current_path = path + [i]
+        """
+        Find tables in content and all nested content.
+        
+        Nodes are visited in document order using an explicit stack of sibling
+        iterators, so deeply nested documents do not hit the recursion limit.
+        The path list is extended and restored in place.
+        """
+        # Siblings are either all raw dicts or all parsed models
+        stack = [(enumerate(nodes), bool(nodes) and type(nodes[0]) is dict)]
+        while stack:
+            siblings, is_dict = stack[-1]
+            entry = next(siblings, None)
+            if entry is None:
+                stack.pop()
+                if stack:
+                    path.pop()
+                continue
+            
+            i, node = entry
+            path.append(i)
             
-            node_type = getattr(node, 'type', None) or (node.get('type') if isinstance(node, dict) else None)
+            if is_dict:
+                node_type = node.get('type')
+                child_content = node.get('content')
+            else:
+                node_type = getattr(node, 'type', None)
+                child_content = getattr(node, 'content', None)
             
             if node_type == "table":
                 element_path = ElementPath(
-                    path=current_path,
+                    path=list(path),
                     type="table",
                     text_content=None
                 )
-                if isinstance(node, TableElement):
+                if isinstance(node, TableElement) or (is_dict and not materialize):
                     results.append((element_path, node))
-                elif isinstance(node, dict):
+                elif is_dict:
                     # Convert dict to TableElement
                     try:
                         table_element = TableElement.model_validate(node)
@@ -734,10 +732,11 @@ class TableManager:
                     except Exception as e:
                         logger.warning(f"Failed to convert table dict to element: {e}")
             
-            # Recurse into child content
-            child_content = getattr(node, 'content', None) or (node.get('content') if isinstance(node, dict) else None)
+            # Descend into child content, keeping this node's index in the path
             if child_content:
-                self._find_tables_recursive(child_content, current_path, results)
+                stack.append((enumerate(child_content), type(child_content[0]) is dict))
+            else:
+                path.pop()
 
 
 # Convenience functions for direct usage
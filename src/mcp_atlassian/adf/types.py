@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Literal, Optional, Union
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing_extensions import TypedDict
 
+from .constants import MARK_TYPES, NODE_TYPES
+
 
 # Base ADF Types
 class ADFNode(TypedDict, total=False):
@@ -163,7 +165,6 @@ class ADFNodeModel(BaseADFModel):
     @classmethod
     def validate_type(cls, v: str) -> str:
         """Validate node type."""
-        from .constants import NODE_TYPES
         if v not in NODE_TYPES:
             raise ValueError(f"Invalid node type: {v}")
         return v
@@ -178,7 +179,6 @@ class ADFMarkModel(BaseADFModel):
     @classmethod 
     def validate_type(cls, v: str) -> str:
         """Validate mark type."""
-        from .constants import MARK_TYPES
         if v not in MARK_TYPES:
             raise ValueError(f"Invalid mark type: {v}")
         return v
@@ -191,14 +191,9 @@ class ADFDocumentModel(BaseADFModel):
     content: List[ADFNodeModel] = Field(default_factory=list, description="Document content")
 
 
-# Update forward references for recursive types
-try:
-    ADFNodeModel.model_rebuild()
-    ADFMarkModel.model_rebuild()
-except AttributeError:
-    # For older versions of Pydantic
-    ADFNodeModel.update_forward_refs()
-    ADFMarkModel.update_forward_refs()
+# Resolve forward references for recursive types once, at import time
+ADFNodeModel.model_rebuild()
+ADFMarkModel.model_rebuild()
 
 # Search and Navigation Types
 class ElementPath(TypedDict):
@@ -5,8 +5,8 @@ This module provides comprehensive validation of ADF documents to ensure
 they conform to the specification and can be safely processed.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
-import copy
+import re
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
 
 from .constants import (
     ADF_VERSION,
@@ -22,6 +22,17 @@ from .constants import (
 )
 from .types import ValidationResult, ValidationError
 
+# Short (#rgb) or full (#rrggbb) hex color
+HEX_COLOR_PATTERN = re.compile(r"#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+
+# Node types allowed inside a tableRow
+TABLE_CELL_TYPES = frozenset(("tableCell", "tableHeader"))
+
+# Message templates bound once rather than looked up for every error
+_invalid_node_type_message = ERROR_MESSAGES["invalid_node_type"].format
+_invalid_mark_type_message = ERROR_MESSAGES["invalid_mark_type"].format
+_invalid_color_message = ERROR_MESSAGES["invalid_color_value"].format
+
 
 class ADFValidator:
     """
@@ -33,44 +44,64 @@ class ADFValidator:
     
     def __init__(self):
         """Initialize validator."""
-        self.errors: List[ValidationError] = []
-        self.warnings: List[ValidationError] = []
-        self.current_depth = 0
+        # Problems are stored column-wise and only turned into
+        # ValidationError dicts when errors or warnings are read
+        self._issue_paths: List[List[int]] = []
+        self._issue_messages: List[str] = []
+        self._issue_is_warning = bytearray()
+        self._error_count = 0
+        # Set while a caller only needs a pass/fail answer
+        self._stop_at_first_error = False
+    
+    @property
+    def errors(self) -> List[ValidationError]:
+        """Errors found by the last validation."""
+        return self._collect_issues(0)
+    
+    @property
+    def warnings(self) -> List[ValidationError]:
+        """Warnings found by the last validation."""
+        return self._collect_issues(1)
     
-    def validate_document(self, document: Dict[str, Any]) -> bool:
+    def validate_document(self, document: Dict[str, Any], stop_at_first_error: bool = True) -> bool:
         """
         Validate complete ADF document.
         
         Args:
             document: ADF document to validate
+            stop_at_first_error: Stop walking the content once an error is
+                found; pass False to collect every error and warning
             
         Returns:
             True if document is valid, False otherwise
         """
         self._reset_validation_state()
+        self._stop_at_first_error = stop_at_first_error
         
         try:
             # Check basic document structure
             if not self._validate_root_structure(document):
-                return len(self.errors) == 0
+                return self._error_count == 0
             
             # Check version
             if not self._validate_version(document.get("version")):
-                return len(self.errors) == 0
+                return self._error_count == 0
             
             # Check document type
             if not self._validate_document_type(document.get("type")):
-                return len(self.errors) == 0
+                return self._error_count == 0
             
             # Validate content
             content = document.get("content", [])
             self._validate_content_array(content, [])
             
-            return len(self.errors) == 0
+            return self._error_count == 0
             
         except Exception as e:
-            self._add_error([], f"Validation failed with exception: {str(e)}", "error")
+            self._add_error([], f"Validation failed with exception: {str(e)}")
             return False
+        finally:
+            self._stop_at_first_error = False
     
     def validate_with_details(self, document: Dict[str, Any]) -> ValidationResult:
         """
@@ -82,12 +113,12 @@ class ADFValidator:
         Returns:
             Validation result with errors and warnings
         """
-        is_valid = self.validate_document(document)
+        is_valid = self.validate_document(document, stop_at_first_error=False)
         
         return ValidationResult(
             is_valid=is_valid,
-            errors=copy.deepcopy(self.errors),
-            warnings=copy.deepcopy(self.warnings)
+            errors=self.errors,
+            warnings=self.warnings
         )
     
     def validate_node(self, node: Dict[str, Any], path: List[int]) -> bool:
@@ -101,40 +132,39 @@ class ADFValidator:
         Returns:
             True if node is valid
         """
-        if not isinstance(node, dict):
-            self._add_error(path, "Node must be a dictionary", "error")
-            return False
-        
-        # Check required 'type' field
-        node_type = node.get("type")
-        if not node_type:
-            self._add_error(path, "Node missing required 'type' field", "error")
-            return False
-        
-        # Validate node type
-        if not self._validate_node_type(node_type, path):
+        if not self._validate_node_base(node, path):
             return False
         
         # Validate node-specific structure
         self._validate_node_structure(node, path)
-        return len(self.errors) == 0
+        return self._error_count == 0
     
     def _reset_validation_state(self) -> None:
         """Reset validation state for new validation."""
-        self.errors.clear()
-        self.warnings.clear()
-        self.current_depth = 0
+        self._issue_paths.clear()
+        self._issue_messages.clear()
+        self._issue_is_warning.clear()
+        self._error_count = 0
+    
+    def _collect_issues(self, is_warning: int) -> List[ValidationError]:
+        """Build ValidationError entries for stored errors or warnings."""
+        severity: Literal["error", "warning"] = "warning" if is_warning else "error"
+        return [
+            ValidationError(path=list(path), message=message, severity=severity, node_type=None)
+            for path, message, flag in zip(self._issue_paths, self._issue_messages, self._issue_is_warning)
+            if flag == is_warning
+        ]
     
     def _validate_root_structure(self, document: Dict[str, Any]) -> bool:
         """Validate root document structure."""
         if not isinstance(document, dict):
-            self._add_error([], "Document must be a dictionary", "error")
+            self._add_error([], "Document must be a dictionary")
             return False
         
         required_fields = ["version", "type", "content"]
         for field in required_fields:
             if field not in document:
-                self._add_error([], f"Missing required field: {field}", "error")
+                self._add_error([], f"Missing required field: {field}")
                 return False
         
         return True
@@ -142,49 +172,130 @@ class ADFValidator:
     def _validate_version(self, version: Any) -> bool:
         """Validate ADF version."""
         if version != ADF_VERSION:
-            self._add_error([], ERROR_MESSAGES["invalid_version"], "error")
+            self._add_error([], ERROR_MESSAGES["invalid_version"])
             return False
         return True
     
     def _validate_document_type(self, doc_type: Any) -> bool:
         """Validate document type."""
         if doc_type != ADF_DOCUMENT_TYPE:
-            self._add_error([], ERROR_MESSAGES["invalid_root_type"], "error")
+            self._add_error([], ERROR_MESSAGES["invalid_root_type"])
             return False
         return True
     
     def _validate_content_array(self, content: List[Any], path: List[int]) -> bool:
-        """Validate content array."""
-        if not isinstance(content, list):
-            self._add_error(path, "Content must be an array", "error")
-            return False
+        """
+        Validate content array and every node nested below it.
         
-        # Check depth
-        if self.current_depth > MAX_DEPTH:
-            self._add_error(path, ERROR_MESSAGES["max_depth_exceeded"], "error")
+        The tree is walked with an explicit stack of child iterators instead
+        of recursion, so deep documents do not grow the Python call stack.
+        Node-specific checks run once a node's children are done, which keeps
+        errors in document order.
+        """
+        if not isinstance(content, list):
+            self._add_error(path, "Content must be an array")
             return False
         
-        # Validate each node in content
-        self.current_depth += 1
         all_valid = True
+        # One path list is extended and trimmed as the walk moves; errors
+        # take their own copy. While a child iterator is being consumed,
+        # path holds the location of that iterator's parent.
+        path = list(path)
+        # Each entry holds the parent node (None for this array) and an
+        # iterator over the children still to visit
+        stack: List[Tuple[Optional[Dict[str, Any]], Iterator[Tuple[int, Any]]]] = [
+            (None, enumerate(content))
+        ]
+        
+        # Bind per-node methods once for the loop below
+        validate_base = self._validate_node_base
+        validate_fields = self._validate_node_fields
+        validate_specific = self._validate_node_specific
+        stop_at_first_error = self._stop_at_first_error
+        append_path = path.append
+        pop_path = path.pop
+        
+        while stack:
+            parent, children = stack[-1]
+            
+            for i, node in children:
+                if stop_at_first_error and self._error_count:
+                    return False
+                
+                append_path(i)
+                if not validate_base(node, path):
+                    all_valid = False
+                    pop_path()
+                    continue
+                
+                if not validate_fields(node, path):
+                    all_valid = False
+                
+                if "content" in node:
+                    child_content = node["content"]
+                    if not isinstance(child_content, list):
+                        self._add_error(path, "Content must be an array")
+                        all_valid = False
+                    elif len(stack) > MAX_DEPTH:
+                        self._add_error(path, ERROR_MESSAGES["max_depth_exceeded"])
+                        all_valid = False
+                    else:
+                        # Descend, keeping this node's index in the path; the
+                        # node-specific check runs when its children are exhausted
+                        stack.append((node, enumerate(child_content)))
+                        break
+                
+                if not validate_specific(node, path):
+                    all_valid = False
+                pop_path()
+            else:
+                stack.pop()
+                if parent is not None:
+                    if not validate_specific(parent, path):
+                        all_valid = False
+                    pop_path()
         
-        for i, node in enumerate(content):
-            node_path = path + [i]
-            if not self.validate_node(node, node_path):
-                all_valid = False
-        
-        self.current_depth -= 1
         return all_valid
     
+    def _validate_node_base(self, node: Any, path: List[int]) -> bool:
+        """Check that a node is a dictionary with a known type."""
+        if not isinstance(node, dict):
+            self._add_error(path, "Node must be a dictionary")
+            return False
+        
+        # Check required 'type' field
+        node_type = node.get("type")
+        if not node_type:
+            self._add_error(path, "Node missing required 'type' field")
+            return False
+        
+        # Validate node type
+        return self._validate_node_type(node_type, path)
+    
     def _validate_node_type(self, node_type: str, path: List[int]) -> bool:
         """Validate node type."""
         if node_type not in NODE_TYPES:
-            self._add_error(path, ERROR_MESSAGES["invalid_node_type"].format(node_type), "error")
+            self._add_error(path, _invalid_node_type_message(node_type))
             return False
         return True
     
     def _validate_node_structure(self, node: Dict[str, Any], path: List[int]) -> bool:
         """Validate node structure based on type."""
+        all_valid = self._validate_node_fields(node, path)
+        
+        # Validate child content
+        if "content" in node:
+            if not self._validate_content_array(node["content"], path):
+                all_valid = False
+        
+        # Node-specific validation
+        if not self._validate_node_specific(node, path):
+            all_valid = False
+        
+        return all_valid
+    
+    def _validate_node_fields(self, node: Dict[str, Any], path: List[int]) -> bool:
+        """Validate a node's own attributes, marks and text."""
         node_type = node.get("type")
         
         all_valid = True
@@ -204,21 +315,12 @@ class ADFValidator:
             if not self._validate_text_content(node["text"], path):
                 all_valid = False
         
-        # Validate child content
-        if "content" in node:
-            if not self._validate_content_array(node["content"], path):
-                all_valid = False
-        
-        # Node-specific validation
-        if not self._validate_node_specific(node, path):
-            all_valid = False
-        
         return all_valid
     
     def _validate_attributes(self, attrs: Any, node_type: str, path: List[int]) -> bool:
         """Validate node attributes."""
         if not isinstance(attrs, dict):
-            self._add_error(path, "Attributes must be a dictionary", "error")
+            self._add_error(path, "Attributes must be a dictionary")
             return False
         
         if len(attrs) > MAX_ATTRS_PER_NODE:
@@ -230,28 +332,25 @@ class ADFValidator:
     def _validate_marks(self, marks: List[Any], path: List[int]) -> bool:
         """Validate formatting marks."""
         if not isinstance(marks, list):
-            self._add_error(path, "Marks must be an array", "error")
+            self._add_error(path, "Marks must be an array")
             return False
         
         for i, mark in enumerate(marks):
-            mark_path = path + [f"marks[{i}]"]
-            
             if not isinstance(mark, dict):
-                self._add_error(mark_path, "Mark must be a dictionary", "error")
+                self._add_error(path, f"marks[{i}]: Mark must be a dictionary")
                 return False
             
             mark_type = mark.get("type")
             if not mark_type:
-                self._add_error(mark_path, "Mark missing required 'type' field", "error")
+                self._add_error(path, f"marks[{i}]: Mark missing required 'type' field")
                 return False
             
             if mark_type not in MARK_TYPES:
-                self._add_error(mark_path, ERROR_MESSAGES["invalid_mark_type"].format(mark_type), "error")
+                self._add_error(path, f"marks[{i}]: {_invalid_mark_type_message(mark_type)}")
                 return False
             
             # Validate mark-specific attributes
-            mark_path_ints = [p for p in path if isinstance(p, int)]
-            if not self._validate_mark_attributes(mark, mark_path_ints):
+            if not self._validate_mark_attributes(mark, path):
                 return False
         
         return True
@@ -259,7 +358,7 @@ class ADFValidator:
     def _validate_text_content(self, text: Any, path: List[int]) -> bool:
         """Validate text content."""
         if not isinstance(text, str):
-            self._add_error(path, "Text content must be a string", "error")
+            self._add_error(path, "Text content must be a string")
             return False
         
         if len(text) > MAX_TEXT_LENGTH:
@@ -269,16 +368,9 @@ class ADFValidator:
     
     def _validate_node_specific(self, node: Dict[str, Any], path: List[int]) -> bool:
         """Validate node-specific requirements."""
-        node_type = node.get("type")
-        
-        if node_type == "heading":
-            return self._validate_heading_node(node, path)
-        elif node_type == "panel":
-            return self._validate_panel_node(node, path)
-        elif node_type == "table":
-            return self._validate_table_node(node, path)
-        elif node_type in ("extension", "bodiedExtension", "inlineExtension"):
-            return self._validate_extension_node(node, path)
+        validator = self._NODE_VALIDATORS.get(node.get("type", ""))
+        if validator:
+            return validator(self, node, path)
         
         return True
     
@@ -288,11 +380,11 @@ class ADFValidator:
         level = attrs.get("level")
         
         if level is None:
-            self._add_error(path, "Heading node missing required 'level' attribute", "error")
+            self._add_error(path, "Heading node missing required 'level' attribute")
             return False
         
         if not isinstance(level, int) or not (1 <= level <= 6):
-            self._add_error(path, "Heading level must be integer between 1 and 6", "error")
+            self._add_error(path, "Heading level must be integer between 1 and 6")
             return False
         
         return True
@@ -303,11 +395,11 @@ class ADFValidator:
         panel_type = attrs.get("panelType")
         
         if panel_type is None:
-            self._add_error(path, "Panel node missing required 'panelType' attribute", "error")
+            self._add_error(path, "Panel node missing required 'panelType' attribute")
             return False
         
         if panel_type not in PANEL_TYPES:
-            self._add_error(path, f"Invalid panel type: {panel_type}", "error")
+            self._add_error(path, f"Invalid panel type: {panel_type}")
             return False
         
         return True
@@ -323,20 +415,28 @@ class ADFValidator:
         # Check that all content are table rows
         for i, row in enumerate(content):
             if not isinstance(row, dict) or row.get("type") != "tableRow":
-                self._add_error(path + [i], "Table content must be tableRow nodes", "error")
+                self._add_error(path + [i], "Table content must be tableRow nodes")
                 return False
             
-            # Validate row content
-            row_content = row.get("content", [])
-            for j, cell in enumerate(row_content):
-                if not isinstance(cell, dict):
-                    self._add_error(path + [i, j], "Table cell must be dictionary", "error")
-                    return False
-                
-                cell_type = cell.get("type")
-                if cell_type not in ("tableCell", "tableHeader"):
-                    self._add_error(path + [i, j], f"Invalid table cell type: {cell_type}", "error")
-                    return False
+            # Well-formed cells pass a single combined check; the cell nodes
+            # themselves are validated by the main content walk
+            for cell in row.get("content", []):
+                if not isinstance(cell, dict) or cell.get("type") not in TABLE_CELL_TYPES:
+                    return self._report_table_cell_error(row["content"], path + [i])
+        
+        return True
+    
+    def _report_table_cell_error(self, cells: List[Any], row_path: List[int]) -> bool:
+        """Record an error for the first cell in a row that is not a table cell."""
+        for j, cell in enumerate(cells):
+            if not isinstance(cell, dict):
+                self._add_error(row_path + [j], "Table cell must be dictionary")
+                return False
+            
+            cell_type = cell.get("type")
+            if cell_type not in TABLE_CELL_TYPES:
+                self._add_error(row_path + [j], f"Invalid table cell type: {cell_type}")
+                return False
         
         return True
     
@@ -346,23 +446,37 @@ class ADFValidator:
         
         # Check required extension attributes
         if "extensionType" not in attrs:
-            self._add_error(path, "Extension missing required 'extensionType' attribute", "error")
+            self._add_error(path, "Extension missing required 'extensionType' attribute")
             return False
         
         if "extensionKey" not in attrs:
-            self._add_error(path, "Extension missing required 'extensionKey' attribute", "error")
+            self._add_error(path, "Extension missing required 'extensionKey' attribute")
             return False
         
         return True
     
+    # Node types with requirements beyond the common structure checks
+    _NODE_VALIDATORS = {
+        "heading": _validate_heading_node,
+        "panel": _validate_panel_node,
+        "table": _validate_table_node,
+        "extension": _validate_extension_node,
+        "bodiedExtension": _validate_extension_node,
+        "inlineExtension": _validate_extension_node
+    }
+    
     def _validate_node_specific_attrs(self, attrs: Dict[str, Any], node_type: str, path: List[int]) -> bool:
         """Validate node-specific attributes."""
+        # Most nodes carry no color attributes
+        if "backgroundColor" not in attrs and "textColor" not in attrs:
+            return True
+        
         # Color validation
         for color_attr in ("backgroundColor", "textColor"):
             if color_attr in attrs:
                 color_value = attrs[color_attr]
                 if not self._validate_color_value(color_value):
-                    self._add_error(path, ERROR_MESSAGES["invalid_color_value"].format(color_value), "error")
+                    self._add_error(path, _invalid_color_message(color_value))
                     return False
         
         return True
@@ -375,13 +489,13 @@ class ADFValidator:
         if mark_type == "textColor" or mark_type == "backgroundColor":
             color = attrs.get("color")
             if color and not self._validate_color_value(color):
-                self._add_error(path, f"Invalid color value: {color}", "error")
+                self._add_error(path, f"Invalid color value: {color}")
                 return False
         
         elif mark_type == "link":
             href = attrs.get("href")
             if not href:
-                self._add_error(path, "Link mark missing required 'href' attribute", "error")
+                self._add_error(path, "Link mark missing required 'href' attribute")
                 return False
         
         return True
@@ -393,31 +507,21 @@ class ADFValidator:
         
         # Check if it's a hex color
         if color.startswith('#'):
-            return len(color) in (4, 7) and all(c in '0123456789abcdefABCDEF' for c in color[1:])
+            return HEX_COLOR_PATTERN.fullmatch(color) is not None
         
         # Check if it's a named Confluence color
         return color in CONFLUENCE_COLORS
     
-    def _add_error(self, path: List[Any], message: str, severity: str) -> None:
+    def _add_error(self, path: List[int], message: str) -> None:
         """Add validation error."""
-        # Convert path to list of ints for compatibility
-        int_path = []
-        for item in path:
-            if isinstance(item, int):
-                int_path.append(item)
-        
-        error = ValidationError(
-            path=int_path,
-            message=message,
-            severity=severity if severity in ("error", "warning") else "error",  # type: ignore
-            node_type=None
-        )
-        
-        if severity == "error":
-            self.errors.append(error)
-        else:
-            self.warnings.append(error)
+        # Copy the path, since traversal keeps extending and trimming it
+        self._issue_paths.append(path[:])
+        self._issue_messages.append(message)
+        self._issue_is_warning.append(0)
+        self._error_count += 1
     
-    def _add_warning(self, path: List[Any], message: str) -> None:
+    def _add_warning(self, path: List[int], message: str) -> None:
         """Add validation warning."""
-        self._add_error(path, message, "warning")
+        self._issue_paths.append(path[:])
+        self._issue_messages.append(message)
+        self._issue_is_warning.append(1)
@@ -5,7 +5,11 @@ This module provides the updatePagePreservingFormatting functionality for modify
 Confluence page content in ADF format while maintaining all original formatting.
 """
 
+import json
 import logging
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union, Callable
 from copy import deepcopy
 
@@ -17,10 +21,45 @@ from .constants import NODE_TYPES
 
 logger = logging.getLogger("mcp-atlassian.adf.writer")
 
+# Upper bound on page requests in flight for each of fetching and writing
+MAX_CONCURRENT_PAGE_REQUESTS = 8
+
+
+def _clone_content(value: Any) -> Any:
+    """
+    Copy JSON-shaped operation content for one target element.
+    
+    Dicts and lists are rebuilt directly, which is several times faster than
+    deepcopy for ADF trees; anything else falls back to deepcopy.
+    
+    Args:
+        value: Content to copy
+        
+    Returns:
+        Independent copy of value
+    """
+    if isinstance(value, dict):
+        return {key: _clone_content(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_content(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return deepcopy(value)
+
 
 class UpdateOperation:
     """Represents a single update operation on an ADF element."""
     
+    __slots__ = (
+        "operation_type", "target_criteria", "new_content",
+        "preserve_attributes", "preserve_marks", "kwargs"
+    )
+    
+    _VALID_OPERATION_TYPES = frozenset({
+        "replace", "modify", "insert_before",
+        "insert_after", "delete", "update_text"
+    })
+    
     def __init__(
         self,
         operation_type: str,
@@ -49,14 +88,8 @@ class UpdateOperation:
         self.preserve_marks = preserve_marks
         self.kwargs = kwargs
         
-        # Define valid operation types locally
-        valid_operation_types = [
-            "replace", "modify", "insert_before", 
-            "insert_after", "delete", "update_text"
-        ]
-        
         # Validate operation type
-        if operation_type not in valid_operation_types:
+        if operation_type not in self._VALID_OPERATION_TYPES:
             raise ValueError(f"Unknown operation type: {operation_type}")
 
 
@@ -68,16 +101,30 @@ class ADFWriter:
     while preserving formatting and structure integrity.
     """
     
-    def __init__(self, confluence_client=None):
+    # Operations that keep every node's position and type, so elements found for
+    # one of them are still where the next operation would find them
+    _POSITION_PRESERVING_OPERATIONS = frozenset({"modify", "update_text"})
+    
+    # Criteria that depend only on node type and position
+    _SHAPE_CRITERIA_KEYS = frozenset({"node_type", "index"})
+    
+    # Modified keys that can change a node's type or add and remove descendants
+    _STRUCTURAL_MODIFICATION_KEYS = frozenset({"type", "content"})
+    
+    def __init__(self, confluence_client=None, backup_capacity: int = 16):
         """
         Initialize ADF writer.
         
         Args:
             confluence_client: Optional Confluence client instance
+            backup_capacity: Maximum number of backups kept; the least recently
+                used backup is evicted first
         """
         self.confluence_client = confluence_client
         self.validator = ADFValidator()
-        self.backup_documents: Dict[str, ADFDocument] = {}
+        self.backup_capacity = backup_capacity
+        # Backups are kept pickled and only turned back into documents on restore
+        self.backup_documents: OrderedDict[str, bytes] = OrderedDict()
     
     def update_page_preserving_formatting(
         self,
@@ -110,6 +157,8 @@ class ADFWriter:
             - applied_operations: List of successfully applied operations
             - validation_result: Structure validation results
             - backup_id: Backup identifier if created
+            - skipped: True if no operation changed the page, in which case no
+              update was sent and updated_page is the current page
             
         Raises:
             ValueError: If operations are invalid or client not configured
@@ -126,13 +175,7 @@ class ADFWriter:
         
         logger.info(f"Updating page {page_id} with {len(operations)} operations")
         
-        # Convert dict operations to UpdateOperation objects
-        processed_operations = []
-        for op in operations:
-            if isinstance(op, dict):
-                processed_operations.append(UpdateOperation(**op))
-            else:
-                processed_operations.append(op)
+        processed_operations = self._to_update_operations(operations)
         
         retry_count = 0
         last_error = None
@@ -143,82 +186,28 @@ class ADFWriter:
                 logger.debug(f"Retrieving current page {page_id} (attempt {retry_count + 1})")
                 current_page = self.confluence_client.get_page_adf(page_id)
                 
-                # Step 2: Parse into ADF document
-                adf_document = self._parse_page_to_adf(current_page)
-                
-                # Step 3: Create backup if requested
-                backup_id = None
-                if create_backup:
-                    backup_id = self._create_backup(page_id, adf_document)
-                
-                # Step 4: Apply operations sequentially
-                applied_operations = []
-                for i, operation in enumerate(processed_operations):
-                    try:
-                        logger.debug(f"Applying operation {i + 1}/{len(processed_operations)}: {operation.operation_type}")
-                        success = self._apply_operation(adf_document, operation)
-                        if success:
-                            applied_operations.append({
-                                "index": i,
-                                "operation_type": operation.operation_type,
-                                "target_criteria": operation.target_criteria,
-                                "success": True
-                            })
-                        else:
-                            applied_operations.append({
-                                "index": i,
-                                "operation_type": operation.operation_type,
-                                "target_criteria": operation.target_criteria,
-                                "success": False,
-                                "reason": "No matching elements found"
-                            })
-                    except Exception as e:
-                        logger.warning(f"Operation {i + 1} failed: {e}")
-                        applied_operations.append({
-                            "index": i,
-                            "operation_type": operation.operation_type,
-                            "target_criteria": operation.target_criteria,
-                            "success": False,
-                            "reason": str(e)
-                        })
+                # Steps 2-5: Parse, back up, apply operations and validate
+                prepared = self._prepare_page_update(
+                    page_id,
+                    current_page,
+                    processed_operations,
+                    validate_before_update=validate_before_update,
+                    create_backup=create_backup
+                )
                 
-                # Step 5: Validate resulting ADF structure
-                validation_result = None
-                if validate_before_update:
-                    validation_result = self.validator.validate_document(adf_document.to_dict())
-                    if isinstance(validation_result, bool):
-                        if not validation_result:
-                            logger.error("ADF validation failed after applying operations")
-                    elif isinstance(validation_result, dict) and not validation_result.get("is_valid", False):
-                        logger.error("ADF validation failed after applying operations")
-                        logger.error("ADF validation failed after applying operations")
-                        if create_backup:
-                            self._restore_from_backup(backup_id)
-                        raise ValueError("Invalid ADF structure after operations")
+                # Step 6: Update page via API, unless nothing changed
+                if not prepared["changed"]:
+                    logger.info(f"No changes for page {page_id}, skipping update")
+                    return self._build_update_result(page_id, current_page, prepared, retry_count)
                 
-                # Step 6: Update page via API
-                version_number = current_page.get('version', {}).get('number')
                 updated_page = self.confluence_client.update_page_adf(
                     page_id,
-                    {
-                        "title": current_page.get("title", "Updated Page"),
-                        "body": adf_document.to_dict()
-                    },
-                    version_number
+                    prepared["payload"],
+                    prepared["version_number"]
                 )
                 
                 logger.info(f"Successfully updated page {page_id}")
-                return {
-                    "success": True,
-                    "page_id": page_id,
-                    "updated_page": updated_page,
-                    "applied_operations": applied_operations,
-                    "operations_count": len(applied_operations),
-                    "successful_operations": sum(1 for op in applied_operations if op["success"]),
-                    "validation_result": validation_result,
-                    "backup_id": backup_id,
-                    "retry_count": retry_count
-                }
+                return self._build_update_result(page_id, updated_page, prepared, retry_count)
                 
             except ValueError as e:
                 # Version conflict or validation error - retry if enabled  
@@ -240,6 +229,296 @@ class ADFWriter:
         # Max retries exceeded
         raise RuntimeError(f"Page update failed after {max_retries} retries: {last_error}")
     
+    def update_pages_preserving_formatting(
+        self,
+        page_operations: Dict[str, List[Union[UpdateOperation, Dict[str, Any]]]],
+        *,
+        validate_before_update: bool = True,
+        create_backup: bool = True,
+        auto_retry_on_conflict: bool = True,
+        max_retries: int = 3,
+        max_concurrent_requests: int = MAX_CONCURRENT_PAGE_REQUESTS
+    ) -> List[Dict[str, Any]]:
+        """
+        Update several Confluence pages with formatting preservation.
+        
+        Page fetches and page writes run on bounded thread pools while this
+        thread parses, edits and validates the pages that have already arrived,
+        so network latency overlaps with document processing. Pages whose write
+        hits a version conflict are retried one at a time through
+        update_page_preserving_formatting.
+        
+        Args:
+            page_operations: Update operations to apply, keyed by page ID
+            validate_before_update: Whether to validate ADF before sending
+            create_backup: Whether to create backups before updating
+            auto_retry_on_conflict: Whether to retry on version conflicts
+            max_retries: Maximum number of retry attempts per page
+            max_concurrent_requests: Maximum number of fetches, and of writes, in flight
+            
+        Returns:
+            List of results in the order of page_operations, each shaped like
+            the result of update_page_preserving_formatting
+            
+        Raises:
+            ValueError: If page IDs or operations are invalid or client not configured
+            RuntimeError: If any page update fails; pages written before the
+                failure stay updated
+        """
+        if not page_operations or not all(page_id and isinstance(page_id, str) for page_id in page_operations):
+            raise ValueError("Valid page_ids are required")
+        
+        if not all(page_operations.values()):
+            raise ValueError("At least one operation is required for every page")
+        
+        if not self.confluence_client:
+            raise ValueError("Confluence client is required for page updates")
+        
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        
+        logger.info(f"Updating {len(page_operations)} pages")
+        
+        page_ids = list(page_operations)
+        processed = [self._to_update_operations(page_operations[page_id]) for page_id in page_ids]
+        
+        results = []
+        workers = min(max_concurrent_requests, len(page_ids))
+        with ThreadPoolExecutor(max_workers=workers) as fetch_executor, \
+                ThreadPoolExecutor(max_workers=workers) as write_executor:
+            fetches = [
+                fetch_executor.submit(self.confluence_client.get_page_adf, page_id)
+                for page_id in page_ids
+            ]
+            writes = []
+            try:
+                # Documents are only touched on this thread, so writer state is never shared
+                prepared_updates = []
+                for page_id, operations, fetch in zip(page_ids, processed, fetches):
+                    try:
+                        current_page = fetch.result()
+                        prepared = self._prepare_page_update(
+                            page_id,
+                            current_page,
+                            operations,
+                            validate_before_update=validate_before_update,
+                            create_backup=create_backup
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to update page {page_id}: {e}")
+                        raise RuntimeError(f"Page update failed for {page_id}: {e}") from e
+                    prepared_updates.append((current_page, prepared))
+                    if not prepared["changed"]:
+                        continue
+                    writes.append(write_executor.submit(
+                        self.confluence_client.update_page_adf,
+                        page_id,
+                        prepared["payload"],
+                        prepared["version_number"]
+                    ))
+                
+                pending_writes = iter(writes)
+                for page_id, operations, (current_page, prepared) in zip(page_ids, processed, prepared_updates):
+                    if not prepared["changed"]:
+                        logger.info(f"No changes for page {page_id}, skipping update")
+                        results.append(self._build_update_result(page_id, current_page, prepared, 0))
+                        continue
+                    try:
+                        updated_page = next(pending_writes).result()
+                    except ValueError as e:
+                        if "conflict" not in str(e).lower() or not auto_retry_on_conflict or max_retries < 1:
+                            raise RuntimeError(f"Page update failed for {page_id}: {e}") from e
+                        logger.warning(f"Version conflict detected for page {page_id}, retrying")
+                        result = self.update_page_preserving_formatting(
+                            page_id,
+                            operations,
+                            validate_before_update=validate_before_update,
+                            create_backup=create_backup,
+                            auto_retry_on_conflict=auto_retry_on_conflict,
+                            max_retries=max_retries - 1
+                        )
+                        result["retry_count"] += 1
+                        results.append(result)
+                        continue
+                    except Exception as e:
+                        logger.error(f"Failed to update page {page_id}: {e}")
+                        raise RuntimeError(f"Page update failed for {page_id}: {e}") from e
+                    
+                    logger.info(f"Successfully updated page {page_id}")
+                    results.append(self._build_update_result(page_id, updated_page, prepared, 0))
+            finally:
+                for future in fetches + writes:
+                    future.cancel()
+        
+        return results
+    
+    @staticmethod
+    def _to_update_operations(operations: List[Union[UpdateOperation, Dict[str, Any]]]) -> List[UpdateOperation]:
+        """Convert dict operations to UpdateOperation objects."""
+        return [UpdateOperation(**op) if isinstance(op, dict) else op for op in operations]
+    
+    def _prepare_page_update(
+        self,
+        page_id: str,
+        current_page: Dict[str, Any],
+        operations: List[UpdateOperation],
+        *,
+        validate_before_update: bool,
+        create_backup: bool
+    ) -> Dict[str, Any]:
+        """
+        Build the updated page body for a fetched page.
+        
+        Args:
+            page_id: ID of the page being updated
+            current_page: Page data as returned by get_page_adf
+            operations: Operations to apply
+            validate_before_update: Whether to validate ADF before sending
+            create_backup: Whether to create backup before updating
+            
+        Returns:
+            Dictionary with the update payload, the page version it is based on,
+            the applied operations, the validation result, the backup ID and
+            whether any operation changed the document
+            
+        Raises:
+            ValueError: If the edited document fails validation
+        """
+        # Step 2: Parse into ADF document
+        adf_document = self._parse_page_to_adf(current_page)
+        
+        # Step 3: Create backup if requested
+        backup_id = None
+        if create_backup:
+            backup_id = self._create_backup(page_id, adf_document)
+        
+        # Step 4: Apply operations in order, sharing searches where safe
+        version_before = adf_document._mutation_version
+        applied_operations = self._apply_operations_batched(adf_document, operations)
+        
+        # Step 5: Validate resulting ADF structure
+        # Serialize once; the same dict is validated and sent
+        updated_body = adf_document.to_dict()
+        validation_result = None
+        if validate_before_update:
+            validation_result = self.validator.validate_document(updated_body)
+            if isinstance(validation_result, bool):
+                if not validation_result:
+                    logger.error("ADF validation failed after applying operations")
+            elif isinstance(validation_result, dict) and not validation_result.get("is_valid", False):
+                logger.error("ADF validation failed after applying operations")
+                logger.error("ADF validation failed after applying operations")
+                if create_backup:
+                    self._restore_from_backup(backup_id)
+                raise ValueError("Invalid ADF structure after operations")
+        
+        return {
+            "payload": {
+                "title": current_page.get("title", "Updated Page"),
+                "body": updated_body
+            },
+            "version_number": current_page.get('version', {}).get('number'),
+            "applied_operations": applied_operations,
+            "validation_result": validation_result,
+            "backup_id": backup_id,
+            # Every edit bumps the mutation version, so an unchanged version means an unchanged page
+            "changed": adf_document._mutation_version != version_before
+        }
+    
+    @staticmethod
+    def _build_update_result(
+        page_id: str,
+        updated_page: Dict[str, Any],
+        prepared: Dict[str, Any],
+        retry_count: int
+    ) -> Dict[str, Any]:
+        """Build the result of a successful page update, or of one skipped because nothing changed."""
+        applied_operations = prepared["applied_operations"]
+        return {
+            "success": True,
+            "page_id": page_id,
+            "updated_page": updated_page,
+            "applied_operations": applied_operations,
+            "operations_count": len(applied_operations),
+            "successful_operations": sum(1 for op in applied_operations if op["success"]),
+            "validation_result": prepared["validation_result"],
+            "backup_id": prepared["backup_id"],
+            "retry_count": retry_count,
+            "skipped": not prepared["changed"]
+        }
+    
+    def _apply_operations_batched(
+        self,
+        adf_document: ADFDocument,
+        operations: List[UpdateOperation]
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply operations in order, searching once per run of operations that share targets.
+        
+        Consecutive operations with identical criteria reuse the elements found for the
+        first of them as long as the earlier operations cannot change what those criteria
+        match (see _shares_targets).
+        
+        Args:
+            adf_document: Document to modify
+            operations: Operations to apply, in order
+            
+        Returns:
+            One result entry per operation, in the original order
+        """
+        applied_operations: List[Dict[str, Any]] = []
+        target_elements = None
+        # Checked once so disabled debug logging costs nothing per operation
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        for i, operation in enumerate(operations):
+            try:
+                if debug_enabled:
+                    logger.debug(f"Applying operation {i + 1}/{len(operations)}: {operation.operation_type}")
+                if target_elements is None:
+                    target_elements = self._find_target_elements(adf_document, operation)
+                success = self._apply_to_elements(adf_document, target_elements, operation)
+                if success:
+                    applied_operations.append({
+                        "index": i,
+                        "operation_type": operation.operation_type,
+                        "target_criteria": operation.target_criteria,
+                        "success": True
+                    })
+                else:
+                    applied_operations.append({
+                        "index": i,
+                        "operation_type": operation.operation_type,
+                        "target_criteria": operation.target_criteria,
+                        "success": False,
+                        "reason": "No matching elements found"
+                    })
+            except Exception as e:
+                logger.warning(f"Operation {i + 1} failed: {e}")
+                applied_operations.append({
+                    "index": i,
+                    "operation_type": operation.operation_type,
+                    "target_criteria": operation.target_criteria,
+                    "success": False,
+                    "reason": str(e)
+                })
+            
+            if i + 1 < len(operations) and not self._shares_targets(operation, operations[i + 1]):
+                target_elements = None
+        
+        return applied_operations
+    
+    @classmethod
+    def _shares_targets(cls, operation: UpdateOperation, next_operation: UpdateOperation) -> bool:
+        """Check whether elements found for operation are still the targets of next_operation."""
+        if operation.target_criteria != next_operation.target_criteria:
+            return False
+        if operation.operation_type not in cls._POSITION_PRESERVING_OPERATIONS:
+            return False
+        if not cls._STRUCTURAL_MODIFICATION_KEYS.isdisjoint(operation.kwargs.get("modifications", {})):
+            return False
+        return set(operation.target_criteria) <= cls._SHAPE_CRITERIA_KEYS
+    
     def _apply_operation(self, adf_document: ADFDocument, operation: UpdateOperation) -> bool:
         """
         Apply a single update operation to the ADF document.
@@ -251,47 +530,72 @@ class ADFWriter:
         Returns:
             True if operation was applied, False if no matches found
         """
-        # Find target elements
-        target_elements = find_element_in_adf(
+        target_elements = self._find_target_elements(adf_document, operation)
+        return self._apply_to_elements(adf_document, target_elements, operation)
+    
+    def _find_target_elements(self, adf_document: ADFDocument, operation: UpdateOperation) -> List[Any]:
+        """Find all elements matching the operation's target criteria."""
+        return find_element_in_adf(
             adf_document,
             operation.target_criteria,
             limit=None,  # Apply to all matching elements
             include_context=True
         )
+    
+    def _apply_to_elements(
+        self,
+        adf_document: ADFDocument,
+        target_elements: List[Any],
+        operation: UpdateOperation
+    ) -> bool:
+        """
+        Apply an operation to elements that were already found.
+        
+        Args:
+            adf_document: Document to modify
+            target_elements: Search results for the operation's target criteria
+            operation: Operation to apply
+            
+        Returns:
+            True if operation was applied, False if no matches found
+        """
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         if not target_elements:
-            logger.debug(f"No elements found matching criteria: {operation.target_criteria}")
+            if debug_enabled:
+                logger.debug(f"No elements found matching criteria: {operation.target_criteria}")
             return False
         
-        logger.debug(f"Found {len(target_elements)} matching elements for {operation.operation_type}")
+        if debug_enabled:
+            logger.debug(f"Found {len(target_elements)} matching elements for {operation.operation_type}")
         
         # Apply operation based on type
+        handler = self._OPERATION_HANDLERS.get(operation.operation_type)
+        if handler is None:
+            logger.warning(f"Unknown operation type: {operation.operation_type}")
+            return False
+        
         applied_count = 0
         
-        for element_result in target_elements:
+        # Work from the last path backwards: an edit only shifts the paths of later
+        # siblings and their descendants, so every remaining path stays valid
+        for element_result in sorted(target_elements, key=self._result_path, reverse=True):
             try:
-                if operation.operation_type == "replace":
-                    applied_count += self._apply_replace_operation(adf_document, element_result, operation)
-                elif operation.operation_type == "modify":
-                    applied_count += self._apply_modify_operation(adf_document, element_result, operation)
-                elif operation.operation_type == "insert_before":
-                    applied_count += self._apply_insert_before_operation(adf_document, element_result, operation)
-                elif operation.operation_type == "insert_after":
-                    applied_count += self._apply_insert_after_operation(adf_document, element_result, operation)
-                elif operation.operation_type == "delete":
-                    applied_count += self._apply_delete_operation(adf_document, element_result, operation)
-                elif operation.operation_type == "update_text":
-                    applied_count += self._apply_update_text_operation(adf_document, element_result, operation)
-                else:
-                    logger.warning(f"Unknown operation type: {operation.operation_type}")
-                    
+                applied_count += handler(self, adf_document, element_result, operation)
             except Exception as e:
                 logger.warning(f"Failed to apply operation to element at {element_result['path']}: {e}")
                 continue
         
-        logger.debug(f"Applied {operation.operation_type} operation to {applied_count} elements")
+        if debug_enabled:
+            logger.debug(f"Applied {operation.operation_type} operation to {applied_count} elements")
         return applied_count > 0
     
+    @staticmethod
+    def _result_path(element_result: Dict[str, Any]) -> List[int]:
+        """Get the path of a search result for ordering."""
+        path: List[int] = element_result["path"]["path"]
+        return path
+    
     def _apply_replace_operation(
         self,
         adf_document: ADFDocument,
@@ -303,27 +607,21 @@ class ADFWriter:
         original_element = element_result["node"]
         
         # Create new element with preserved attributes if requested
-        new_element = deepcopy(operation.new_content)
+        new_element = _clone_content(operation.new_content)
         
         if operation.preserve_attributes and isinstance(original_element, dict):
-            original_attrs = original_element.get("attrs", {})
+            original_attrs = original_element.get("attrs")
             if original_attrs and isinstance(new_element, dict):
-                if "attrs" not in new_element:
-                    new_element["attrs"] = {}
                 # Merge attributes, new ones take precedence
-                merged_attrs = {**original_attrs, **new_element.get("attrs", {})}
-                new_element["attrs"] = merged_attrs
+                new_element["attrs"] = original_attrs | (new_element.get("attrs") or {})
         
         if operation.preserve_marks and isinstance(original_element, dict):
-            original_marks = original_element.get("marks", [])
+            original_marks = original_element.get("marks")
             if original_marks and isinstance(new_element, dict) and new_element.get("type") == "text":
-                if "marks" not in new_element:
-                    new_element["marks"] = []
+                marks = new_element.setdefault("marks", [])
                 # Merge marks, avoiding duplicates
-                existing_mark_types = {mark.get("type") for mark in new_element.get("marks", [])}
-                for mark in original_marks:
-                    if mark.get("type") not in existing_mark_types:
-                        new_element["marks"].append(mark)
+                existing_mark_types = {mark.get("type") for mark in marks}
+                marks.extend(mark for mark in original_marks if mark.get("type") not in existing_mark_types)
         
         # Replace element in document
         success = adf_document._replace_element_at_path(path, new_element)
@@ -346,12 +644,14 @@ class ADFWriter:
         # Apply modifications
         modifications = operation.kwargs.get("modifications", {})
         
-        for key, value in modifications.items():
-            if hasattr(current_element, key):
-                setattr(current_element, key, value)
-            elif isinstance(current_element, dict):
-                current_element[key] = value
+        if isinstance(current_element, dict):
+            current_element.update(modifications)
+        else:
+            for key, value in modifications.items():
+                if hasattr(current_element, key):
+                    setattr(current_element, key, value)
         
+        adf_document._mark_modified()
         return 1
     
     def _apply_insert_before_operation(
@@ -425,7 +725,8 @@ class ADFWriter:
         if not element:
             return 0
         
-        element_type = getattr(element, 'type', None) or (element.get('type') if isinstance(element, dict) else None)
+        is_dict = isinstance(element, dict)
+        element_type = element.get('type') if is_dict else getattr(element, 'type', None)
         
         if element_type != "text":
             logger.warning(f"Cannot update text of non-text element: {element_type}")
@@ -433,13 +734,24 @@ class ADFWriter:
         
         # Update text while preserving marks
         new_text = operation.new_content
-        if isinstance(element, dict):
+        if is_dict:
             element["text"] = new_text
         else:
             element.text = new_text
         
+        adf_document._mark_modified()
         return 1
     
+    # Handler for each operation type, applied to one matched element
+    _OPERATION_HANDLERS = {
+        "replace": _apply_replace_operation,
+        "modify": _apply_modify_operation,
+        "insert_before": _apply_insert_before_operation,
+        "insert_after": _apply_insert_after_operation,
+        "delete": _apply_delete_operation,
+        "update_text": _apply_update_text_operation
+    }
+    
     def _parse_page_to_adf(self, page_data: Dict[str, Any]) -> ADFDocument:
         """Parse page data to ADF document."""
         # Extract ADF content
@@ -450,6 +762,9 @@ class ADFWriter:
             if isinstance(body, dict):
                 if "atlas_doc_format" in body:
                     adf_content = body["atlas_doc_format"]
+                    # API v2 wraps the document as {"representation": ..., "value": ...}
+                    if isinstance(adf_content, dict) and "type" not in adf_content and "value" in adf_content:
+                        adf_content = adf_content["value"]
                 elif "representation" in body and body["representation"] == "atlas_doc_format":
                     adf_content = body.get("value", body)
                 elif "value" in body:
@@ -457,6 +772,10 @@ class ADFWriter:
             else:
                 adf_content = body
         
+        # API v2 delivers the document serialized as a JSON string
+        if isinstance(adf_content, (str, bytes)):
+            adf_content = json.loads(adf_content)
+        
         # If no ADF content found, try to extract from root
         if adf_content is None:
             if "version" in page_data and "type" in page_data and "content" in page_data:
@@ -465,20 +784,27 @@ class ADFWriter:
                 logger.warning("No ADF content found in page data")
                 adf_content = {"version": 1, "type": "doc", "content": []}
         
-        return ADFDocument.from_dict(adf_content)
+        # The writer edits by path and never reads the element map, so skip building it
+        return ADFDocument.from_dict(adf_content, build_element_map=False)
     
     def _create_backup(self, page_id: str, adf_document: ADFDocument) -> str:
         """Create backup of ADF document."""
         backup_id = f"backup_{page_id}_{int(__import__('time').time())}"
-        self.backup_documents[backup_id] = deepcopy(adf_document)
-        logger.debug(f"Created backup {backup_id} for page {page_id}")
+        backup = pickle.dumps(adf_document.to_dict(), protocol=pickle.HIGHEST_PROTOCOL)
+        self.backup_documents[backup_id] = backup
+        self.backup_documents.move_to_end(backup_id)
+        while len(self.backup_documents) > self.backup_capacity:
+            evicted_id, _ = self.backup_documents.popitem(last=False)
+            logger.debug(f"Evicted backup {evicted_id}")
+        logger.debug(f"Created backup {backup_id} for page {page_id} ({len(backup)} bytes)")
         return backup_id
     
     def _restore_from_backup(self, backup_id: str) -> Optional[ADFDocument]:
         """Restore ADF document from backup."""
         if backup_id in self.backup_documents:
             logger.info(f"Restoring from backup {backup_id}")
-            return deepcopy(self.backup_documents[backup_id])
+            self.backup_documents.move_to_end(backup_id)
+            return ADFDocument.from_dict(pickle.loads(self.backup_documents[backup_id]))
         else:
             logger.warning(f"Backup {backup_id} not found")
             return None
@@ -527,3 +853,39 @@ def update_page_preserving_formatting(
         auto_retry_on_conflict=auto_retry_on_conflict,
         max_retries=max_retries
     )
+
+
+def update_pages_preserving_formatting(
+    confluence_client,
+    page_operations: Dict[str, List[Union[UpdateOperation, Dict[str, Any]]]],
+    *,
+    validate_before_update: bool = True,
+    create_backup: bool = True,
+    auto_retry_on_conflict: bool = True,
+    max_retries: int = 3,
+    max_concurrent_requests: int = MAX_CONCURRENT_PAGE_REQUESTS
+) -> List[Dict[str, Any]]:
+    """
+    Convenience function to update several pages with formatting preservation.
+    
+    Args:
+        confluence_client: Confluence client instance
+        page_operations: Update operations to apply, keyed by page ID
+        validate_before_update: Whether to validate before updating
+        create_backup: Whether to create backups
+        auto_retry_on_conflict: Whether to auto-retry on conflicts
+        max_retries: Maximum retry attempts per page
+        max_concurrent_requests: Maximum number of fetches, and of writes, in flight
+        
+    Returns:
+        Update result for each page, in the order of page_operations
+    """
+    writer = ADFWriter(confluence_client)
+    return writer.update_pages_preserving_formatting(
+        page_operations,
+        validate_before_update=validate_before_update,
+        create_backup=create_backup,
+        auto_retry_on_conflict=auto_retry_on_conflict,
+        max_retries=max_retries,
+        max_concurrent_requests=max_concurrent_requests
+    )
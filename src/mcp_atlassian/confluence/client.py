@@ -1,14 +1,25 @@
 """Base client module for Confluence API interactions."""
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
-from typing import Dict, Any, Optional
+import threading
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, Any, List, Optional, TypeVar
 
 from atlassian import Confluence
+from cachetools import TTLCache
 from requests import Session, Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import requests
 
 from ..exceptions import MCPAtlassianAuthenticationError
+from ..utils.env import is_env_truthy
 from ..utils.logging import get_masked_session_headers, log_config_param, mask_sensitive
 from ..utils.oauth import configure_oauth_session
 from ..utils.ssl import configure_ssl_verification
@@ -17,10 +28,45 @@ from .config import ConfluenceConfig
 # Configure logging
 logger = logging.getLogger("mcp-atlassian")
 
+# Largest number of ids the v2 pages endpoint accepts in one request
+MAX_PAGES_PER_REQUEST = 250
+
+# Hashes of credentials that passed _validate_authentication in this process
+_VALIDATED_CREDENTIALS: set[str] = set()
+
+T = TypeVar("T")
+
+
+async def gather_with_concurrency(
+    limit: int, *coros: Awaitable[T]
+) -> list[T]:
+    """Await coroutines concurrently, keeping at most ``limit`` in flight.
+
+    Args:
+        limit: Maximum number of coroutines running at the same time
+        *coros: Coroutines to await, e.g. from get_page_adf_async
+
+    Returns:
+        The results in the same order as the coroutines
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coro
+
+    return list(await asyncio.gather(*(run(coro) for coro in coros)))
+
 
 class ConfluenceClient:
     """Base client for Confluence API interactions."""
 
+    # ETag and raw body of recent ADF page responses, keyed by (pages URL,
+    # page ID) and shared by all clients. A hit is only served after the
+    # server answers 304 to this client's own credentials.
+    _adf_page_cache: TTLCache[tuple[str, str], tuple[str, bytes]] = TTLCache(maxsize=256, ttl=60)
+    _adf_page_cache_lock = threading.Lock()
+
     def __init__(self, config: ConfluenceConfig | None = None) -> None:
         """Initialize the Confluence client with given or environment config.
 
@@ -90,6 +136,10 @@ class ConfluenceClient:
                 f"{get_masked_session_headers(dict(self.confluence._session.headers))}"
             )
 
+        # Size the connection pool for concurrent tool calls. Mounted before the
+        # SSL configuration so a host-specific SSL adapter still takes precedence.
+        self._configure_connection_pool()
+
         # Configure SSL verification using the shared utility
         configure_ssl_verification(
             service_name="Confluence",
@@ -125,16 +175,38 @@ class ConfluenceClient:
 
         self.preprocessor = ConfluencePreprocessor(base_url=self.config.url)
 
-        # Test authentication during initialization (in debug mode only)
-        if logger.isEnabledFor(logging.DEBUG):
+        # Test authentication during initialization. This costs a REST round-trip,
+        # so it only runs when requested and once per set of credentials.
+        credentials_hash = self._credentials_hash()
+        if (
+            is_env_truthy("MCP_ATLASSIAN_VALIDATE_AUTH")
+            and credentials_hash not in _VALIDATED_CREDENTIALS
+        ):
             try:
                 self._validate_authentication()
+                _VALIDATED_CREDENTIALS.add(credentials_hash)
             except MCPAtlassianAuthenticationError:
                 logger.warning(
                     "Authentication validation failed during client initialization - "
                     "continuing anyway"
                 )
 
+    def _credentials_hash(self) -> str:
+        """Return a short digest identifying this client's URL and credentials."""
+        oauth_config = self.config.oauth_config
+        parts = (
+            self.config.url,
+            self.config.auth_type,
+            self.config.username,
+            self.config.api_token,
+            self.config.personal_token,
+            oauth_config.cloud_id if oauth_config else None,
+            oauth_config.access_token if oauth_config else None,
+        )
+        return hashlib.blake2s(
+            "|".join(str(part) for part in parts).encode(), digest_size=16
+        ).hexdigest()
+
     def _validate_authentication(self) -> None:
         """Validate authentication by making a simple API call."""
         try:
@@ -162,6 +234,27 @@ class ConfluenceClient:
             )
             raise MCPAtlassianAuthenticationError(error_msg) from e
 
+    def _configure_connection_pool(self) -> None:
+        """Mount a pooled, retrying HTTP adapter on the Confluence session."""
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.confluence._session.mount("https://", adapter)
+        self.confluence._session.mount("http://", adapter)
+        logger.debug(
+            f"Confluence connection pool configured "
+            f"(pool_connections={self.config.pool_connections}, "
+            f"pool_maxsize={self.config.pool_maxsize})"
+        )
+
     def _apply_custom_headers(self) -> None:
         """Apply custom headers to the Confluence session."""
         if not self.config.custom_headers:
@@ -190,6 +283,16 @@ class ConfluenceClient:
             html_content, space_key, self.confluence
         )
     
+    @cached_property
+    def _uses_v2_api(self) -> bool:
+        """Whether ADF requests go through the OAuth API v2 gateway."""
+        return self.config.auth_type == "oauth" and hasattr(self.confluence, '_session')
+    
+    @cached_property
+    def _v2_pages_url(self) -> str:
+        """Base URL of the API v2 pages endpoint for this site."""
+        return f"https://api.atlassian.com/ex/confluence/{self.config.oauth_config.cloud_id}/wiki/api/v2/pages"
+    
     def get_page_adf(self, page_id: str) -> Dict[str, Any]:
         """
         Get page content in ADF (Atlassian Document Format) using API v2.
@@ -209,21 +312,30 @@ class ConfluenceClient:
             return self._get_page_storage_format(page_id)
         
         try:
-            if self.config.auth_type == "oauth" and hasattr(self.confluence, '_session'):
+            if self._uses_v2_api:
                 # Use API v2 endpoint for ADF content
-                api_url = f"https://api.atlassian.com/ex/confluence/{self.config.oauth_config.cloud_id}/wiki/api/v2/pages/{page_id}"
+                api_url = f"{self._v2_pages_url}/{page_id}"
                 
+                cached = self._get_cached_page_adf(page_id)
                 response = self.confluence._session.get(
                     api_url,
-                    params={"body-format": "atlas_doc_format"}
+                    params={"body-format": "atlas_doc_format"},
+                    headers={"If-None-Match": cached[0]} if cached else None
                 )
                 
+                if response.status_code == 304 and cached:
+                    logger.debug(f"Page {page_id} not modified, reusing cached ADF response")
+                    return json.loads(cached[1])
+                
                 if response.status_code == 401:
                     raise MCPAtlassianAuthenticationError("Confluence API authentication failed")
                 elif response.status_code == 403:
                     raise MCPAtlassianAuthenticationError("Confluence API access forbidden - check permissions")
                 
                 response.raise_for_status()
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._cache_page_adf(page_id, etag, response.content)
                 return response.json()
             else:
                 logger.warning("ADF format may not be available with basic auth, attempting fallback")
@@ -238,6 +350,75 @@ class ConfluenceClient:
             logger.info("Falling back to storage format")
             return self._get_page_storage_format(page_id)
     
+    def get_pages_adf(self, page_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several pages in ADF with one API v2 request per 250 pages.
+        
+        Chunks are requested concurrently. Server/datacenter, non-OAuth
+        configurations and chunks whose list request fails fall back to
+        get_page_adf for each page.
+        
+        Args:
+            page_ids: Page IDs to retrieve
+            
+        Returns:
+            Page data keyed by page ID in request order. Pages the API does
+            not return (e.g. deleted or not visible) are omitted.
+            
+        Raises:
+            MCPAtlassianAuthenticationError: If API call fails due to auth issues
+        """
+        unique_ids = list(dict.fromkeys(page_ids))
+        if not unique_ids:
+            return {}
+        
+        if not (self.config.is_cloud and self._uses_v2_api):
+            return {page_id: self.get_page_adf(page_id) for page_id in unique_ids}
+        
+        chunks = [
+            unique_ids[start:start + MAX_PAGES_PER_REQUEST]
+            for start in range(0, len(unique_ids), MAX_PAGES_PER_REQUEST)
+        ]
+        if len(chunks) == 1:
+            pages = self._get_pages_adf_chunk(chunks[0])
+        else:
+            pages = {}
+            with ThreadPoolExecutor(max_workers=min(len(chunks), 8)) as executor:
+                for chunk_pages in executor.map(self._get_pages_adf_chunk, chunks):
+                    pages.update(chunk_pages)
+        
+        return {page_id: pages[page_id] for page_id in unique_ids if page_id in pages}
+    
+    def _get_pages_adf_chunk(self, page_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get up to MAX_PAGES_PER_REQUEST pages with a single list request.
+        
+        Args:
+            page_ids: Page IDs to retrieve
+            
+        Returns:
+            Page data keyed by page ID
+        """
+        params = [("id", page_id) for page_id in page_ids]
+        params += [("body-format", "atlas_doc_format"), ("limit", str(len(page_ids)))]
+        
+        try:
+            response = self.confluence._session.get(self._v2_pages_url, params=params)
+            
+            if response.status_code == 401:
+                raise MCPAtlassianAuthenticationError("Confluence API authentication failed")
+            elif response.status_code == 403:
+                raise MCPAtlassianAuthenticationError("Confluence API access forbidden - check permissions")
+            
+            response.raise_for_status()
+            return {str(page["id"]): page for page in response.json().get("results", [])}
+        except MCPAtlassianAuthenticationError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get {len(page_ids)} pages in one request: {e}")
+            logger.info("Falling back to fetching pages one at a time")
+            return {page_id: self.get_page_adf(page_id) for page_id in page_ids}
+    
     def update_page_adf(self, page_id: str, adf_content: Dict[str, Any], version_number: Optional[int] = None) -> Dict[str, Any]:
         """
         Update page content using ADF (Atlassian Document Format) via API v2.
@@ -259,10 +440,9 @@ class ConfluenceClient:
             return self._update_page_storage_format(page_id, adf_content, version_number)
         
         try:
-            # Get current page info if version not provided
+            # Get current version if not provided
             if version_number is None:
-                current_page = self.get_page_adf(page_id)
-                version_number = current_page.get('version', {}).get('number', 1)
+                version_number = self._get_page_version(page_id)
             
             # Prepare update payload
             update_data = {
@@ -279,14 +459,11 @@ class ConfluenceClient:
                 }
             }
             
-            if self.config.auth_type == "oauth" and hasattr(self.confluence, '_session'):
-                # Use API v2 for OAuth
-                api_url = f"https://api.atlassian.com/ex/confluence/{self.config.oauth_config.cloud_id}/wiki/api/v2/pages/{page_id}"
-                
+            if self._uses_v2_api:
+                # Use API v2 for OAuth; json= sets the Content-Type header
                 response = self.confluence._session.put(
-                    api_url,
-                    json=update_data,
-                    headers={"Content-Type": "application/json"}
+                    f"{self._v2_pages_url}/{page_id}",
+                    json=update_data
                 )
                 
                 if response.status_code == 401:
@@ -297,6 +474,7 @@ class ConfluenceClient:
                     raise ValueError("Page version conflict - page may have been updated by another user")
                 
                 response.raise_for_status()
+                self._invalidate_cached_page_adf(page_id)
                 return response.json()
             else:
                 logger.warning("ADF format may not be available with basic auth, attempting fallback")
@@ -313,6 +491,98 @@ class ConfluenceClient:
             logger.info("Falling back to storage format")
             return self._update_page_storage_format(page_id, adf_content, version_number)
     
+    def _get_cached_page_adf(self, page_id: str) -> Optional[tuple[str, bytes]]:
+        """
+        Get the cached ETag and raw body of a page's last ADF response.
+        
+        Args:
+            page_id: Page ID to look up
+            
+        Returns:
+            Tuple of (etag, body), or None if the page is not cached
+        """
+        with ConfluenceClient._adf_page_cache_lock:
+            return ConfluenceClient._adf_page_cache.get((self._v2_pages_url, page_id))
+    
+    def _cache_page_adf(self, page_id: str, etag: str, body: bytes) -> None:
+        """
+        Remember a page's ADF response for conditional requests.
+        
+        Args:
+            page_id: Page ID the response belongs to
+            etag: ETag header of the response
+            body: Raw response body
+        """
+        with ConfluenceClient._adf_page_cache_lock:
+            ConfluenceClient._adf_page_cache[(self._v2_pages_url, page_id)] = (etag, body)
+    
+    def _invalidate_cached_page_adf(self, page_id: str) -> None:
+        """
+        Drop a page's cached ADF response after it has been updated.
+        
+        Args:
+            page_id: Page ID to drop
+        """
+        with ConfluenceClient._adf_page_cache_lock:
+            ConfluenceClient._adf_page_cache.pop((self._v2_pages_url, page_id), None)
+    
+    async def get_page_adf_async(self, page_id: str) -> Dict[str, Any]:
+        """
+        Get page content in ADF without blocking the event loop.
+        
+        The request runs in a worker thread over the shared session, so several
+        pages can be fetched concurrently with gather_with_concurrency.
+        
+        Args:
+            page_id: Page ID to retrieve
+            
+        Returns:
+            Page data with ADF content
+        """
+        return await asyncio.to_thread(self.get_page_adf, page_id)
+    
+    async def update_page_adf_async(self, page_id: str, adf_content: Dict[str, Any], version_number: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Update page content using ADF without blocking the event loop.
+        
+        Args:
+            page_id: Page ID to update
+            adf_content: ADF document content
+            version_number: Page version number for optimistic locking
+            
+        Returns:
+            Updated page data
+        """
+        return await asyncio.to_thread(self.update_page_adf, page_id, adf_content, version_number)
+    
+    def _get_page_version(self, page_id: str) -> int:
+        """
+        Get a page's current version number without downloading its body.
+        
+        Args:
+            page_id: Page ID to look up
+            
+        Returns:
+            Current version number of the page
+            
+        Raises:
+            MCPAtlassianAuthenticationError: If API call fails due to auth issues
+        """
+        if self._uses_v2_api:
+            # API v2 omits the body unless body-format is requested
+            response = self.confluence._session.get(f"{self._v2_pages_url}/{page_id}")
+            
+            if response.status_code == 401:
+                raise MCPAtlassianAuthenticationError("Confluence API authentication failed")
+            elif response.status_code == 403:
+                raise MCPAtlassianAuthenticationError("Confluence API access forbidden - check permissions")
+            
+            response.raise_for_status()
+            return response.json().get('version', {}).get('number', 1)
+        
+        current_page = self.confluence.get_page_by_id(page_id, expand="version")
+        return current_page["version"]["number"]
+    
     def _get_page_storage_format(self, page_id: str) -> Dict[str, Any]:
         """
         Fallback method to get page in storage format.
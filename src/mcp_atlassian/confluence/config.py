@@ -36,6 +36,8 @@ class ConfluenceConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    pool_connections: int = 32  # Number of host connection pools to cache
+    pool_maxsize: int = 64  # Max keep-alive connections per host pool
 
     @property
     def is_cloud(self) -> bool:
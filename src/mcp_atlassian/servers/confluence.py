@@ -763,9 +763,8 @@ async def get_page_adf(
     try:
         confluence_fetcher = await get_confluence_fetcher(ctx)
         
-        # Create a ConfluenceClient instance with the fetcher's config
-        from mcp_atlassian.confluence.client import ConfluenceClient
-        confluence_client = ConfluenceClient(confluence_fetcher.config)
+        # The fetcher is a ConfluenceClient; reuse its session and auth
+        confluence_client = confluence_fetcher
         
         # Use the ADF reader to get page with full formatting
         result = get_page_with_full_formatting(
@@ -803,9 +802,8 @@ async def find_elements_adf(
     try:
         confluence_fetcher = await get_confluence_fetcher(ctx)
         
-        # Create a ConfluenceClient instance with the fetcher's config
-        from mcp_atlassian.confluence.client import ConfluenceClient
-        confluence_client = ConfluenceClient(confluence_fetcher.config)
+        # The fetcher is a ConfluenceClient; reuse its session and auth
+        confluence_client = confluence_fetcher
         
         # Get the page in ADF format
         page_result = get_page_with_full_formatting(
@@ -905,9 +903,8 @@ async def update_page_adf(
     try:
         confluence_fetcher = await get_confluence_fetcher(ctx)
         
-        # Create a ConfluenceClient instance with the fetcher's config  
-        from mcp_atlassian.confluence.client import ConfluenceClient
-        confluence_client = ConfluenceClient(confluence_fetcher.config)
+        # The fetcher is a ConfluenceClient; reuse its session and auth
+        confluence_client = confluence_fetcher
         
         # Use the ADF writer to update page with formatting preservation
         result = update_page_preserving_formatting(
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 from fastmcp import Context
@@ -26,6 +28,39 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
+# Global-config fetchers are built once and reused across tool calls. Entries
+# are keyed by config identity and keep the config alive, so ids are not reused.
+_MAX_GLOBAL_CONFLUENCE_FETCHERS = 8
+_global_confluence_fetchers: OrderedDict[
+    int, tuple[ConfluenceConfig, ConfluenceFetcher]
+] = OrderedDict()
+_global_confluence_fetchers_lock = threading.Lock()
+
+
+def _get_global_confluence_fetcher(config: ConfluenceConfig) -> ConfluenceFetcher:
+    """Return the shared ConfluenceFetcher for a global configuration.
+
+    Building a fetcher sets up authentication, SSL and the connection pool, so
+    the fetcher for the server-wide config is created once and then reused.
+
+    Args:
+        config: The global ConfluenceConfig from the lifespan context.
+
+    Returns:
+        The cached (or newly created) ConfluenceFetcher for this config.
+    """
+    key = id(config)
+    with _global_confluence_fetchers_lock:
+        entry = _global_confluence_fetchers.get(key)
+        if entry is not None and entry[0] is config:
+            _global_confluence_fetchers.move_to_end(key)
+            return entry[1]
+        fetcher = ConfluenceFetcher(config=config)
+        _global_confluence_fetchers[key] = (config, fetcher)
+        while len(_global_confluence_fetchers) > _MAX_GLOBAL_CONFLUENCE_FETCHERS:
+            _global_confluence_fetchers.popitem(last=False)
+        return fetcher
+
 
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
@@ -377,7 +412,9 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             "get_confluence_fetcher: Using global ConfluenceFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_confluence_config.auth_type}"
         )
-        return ConfluenceFetcher(config=app_lifespan_ctx_global.full_confluence_config)
+        return _get_global_confluence_fetcher(
+            app_lifespan_ctx_global.full_confluence_config
+        )
     logger.error("Confluence configuration could not be resolved.")
     raise ValueError(
         "Confluence client (fetcher) not available. Ensure server is configured correctly."
@@ -20,6 +20,8 @@ from typing import Any, Optional
 import keyring
 import requests
 
+from .oauth_cache import get_or_refresh
+
 # Configure logging
 logger = logging.getLogger("mcp-atlassian.oauth")
 
@@ -227,7 +229,7 @@ class OAuthConfig:
         """
         if not self.is_token_expired:
             return True
-        return self.refresh_access_token()
+        return get_or_refresh(self) is not None
 
     def _get_cloud_id(self) -> None:
         """Get the cloud ID for the Atlassian instance.
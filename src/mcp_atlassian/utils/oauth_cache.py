@@ -0,0 +1,99 @@
+"""Process-wide cache of OAuth access tokens.
+
+Every client construction configures its session from an OAuthConfig, and
+separate configs often carry the same refresh token. Sharing the access token
+obtained by one of them avoids a token endpoint round-trip for the others.
+"""
+
+import hashlib
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .oauth import OAuthConfig
+
+logger = logging.getLogger("mcp-atlassian.utils.oauth_cache")
+
+# Maps a credential key to (access_token, expires_at, refresh_token)
+_CACHE: dict[str, tuple[str, float, str | None]] = {}
+# Guards _CACHE and _REFRESH_LOCKS; never held across a network call
+_CACHE_LOCK = threading.Lock()
+# One lock per credential key, so refreshes of the same token are serialized
+_REFRESH_LOCKS: dict[str, threading.Lock] = {}
+
+
+def token_cache_key(
+    client_id: str, cloud_id: str | None, refresh_token: str | None
+) -> str:
+    """Build the cache key for a set of OAuth credentials.
+
+    Args:
+        client_id: The OAuth client ID
+        cloud_id: The Atlassian Cloud ID, if known
+        refresh_token: The refresh token the access token was obtained with
+
+    Returns:
+        A SHA-256 hex digest, so raw tokens are never used as dict keys
+    """
+    return hashlib.sha256(
+        f"{client_id}|{cloud_id}|{refresh_token}".encode()
+    ).hexdigest()
+
+
+def get_or_refresh(oauth_config: "OAuthConfig") -> tuple[str, float] | None:
+    """Return a valid access token, reusing one cached by another config.
+
+    A cached token is adopted (together with a rotated refresh token) when it
+    is newer than the config's own. The token endpoint is only called when
+    neither is valid. Refreshes are serialized so concurrent callers holding
+    the same refresh token do not all hit the endpoint; refreshes for other
+    credentials are not blocked.
+
+    Args:
+        oauth_config: The OAuth configuration to update in place
+
+    Returns:
+        A tuple of (access_token, expires_at), or None if the refresh failed
+    """
+    key = token_cache_key(
+        oauth_config.client_id, oauth_config.cloud_id, oauth_config.refresh_token
+    )
+    with _CACHE_LOCK:
+        refresh_lock = _REFRESH_LOCKS.setdefault(key, threading.Lock())
+
+    with refresh_lock:
+        with _CACHE_LOCK:
+            cached = _CACHE.get(key)
+        if cached is not None and cached[1] > (oauth_config.expires_at or 0):
+            (
+                oauth_config.access_token,
+                oauth_config.expires_at,
+                oauth_config.refresh_token,
+            ) = cached
+
+        if not oauth_config.is_token_expired:
+            logger.debug("Reusing cached OAuth access token")
+        elif not oauth_config.refresh_access_token():
+            return None
+
+        access_token = oauth_config.access_token or ""
+        expires_at = oauth_config.expires_at or 0.0
+        if not oauth_config.is_token_expired:
+            entry = (access_token, expires_at, oauth_config.refresh_token)
+            # The refresh token may have been rotated; make the new one hit too
+            rotated_key = token_cache_key(
+                oauth_config.client_id,
+                oauth_config.cloud_id,
+                oauth_config.refresh_token,
+            )
+            with _CACHE_LOCK:
+                _CACHE[key] = entry
+                _CACHE[rotated_key] = entry
+        return access_token, expires_at
+
+
+def clear_token_cache() -> None:
+    """Drop every cached access token."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
@@ -18,27 +18,42 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Строки текущего раздела; выводятся одной записью в flush_output()
+_output: List[str] = []
+
+def _emit(text: str = "") -> None:
+    """Добавляет строку в буфер вывода"""
+    _output.append(f"{text}\n")
+
+def flush_output() -> None:
+    """Выводит накопленные строки одной записью и очищает буфер"""
+    if _output:
+        sys.stdout.write("".join(_output))
+        sys.stdout.flush()
+        _output.clear()
+
 def print_header(text: str) -> None:
-    """Печатает заголовок"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{text.center(60)}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
+    """Печатает заголовок, завершая предыдущий раздел"""
+    flush_output()
+    _emit(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
+    _emit(f"{Colors.BOLD}{Colors.BLUE}{text.center(60)}{Colors.END}")
+    _emit(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
 
 def print_success(text: str) -> None:
     """Печатает успешное сообщение"""
-    print(f"{Colors.GREEN}✅ {text}{Colors.END}")
+    _emit(f"{Colors.GREEN}✅ {text}{Colors.END}")
 
 def print_error(text: str) -> None:
     """Печатает сообщение об ошибке"""
-    print(f"{Colors.RED}❌ {text}{Colors.END}")
+    _emit(f"{Colors.RED}❌ {text}{Colors.END}")
 
 def print_info(text: str) -> None:
     """Печатает информационное сообщение"""
-    print(f"{Colors.BLUE}ℹ️  {text}{Colors.END}")
+    _emit(f"{Colors.BLUE}ℹ️  {text}{Colors.END}")
 
 def print_warning(text: str) -> None:
     """Печатает предупреждение"""
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.END}")
+    _emit(f"{Colors.YELLOW}⚠️  {text}{Colors.END}")
 
 async def test_mcp_connection() -> List[Any]:
     """Тестирует соединение с MCP сервером и возвращает список инструментов"""
@@ -46,6 +61,7 @@ async def test_mcp_connection() -> List[Any]:
     
     try:
         print_info("Запускаем MCP сервер...")
+        flush_output()
         
         # Настройки для запуска MCP сервера
         server_params = StdioServerParameters(
@@ -126,10 +142,10 @@ def test_adf_tools(tools: List[Any], analysis: Dict[str, Any]) -> bool:
             # Находим полную информацию об инструменте
             tool_info = next((t for t in tools if t.name == expected_tool), None)
             if tool_info:
-                print(f"    📝 Описание: {tool_info.description[:80]}...")
+                _emit(f"    📝 Описание: {tool_info.description[:80]}...")
                 if hasattr(tool_info, 'inputSchema') and tool_info.inputSchema:
                     params = tool_info.inputSchema.get('properties', {})
-                    print(f"    🔧 Параметры: {', '.join(params.keys())}")
+                    _emit(f"    🔧 Параметры: {', '.join(params.keys())}")
         else:
             print_error(f"{expected_tool} - НЕ НАЙДЕН")
             success = False
@@ -139,7 +155,7 @@ def test_adf_tools(tools: List[Any], analysis: Dict[str, Any]) -> bool:
     if extra_adf_tools:
         print_info("Дополнительные ADF инструменты:")
         for tool in extra_adf_tools:
-            print(f"    • {tool}")
+            _emit(f"    • {tool}")
     
     return success
 
@@ -148,44 +164,44 @@ def print_full_tool_list(tools: List[Any], analysis: Dict[str, Any]) -> None:
     print_header("ПОЛНЫЙ СПИСОК ИНСТРУМЕНТОВ")
     
     if analysis['adf_tools']:
-        print(f"\n{Colors.BOLD}🆕 ADF ИНСТРУМЕНТЫ ({len(analysis['adf_tools'])}){Colors.END}")
+        _emit(f"\n{Colors.BOLD}🆕 ADF ИНСТРУМЕНТЫ ({len(analysis['adf_tools'])}){Colors.END}")
         for i, tool_name in enumerate(analysis['adf_tools'], 1):
-            print(f"  {i:2d}. {Colors.GREEN}{tool_name}{Colors.END}")
+            _emit(f"  {i:2d}. {Colors.GREEN}{tool_name}{Colors.END}")
     
-    print(f"\n{Colors.BOLD}🔍 CONFLUENCE ИНСТРУМЕНТЫ ({len(analysis['confluence_tools'])}){Colors.END}")
+    _emit(f"\n{Colors.BOLD}🔍 CONFLUENCE ИНСТРУМЕНТЫ ({len(analysis['confluence_tools'])}){Colors.END}")
     for i, tool_name in enumerate(analysis['confluence_tools'], 1):
         color = Colors.GREEN if 'adf' in tool_name.lower() else Colors.BLUE
-        print(f"  {i:2d}. {color}{tool_name}{Colors.END}")
+        _emit(f"  {i:2d}. {color}{tool_name}{Colors.END}")
     
-    print(f"\n{Colors.BOLD}🎫 JIRA ИНСТРУМЕНТЫ ({len(analysis['jira_tools'])}){Colors.END}")
+    _emit(f"\n{Colors.BOLD}🎫 JIRA ИНСТРУМЕНТЫ ({len(analysis['jira_tools'])}){Colors.END}")
     for i, tool_name in enumerate(analysis['jira_tools'][:10], 1):  # Показываем первые 10
-        print(f"  {i:2d}. {Colors.BLUE}{tool_name}{Colors.END}")
+        _emit(f"  {i:2d}. {Colors.BLUE}{tool_name}{Colors.END}")
     
     if len(analysis['jira_tools']) > 10:
-        print(f"     ... и еще {len(analysis['jira_tools']) - 10} Jira инструментов")
+        _emit(f"     ... и еще {len(analysis['jira_tools']) - 10} Jira инструментов")
 
 def print_summary(analysis: Dict[str, Any], adf_success: bool) -> None:
     """Печатает итоговую сводку"""
     print_header("ИТОГОВАЯ СВОДКА")
     
-    print(f"📊 Статистика:")
-    print(f"   • Всего инструментов: {analysis['total']}")
-    print(f"   • Jira: {len(analysis['jira_tools'])}")
-    print(f"   • Confluence: {len(analysis['confluence_tools'])}")
-    print(f"   • ADF: {len(analysis['adf_tools'])}")
+    _emit(f"📊 Статистика:")
+    _emit(f"   • Всего инструментов: {analysis['total']}")
+    _emit(f"   • Jira: {len(analysis['jira_tools'])}")
+    _emit(f"   • Confluence: {len(analysis['confluence_tools'])}")
+    _emit(f"   • ADF: {len(analysis['adf_tools'])}")
     
     if adf_success:
         print_success("ВСЕ ADF ИНСТРУМЕНТЫ НАЙДЕНЫ И ГОТОВЫ К РАБОТЕ!")
         print_info("Рекомендации:")
-        print("   1. Перезапустите Claude Desktop полностью")
-        print("   2. Пересоздайте MCP подключение если инструменты не видны")
-        print("   3. Проверьте настройки claude_desktop_config.json")
+        _emit("   1. Перезапустите Claude Desktop полностью")
+        _emit("   2. Пересоздайте MCP подключение если инструменты не видны")
+        _emit("   3. Проверьте настройки claude_desktop_config.json")
     else:
         print_error("НЕКОТОРЫЕ ADF ИНСТРУМЕНТЫ НЕ НАЙДЕНЫ!")
         print_warning("Проверьте:")
-        print("   1. Правильность регистрации инструментов в confluence.py")
-        print("   2. Отсутствие синтаксических ошибок")
-        print("   3. Корректность импортов ADF модулей")
+        _emit("   1. Правильность регистрации инструментов в confluence.py")
+        _emit("   2. Отсутствие синтаксических ошибок")
+        _emit("   3. Корректность импортов ADF модулей")
 
 async def main():
     """Главная функция тестирования"""
@@ -197,6 +213,7 @@ async def main():
     
     if not tools:
         print_error("Не удалось получить список инструментов!")
+        flush_output()
         sys.exit(1)
     
     # Анализируем инструменты
@@ -216,12 +233,15 @@ async def main():
 if __name__ == "__main__":
     try:
         exit_code = asyncio.run(main())
+        flush_output()
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print_warning("Тестирование прервано пользователем")
+        flush_output()
         sys.exit(130)
     except Exception as e:
         print_error(f"Критическая ошибка: {e}")
+        flush_output()
         import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -55,6 +55,18 @@ class TestADFDocumentCreation:
         assert doc.type == "doc" 
         assert len(doc.content) == 1
 
+    def test_create_from_dict_shares_data(self, simple_adf_document):
+        """Test that the source dict is kept by reference and never mutated."""
+        original = json.loads(json.dumps(simple_adf_document))
+        doc = ADFDocument.from_dict(simple_adf_document)
+        
+        assert doc._raw_data is simple_adf_document
+        
+        doc.add_paragraph("New paragraph")
+        
+        assert simple_adf_document == original
+        assert len(doc.content) == 2
+
     def test_create_empty_classmethod(self):
         """Test creating empty document using empty classmethod."""
         doc = ADFDocument.empty()
@@ -360,3 +372,37 @@ class TestADFDocumentElementMap:
         # This is internal functionality, but we can verify document works
         assert complex_adf_document_instance.version == 1
         assert len(complex_adf_document_instance.content) > 0
+
+    def test_element_map_deferred(self, complex_adf_document):
+        """Test that the element map can be built on first use."""
+        deferred = ADFDocument(complex_adf_document, build_element_map=False)
+        assert deferred._element_map == {}
+
+        eager = ADFDocument(complex_adf_document)
+        assert deferred._ensure_element_map() == eager._element_map
+
+    def test_element_map_rebuilt_after_update(self, adf_document_instance):
+        """Test that the element map reflects changes once it is used again."""
+        before = len(adf_document_instance._ensure_element_map())
+
+        adf_document_instance.add_paragraph("New paragraph")
+
+        element_map = adf_document_instance._ensure_element_map()
+        assert len(element_map) > before
+        last_index = len(adf_document_instance.content) - 1
+        assert element_map[f"path_{last_index}"]["type"] == "paragraph"
+
+    def test_raw_data_serialized_once_after_edits(self, adf_document_instance):
+        """Test that raw data is rebuilt from the model only when it is read."""
+        adf_document_instance.add_paragraph("First")
+        adf_document_instance.add_paragraph("Second")
+        
+        with patch.object(adf_document_instance, "to_dict", wraps=adf_document_instance.to_dict) as to_dict:
+            adf_document_instance._delete_element_at_path([0])
+            assert to_dict.call_count == 0
+            
+            raw = adf_document_instance.raw_data
+            assert adf_document_instance.raw_data == raw
+            assert to_dict.call_count == 1
+        
+        assert len(raw["content"]) == 2
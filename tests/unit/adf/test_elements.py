@@ -355,6 +355,19 @@ class TestTableRowElement:
         
         assert count == 3
 
+    def test_cells_from_dicts_dispatch_on_type(self):
+        """Test that dict cells become the element class named by their type."""
+        row = TableRowElement.model_validate({
+            "type": "tableRow",
+            "content": [{"type": "tableHeader"}, {"type": "tableCell"}]
+        })
+        
+        assert isinstance(row.content[0], TableHeaderElement)
+        assert isinstance(row.content[1], TableCellElement)
+        
+        with pytest.raises(ValueError):
+            TableRowElement.model_validate({"type": "tableRow", "content": [{"attrs": {}}]})
+
 
 class TestTableCellElement:
     """Test TableCellElement class."""
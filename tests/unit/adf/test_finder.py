@@ -538,6 +538,29 @@ class TestADFFinderInternalMethods:
         assert result is None or isinstance(result, (dict, list))
 
 
+    def test_compile_criteria(self, complex_adf_document_instance):
+        """Test that compiled criteria only run the requested checks."""
+        finder = ADFFinder(complex_adf_document_instance)
+        
+        matches = finder._compile_criteria({"node_type": "text", "marks": ["strong"]})
+        
+        assert matches({"type": "text", "text": "bold", "marks": [{"type": "strong"}]}) is True
+        assert matches({"type": "text", "text": "plain"}) is False
+        assert matches({"type": "paragraph", "marks": [{"type": "strong"}]}) is False
+        assert finder._compile_criteria({})({"type": "anything"}) is True
+
+    def test_combined_criteria_must_all_match(self, complex_adf_document_instance):
+        """Test that criteria with several node keys narrow the results."""
+        finder = ADFFinder(complex_adf_document_instance)
+        
+        text_nodes = finder.find_elements({"node_type": "text"}, cache_results=False)
+        strong_text = finder.find_elements({"node_type": "text", "marks": ["strong"]}, cache_results=False)
+        
+        assert 0 < len(strong_text) < len(text_nodes)
+        for result in strong_text:
+            assert result["node"]["type"] == "text"
+            assert "strong" in [mark["type"] for mark in result["node"]["marks"]]
+
 class TestADFFinderConvenienceFunction:
     """Test the convenience function for direct usage."""
 
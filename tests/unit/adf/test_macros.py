@@ -0,0 +1,104 @@
+"""
+Unit tests for MacroManager.
+
+Tests cover document macro analysis, opt-in macro validation and macro parameter conversion.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from mcp_atlassian.adf import ADFDocument, MacroManager, analyze_document_macros
+from mcp_atlassian.adf.elements import ExtensionElement
+
+
+def make_macro(extension_key, **parameters):
+    """Build a simple extension node dict for a core Confluence macro."""
+    return {
+        "type": "extension",
+        "attrs": {
+            "extensionType": "com.atlassian.confluence.macro.core",
+            "extensionKey": extension_key,
+            "parameters": parameters
+        }
+    }
+
+
+@pytest.fixture
+def macro_document():
+    """Document with an invalid code macro and a valid toc macro nested in a panel."""
+    return ADFDocument({
+        "version": 1,
+        "type": "doc",
+        "content": [
+            # The code macro is bodied, so a simple extension fails validation
+            make_macro("code", language="python"),
+            {"type": "panel", "attrs": {"panelType": "info"}, "content": [make_macro("toc")]}
+        ]
+    })
+
+
+class TestMacroAnalysis:
+    """Test document macro analysis."""
+
+    def test_analyze_counts_macros(self, macro_document):
+        """Test that macros are counted by type and parameter."""
+        analysis = analyze_document_macros(macro_document)
+
+        assert analysis.total_macros == 2
+        assert analysis.simple_macros == 2
+        assert analysis.macro_types == {"code": 1, "toc": 1}
+        assert analysis.parameter_usage == {"language": 1}
+
+    def test_analyze_skips_validation_by_default(self, macro_document):
+        """Test that invalid macros are only reported when validation is requested."""
+        manager = MacroManager(macro_document)
+
+        with patch.object(manager, "validate_macro", wraps=manager.validate_macro) as validate:
+            analysis = manager.analyze_document_macros()
+
+        validate.assert_not_called()
+        assert analysis.invalid_macros == []
+
+    def test_analyze_with_validation(self, macro_document):
+        """Test that validate=True reports each invalid macro with its path."""
+        analysis = analyze_document_macros(macro_document, validate=True)
+
+        assert len(analysis.invalid_macros) == 1
+        element_path, message = analysis.invalid_macros[0]
+        assert element_path["path"] == [0]
+        assert element_path["type"] == "extension"
+        assert message == "Validation failed: 1 errors"
+
+    def test_analyze_requires_document(self):
+        """Test that analysis without any document is rejected."""
+        with pytest.raises(ValueError):
+            MacroManager().analyze_document_macros()
+
+
+class TestMacroParameterConversion:
+    """Test macro parameter conversion."""
+
+    @pytest.mark.parametrize("target_format", ["v2", "legacy"])
+    def test_identity_conversion_returns_macro_unchanged(self, target_format):
+        """Test that identity formats return the macro without touching its parameters."""
+        manager = MacroManager()
+        macro = ExtensionElement.model_validate(make_macro("code", language="python"))
+        parameters = macro.attrs["parameters"]
+
+        with patch.object(manager, "_normalize_parameters") as normalize:
+            result = manager.convert_macro_parameters(macro, target_format)
+
+        normalize.assert_not_called()
+        assert result is macro
+        assert result.attrs["parameters"] is parameters
+
+    def test_normalized_conversion(self):
+        """Test that the normalized format rewrites the parameters."""
+        manager = MacroManager()
+        macro = ExtensionElement.model_validate(make_macro("code", language="python"))
+
+        with patch.object(manager, "_normalize_parameters", wraps=manager._normalize_parameters) as normalize:
+            result = manager.convert_macro_parameters(macro, "normalized")
+
+        normalize.assert_called_once()
+        assert result.attrs["parameters"] == {"language": "python"}
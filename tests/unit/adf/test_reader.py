@@ -4,10 +4,12 @@ Unit tests for ADFReader class.
 Tests cover page reading with full formatting preservation, analysis, and error handling.
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
-from mcp_atlassian.adf.reader import ADFReader, get_page_with_full_formatting
+from mcp_atlassian.adf.reader import AnalysisAccumulator, ADFReader, get_page_with_full_formatting
 from mcp_atlassian.adf import ADFDocument
 
 
@@ -83,6 +85,117 @@ class TestADFReaderPageRetrieval:
         with pytest.raises(RuntimeError, match="Page retrieval failed"):
             reader.get_page_with_full_formatting("123456")
 
+    def test_element_map_from_analysis_pass(self, mock_confluence_client, complex_adf_document):
+        """Test that the analysis pass builds the same element map as the document."""
+        mock_confluence_client.get_page_adf.return_value = {
+            "id": "123456",
+            "body": {"atlas_doc_format": complex_adf_document}
+        }
+        reader = ADFReader(mock_confluence_client)
+
+        with_analysis = reader.get_page_with_full_formatting("123456")
+        without_analysis = reader.get_page_with_full_formatting("123456", analyze_formatting=False)
+
+        expected = ADFDocument(complex_adf_document)._element_map
+        assert with_analysis["element_map"] == expected
+        assert without_analysis["element_map"] == expected
+
+    def test_analysis_cached_by_page_version(self, mock_confluence_client, complex_adf_document):
+        """Test that repeated retrieval of an unchanged page version reuses the analysis."""
+        mock_confluence_client.get_page_adf.return_value = {
+            "id": "123456",
+            "version": {"number": 3},
+            "body": {"atlas_doc_format": complex_adf_document}
+        }
+        reader = ADFReader(mock_confluence_client)
+
+        with patch.object(
+            reader, "_analyze_formatting_elements", wraps=reader._analyze_formatting_elements
+        ) as analyze:
+            first = reader.get_page_with_full_formatting("123456")
+            second = reader.get_page_with_full_formatting("123456")
+
+        assert analyze.call_count == 1
+        assert len(reader.formatting_analysis_cache) == 1
+        assert second["formatting_metadata"] == first["formatting_metadata"]
+        assert second["element_map"] == first["element_map"]
+        assert second["validation_result"] == first["validation_result"]
+
+    def test_cached_analysis_not_shared_with_callers(self, mock_confluence_client, complex_adf_document):
+        """Test that mutating a returned result does not change later results."""
+        mock_confluence_client.get_page_adf.return_value = {
+            "id": "123456",
+            "version": {"number": 3},
+            "body": {"atlas_doc_format": complex_adf_document}
+        }
+        reader = ADFReader(mock_confluence_client)
+
+        first = reader.get_page_with_full_formatting("123456")
+        first["formatting_metadata"]["colors"]["text_colors"].append("#000000")
+        first["validation_result"]["errors"].append("tampered")
+        second = reader.get_page_with_full_formatting("123456")
+
+        assert "#000000" not in second["formatting_metadata"]["colors"]["text_colors"]
+        assert "tampered" not in second["validation_result"]["errors"]
+
+    def test_unversioned_page_not_cached(self, mock_confluence_client, complex_adf_document):
+        """Test that page data without a version number is never cached."""
+        mock_confluence_client.get_page_adf.return_value = {
+            "id": "123456",
+            "body": {"atlas_doc_format": complex_adf_document}
+        }
+        reader = ADFReader(mock_confluence_client)
+
+        reader.get_page_with_full_formatting("123456")
+
+        assert len(reader.formatting_analysis_cache) == 0
+
+    def test_analysis_cache_is_bounded(self, mock_confluence_client, complex_adf_document):
+        """Test that the analysis cache evicts the least recently used page version."""
+        reader = ADFReader(mock_confluence_client)
+
+        with patch("mcp_atlassian.adf.reader.ANALYSIS_CACHE_SIZE", 2):
+            for number in (1, 2, 3):
+                mock_confluence_client.get_page_adf.return_value = {
+                    "id": "123456",
+                    "version": {"number": number},
+                    "body": {"atlas_doc_format": complex_adf_document}
+                }
+                reader.get_page_with_full_formatting("123456")
+
+        assert len(reader.formatting_analysis_cache) == 2
+
+    def test_get_pages_with_full_formatting(self, mock_confluence_client):
+        """Test batch retrieval returns one result per page in request order."""
+        def get_page_adf(page_id):
+            return {
+                "id": page_id,
+                "version": 1,
+                "type": "doc",
+                "content": [{"type": "paragraph", "content": [{"type": "text", "text": page_id}]}]
+            }
+
+        mock_confluence_client.get_page_adf.side_effect = get_page_adf
+        reader = ADFReader(mock_confluence_client)
+
+        results = reader.get_pages_with_full_formatting(["1", "2", "3"], max_concurrent_fetches=2)
+
+        assert [r["page_metadata"]["page_id"] for r in results] == ["1", "2", "3"]
+        assert [r["adf_document"].get_plain_text() for r in results] == ["1", "2", "3"]
+        assert mock_confluence_client.get_page_adf.call_count == 3
+
+    def test_get_pages_api_error(self, mock_confluence_client):
+        """Test that a failed page fetch fails the batch."""
+        mock_confluence_client.get_page_adf.side_effect = Exception("API Error")
+
+        reader = ADFReader(mock_confluence_client)
+
+        with pytest.raises(RuntimeError, match="Page retrieval failed for 1"):
+            reader.get_pages_with_full_formatting(["1", "2"])
+
+        with pytest.raises(ValueError):
+            reader.get_pages_with_full_formatting([])
+
 
 class TestADFReaderADFParsing:
     """Test ADF content parsing."""
@@ -152,6 +265,25 @@ class TestADFReaderADFParsing:
         assert isinstance(result, ADFDocument)
         assert result.version == 1
 
+    def test_parse_adf_content_serialized_value(self, simple_adf_document):
+        """Test parsing when API v2 returns the ADF as a JSON string."""
+        reader = ADFReader()
+
+        page_data = {
+            "body": {
+                "atlas_doc_format": {
+                    "representation": "atlas_doc_format",
+                    "value": json.dumps(simple_adf_document)
+                }
+            }
+        }
+
+        result = reader._parse_adf_content(page_data)
+
+        assert isinstance(result, ADFDocument)
+        assert not result.is_empty()
+        assert result.to_dict()["content"] == simple_adf_document["content"]
+
     def test_parse_adf_content_fallback_to_empty(self):
         """Test fallback to empty document when no ADF found."""
         reader = ADFReader()
@@ -197,6 +329,24 @@ class TestADFReaderFormattingAnalysis:
         assert isinstance(colors["text_colors"], list)
         assert isinstance(colors["background_colors"], list)
 
+    def test_analyze_formatting_colors_deduplicated(self):
+        """Test that colors are reported once each, in order of first use."""
+        reader = ADFReader()
+        texts = [
+            {"type": "text", "text": color, "marks": [{"type": "textColor", "attrs": {"color": color}}]}
+            for color in ("#FF0000", "#00FF00", "#FF0000", "#0000FF", "#00FF00")
+        ]
+        adf_document = ADFDocument({
+            "version": 1,
+            "type": "doc",
+            "content": [{"type": "paragraph", "content": texts}]
+        })
+
+        analysis = reader._analyze_formatting_elements(adf_document)
+
+        assert analysis["colors"]["text_colors"] == ["#FF0000", "#00FF00", "#0000FF"]
+        assert analysis["statistics"]["unique_text_colors"] == 3
+
     def test_analyze_formatting_tables(self, complex_adf_document):
         """Test table analysis in formatting."""
         reader = ADFReader()
@@ -287,9 +437,33 @@ class TestADFReaderElementMapping:
         adf_document = ADFDocument(empty_adf_document)
         
         element_map = reader._create_element_map(adf_document)
-        
+
         assert isinstance(element_map, dict)
 
+    def test_create_element_map_for_subtrees(self, complex_adf_document):
+        """Test that root paths restrict the element map to those subtrees."""
+        reader = ADFReader()
+        adf_document = ADFDocument(complex_adf_document)
+        full_map = ADFDocument(complex_adf_document)._element_map
+
+        element_map = reader._create_element_map(adf_document, root_paths=[[1], [2, 0]])
+
+        expected = {
+            key: value for key, value in full_map.items()
+            if key == "path_1" or key.startswith(("path_1.", "path_2.0"))
+        }
+        assert element_map == expected
+        assert "path_0" not in element_map
+
+    def test_create_element_map_overlapping_roots(self, complex_adf_document):
+        """Test that overlapping root paths fall back to the full element map."""
+        reader = ADFReader()
+        adf_document = ADFDocument(complex_adf_document)
+
+        element_map = reader._create_element_map(adf_document, root_paths=[[1], [1, 0]])
+
+        assert element_map == ADFDocument(complex_adf_document)._element_map
+
 
 class TestADFReaderValidation:
     """Test document validation functionality."""
@@ -425,21 +599,30 @@ class TestADFReaderAnalysisRecursive:
     def test_analyze_node_recursive(self, complex_adf_document):
         """Test recursive node analysis."""
         reader = ADFReader()
-        adf_document = ADFDocument(complex_adf_document)
         
-        analysis = {
-            "colors": {"text_colors": set(), "background_colors": set()},
-            "tables": [],
-            "macros": [],
-            "panels": [],
-            "formatting_marks": {},
-            "statistics": {"total_elements": 0, "formatted_text_nodes": 0, "complex_elements": 0}
-        }
+        analysis = AnalysisAccumulator()
         
         # This tests the internal recursive method
-        reader._analyze_node_recursive(adf_document.content, analysis, [])
+        reader._analyze_node_recursive(complex_adf_document["content"], analysis, [])
+        
+        assert analysis.total_elements > 0
+
+    def test_analyze_deeply_nested_nodes(self):
+        """Test that node analysis handles nesting beyond the recursion limit."""
+        reader = ADFReader()
+        
+        node = {"type": "text", "text": "leaf", "marks": [{"type": "strong"}]}
+        for _ in range(3000):
+            node = {"type": "blockquote", "content": [node]}
+        
+        analysis = AnalysisAccumulator()
+        path = []
         
-        assert analysis["statistics"]["total_elements"] > 0
+        reader._analyze_node_recursive([node], analysis, path)
+        
+        assert analysis.total_elements == 3001
+        assert analysis.formatted_text_nodes == 1
+        assert path == []
 
     def test_analyze_text_node(self, complex_adf_document):
         """Test text node analysis."""
@@ -459,16 +642,12 @@ class TestADFReaderAnalysisRecursive:
             ]
         }
         
-        analysis = {
-            "colors": {"text_colors": set(), "background_colors": set()},
-            "formatting_marks": {},
-            "statistics": {"formatted_text_nodes": 0}
-        }
+        analysis = AnalysisAccumulator()
         
         reader._analyze_text_node(text_node, analysis, [0])
         
-        assert "#FF0000" in analysis["colors"]["text_colors"]
-        assert analysis["statistics"]["formatted_text_nodes"] == 1
+        assert "#FF0000" in analysis.text_colors
+        assert analysis.formatted_text_nodes == 1
 
     def test_analyze_table_node(self, complex_adf_document):
         """Test table node analysis.""" 
@@ -476,22 +655,18 @@ class TestADFReaderAnalysisRecursive:
         
         # Extract table node from complex document
         table_node = None
-        adf_document = ADFDocument(complex_adf_document)
-        for node in adf_document.content:
-            if hasattr(node, 'type') and node.type == "table":
+        for node in complex_adf_document["content"]:
+            if node["type"] == "table":
                 table_node = node
                 break
         
         if table_node:
-            analysis = {
-                "tables": [],
-                "statistics": {"complex_elements": 0}
-            }
+            analysis = AnalysisAccumulator()
             
             reader._analyze_table_node(table_node, analysis, [2])
             
-            assert len(analysis["tables"]) == 1
-            assert analysis["statistics"]["complex_elements"] == 1
+            assert len(analysis.tables) == 1
+            assert analysis.complex_elements == 1
 
     def test_analyze_panel_node(self, complex_adf_document):
         """Test panel node analysis."""
@@ -499,22 +674,18 @@ class TestADFReaderAnalysisRecursive:
         
         # Extract panel node from complex document
         panel_node = None
-        adf_document = ADFDocument(complex_adf_document)
-        for node in adf_document.content:
-            if hasattr(node, 'type') and node.type == "panel":
+        for node in complex_adf_document["content"]:
+            if node["type"] == "panel":
                 panel_node = node
                 break
         
         if panel_node:
-            analysis = {
-                "panels": [],
-                "statistics": {"complex_elements": 0}
-            }
+            analysis = AnalysisAccumulator()
             
             reader._analyze_panel_node(panel_node, analysis, [3])
             
-            assert len(analysis["panels"]) == 1
-            assert analysis["statistics"]["complex_elements"] == 1
+            assert len(analysis.panels) == 1
+            assert analysis.complex_elements == 1
 
     def test_analyze_macro_node(self, complex_adf_document):
         """Test macro node analysis."""
@@ -522,19 +693,15 @@ class TestADFReaderAnalysisRecursive:
         
         # Extract extension node from complex document  
         extension_node = None
-        adf_document = ADFDocument(complex_adf_document)
-        for node in adf_document.content:
-            if hasattr(node, 'type') and node.type == "extension":
+        for node in complex_adf_document["content"]:
+            if node["type"] == "extension":
                 extension_node = node
                 break
         
         if extension_node:
-            analysis = {
-                "macros": [],
-                "statistics": {"complex_elements": 0}
-            }
+            analysis = AnalysisAccumulator()
             
             reader._analyze_macro_node(extension_node, analysis, [4])
             
-            assert len(analysis["macros"]) == 1
-            assert analysis["statistics"]["complex_elements"] == 1
+            assert len(analysis.macros) == 1
+            assert analysis.complex_elements == 1
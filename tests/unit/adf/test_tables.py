@@ -0,0 +1,174 @@
+"""
+Unit tests for TableManager.
+
+Tests cover table structure analysis, column insertion, cell merging, table optimization
+and finding tables in documents.
+"""
+
+import pytest
+
+from mcp_atlassian.adf import ADFDocument, TableManager, TableElement
+from mcp_atlassian.adf.elements import TableCellElement, TableHeaderElement
+from mcp_atlassian.adf.tables import CellSpanInfo
+
+
+def make_cell(text, cell_type="tableCell", **attrs):
+    """Build a table cell dict holding one paragraph of text."""
+    cell = {
+        "type": cell_type,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]
+    }
+    if attrs:
+        cell["attrs"] = attrs
+    return cell
+
+
+@pytest.fixture
+def table_manager():
+    """Create a TableManager without a document."""
+    return TableManager()
+
+
+@pytest.fixture
+def header_table():
+    """Table dict with a header row and one cell spanning two columns."""
+    return {
+        "type": "table",
+        "attrs": {"layout": "default"},
+        "content": [
+            {"type": "tableRow", "content": [
+                make_cell("H1", "tableHeader"), make_cell("H2", "tableHeader"), make_cell("H3", "tableHeader")
+            ]},
+            {"type": "tableRow", "content": [make_cell("A", colspan=2), make_cell("B")]},
+            {"type": "tableRow", "content": [make_cell("C"), make_cell("D"), make_cell("E")]}
+        ]
+    }
+
+
+class TestTableAnalysis:
+    """Test table structure analysis."""
+
+    def test_analyze_dimensions_and_spans(self, table_manager, header_table):
+        """Test that dimensions, headers and spans are read from the table."""
+        analysis = table_manager.analyze_table_structure(header_table)
+
+        assert analysis.dimensions.rows == 3
+        assert analysis.dimensions.columns == 3
+        assert analysis.dimensions.header_rows == 1
+        assert analysis.dimensions.total_cells == 8
+        assert analysis.dimensions.merged_cells == 1
+        assert analysis.has_headers is True
+        assert analysis.is_regular is False
+        assert analysis.cell_spans == [CellSpanInfo(row=1, column=0, colspan=2, rowspan=1)]
+        assert analysis.cell_spans[0].covers_cells == [(1, 1)]
+        assert analysis.layout_type == "default"
+        assert analysis.validation_errors == []
+
+    def test_analyze_model_matches_dict(self, table_manager, header_table):
+        """Test that a table model is analyzed the same as its dict."""
+        table = TableElement.model_validate(header_table)
+
+        assert table_manager.analyze_table_structure(table) == table_manager.analyze_table_structure(header_table)
+
+    def test_analyze_empty_table(self, table_manager):
+        """Test analysis of a table without rows."""
+        analysis = table_manager.analyze_table_structure({"type": "table", "content": []})
+
+        assert analysis.dimensions.rows == 0
+        assert analysis.cell_spans == []
+
+
+class TestTableModification:
+    """Test table modification operations."""
+
+    def test_insert_column_into_table_with_header_row(self, table_manager, header_table):
+        """Test that an inserted column gets a header cell in the header row only."""
+        table = TableElement.model_validate(header_table)
+
+        table_manager.insert_table_column(table, 1)
+
+        assert [len(row.content) for row in table.content] == [4, 3, 4]
+        assert isinstance(table.content[0].content[1], TableHeaderElement)
+        assert all(type(row.content[1]) is TableCellElement for row in table.content[1:])
+
+    def test_insert_header_column(self, table_manager, header_table):
+        """Test that is_header makes every inserted cell a header."""
+        table = TableElement.model_validate(header_table)
+
+        table_manager.insert_table_column(table, 0, is_header=True)
+
+        assert all(isinstance(row.content[0], TableHeaderElement) for row in table.content)
+
+    def test_merge_cells(self, table_manager, header_table):
+        """Test that merging sets spans and moves content into the main cell."""
+        table = TableElement.model_validate(header_table)
+
+        table_manager.merge_table_cells(table, 2, 0, 2, 1)
+
+        main_cell, merged_cell = table.model_dump()["content"][2]["content"][:2]
+        assert main_cell["attrs"] == {"colspan": 2}
+        assert [paragraph["content"][0]["text"] for paragraph in main_cell["content"]] == ["C", "D"]
+        assert merged_cell["content"] == []
+        assert "__merged" not in merged_cell["attrs"]
+
+    def test_merge_invalid_range(self, table_manager, header_table):
+        """Test that an out-of-range merge is rejected."""
+        table = TableElement.model_validate(header_table)
+
+        with pytest.raises(ValueError):
+            table_manager.merge_table_cells(table, 1, 0, 5, 1)
+
+    def test_optimize_table(self, table_manager):
+        """Test that optimizing drops empty rows, pads short rows and fills default attrs."""
+        table = TableElement.model_validate({
+            "type": "table",
+            "attrs": {},
+            "content": [
+                {"type": "tableRow", "content": [make_cell("A"), make_cell("B")]},
+                {"type": "tableRow", "content": [{"type": "tableCell", "content": []}]},
+                {"type": "tableRow", "content": [make_cell("C")]}
+            ]
+        })
+
+        table_manager.optimize_table_structure(table)
+
+        assert [len(row.content) for row in table.content] == [2, 2]
+        assert table.content[1].content[1].content == []
+        assert table.attrs["layout"] == "default"
+
+
+class TestTableSearch:
+    """Test finding tables in documents."""
+
+    @pytest.fixture
+    def document_with_tables(self, header_table):
+        """Document with a top-level table and a table nested in a panel."""
+        return ADFDocument({
+            "version": 1,
+            "type": "doc",
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": "Intro"}]},
+                {"type": "panel", "attrs": {"panelType": "info"}, "content": [header_table]},
+                header_table
+            ]
+        })
+
+    def test_find_tables(self, document_with_tables):
+        """Test that top-level and nested tables are found as table elements."""
+        tables = TableManager(document_with_tables).find_tables_in_document()
+
+        assert [path["path"] for path, _ in tables] == [[1, 0], [2]]
+        assert all(isinstance(table, TableElement) for _, table in tables)
+        assert len(tables[1][1].content) == 3
+
+    def test_find_tables_without_materializing(self, table_manager, document_with_tables):
+        """Test that raw table dicts are returned when materialize is False."""
+        tables = table_manager.find_tables_in_document(document_with_tables, materialize=False)
+
+        assert [path["path"] for path, _ in tables] == [[1, 0], [2]]
+        assert all(isinstance(table, dict) and table["type"] == "table" for _, table in tables)
+
+    def test_find_tables_requires_document(self, table_manager):
+        """Test that searching without any document is rejected."""
+        with pytest.raises(ValueError):
+            table_manager.find_tables_in_document()
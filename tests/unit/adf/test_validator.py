@@ -284,6 +284,14 @@ class TestADFValidatorMarkValidation:
         assert is_valid is True
         assert len(adf_validator.errors) == 0
 
+    def test_validate_color_values(self, adf_validator):
+        """Test accepted and rejected color value formats."""
+        for color in ("#fff", "#FF0000", "#a1B2c3", "red", "light-blue"):
+            assert adf_validator._validate_color_value(color) is True
+        
+        for color in ("#ff", "#ffff", "#gggggg", "#fff\n", "FF0000", "crimson", None):
+            assert adf_validator._validate_color_value(color) is False
+
     def test_validate_invalid_mark_type(self, adf_validator):
         """Test validation with invalid mark type."""
         doc = {
@@ -312,6 +320,31 @@ class TestADFValidatorMarkValidation:
         # Should handle invalid marks gracefully
         assert isinstance(is_valid, bool)
 
+    def test_invalid_mark_error_location(self, adf_validator):
+        """Test that mark errors keep an integer path and name the mark."""
+        doc = {
+            "version": 1,
+            "type": "doc",
+            "content": [
+                {
+                    "type": "paragraph",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "Text with invalid mark",
+                            "marks": [{"type": "strong"}, {"type": "invalid_mark_type"}]
+                        }
+                    ]
+                }
+            ]
+        }
+        
+        assert adf_validator.validate_document(doc) is False
+        
+        error = adf_validator.errors[0]
+        assert error["path"] == [0, 0]
+        assert error["message"].startswith("marks[1]:")
+
 
 class TestADFValidatorTableValidation:
     """Test validation of table structures."""
@@ -504,6 +537,41 @@ class TestADFValidatorErrorReporting:
         assert hasattr(adf_validator, 'warnings')
         assert isinstance(adf_validator.warnings, list)
 
+    def test_validate_document_stops_at_first_error(self, adf_validator):
+        """Test that pass/fail validation stops early and details collect everything."""
+        doc = {
+            "version": 1,
+            "type": "doc",
+            "content": [
+                {"type": "unknown_one"},
+                {"type": "unknown_two"}
+            ]
+        }
+        
+        assert adf_validator.validate_document(doc) is False
+        assert len(adf_validator.errors) == 1
+        
+        assert adf_validator.validate_document(doc, stop_at_first_error=False) is False
+        assert len(adf_validator.errors) == 2
+        
+        result = adf_validator.validate_with_details(doc)
+        assert result["is_valid"] is False
+        assert len(result["errors"]) == 2
+
+    def test_detailed_result_is_detached(self, adf_validator, simple_adf_document, invalid_adf_document):
+        """Test that detailed results are not changed by later validations."""
+        result = adf_validator.validate_with_details(invalid_adf_document)
+        error_count = len(result["errors"])
+        
+        assert result["is_valid"] is False
+        assert error_count > 0
+        
+        result["errors"][0]["path"].append(99)
+        assert 99 not in adf_validator.errors[0]["path"]
+        
+        adf_validator.validate_with_details(simple_adf_document)
+        assert len(result["errors"]) == error_count
+
 
 class TestADFValidatorEdgeCases:
     """Test edge cases and error conditions."""
@@ -555,6 +623,26 @@ class TestADFValidatorEdgeCases:
         is_valid = adf_validator.validate_document(doc)
         assert isinstance(is_valid, bool)
 
+    def test_validate_max_depth_exceeded(self, adf_validator):
+        """Test that nesting beyond the depth limit is reported as an error."""
+        nested_content = {"type": "text", "text": "Deep"}
+        for _ in range(30):
+            nested_content = {
+                "type": "paragraph",
+                "content": [nested_content]
+            }
+        
+        doc = {
+            "version": 1,
+            "type": "doc",
+            "content": [nested_content]
+        }
+        
+        is_valid = adf_validator.validate_document(doc)
+        
+        assert is_valid is False
+        assert any("depth" in error["message"].lower() for error in adf_validator.errors)
+
     def test_validate_circular_reference_protection(self, adf_validator):
         """Test that validator handles potential circular references."""
         # This tests that the validator doesn't get stuck in infinite loops
@@ -172,6 +172,76 @@ class TestADFWriterPageUpdating:
         assert result["success"] is True
 
 
+    def test_update_page_without_changes_skips_write(self, mock_confluence_client, mock_page_data):
+        """Test that no update is sent when no operation changes the page."""
+        mock_confluence_client.get_page_adf.return_value = mock_page_data
+        writer = ADFWriter(mock_confluence_client)
+        
+        operations = [{"operation_type": "delete", "target_criteria": {"text": "NonExistentText"}}]
+        result = writer.update_page_preserving_formatting("123456", operations)
+        
+        assert result["success"] is True
+        assert result["skipped"] is True
+        assert result["updated_page"] is mock_page_data
+        mock_confluence_client.update_page_adf.assert_not_called()
+
+    def test_parse_page_with_serialized_body(self, mock_confluence_client, simple_adf_document):
+        """Test parsing the API v2 shape with the document as a JSON string."""
+        import json
+        writer = ADFWriter(mock_confluence_client)
+        page_data = {
+            "id": "123456",
+            "body": {"atlas_doc_format": {"representation": "atlas_doc_format", "value": json.dumps(simple_adf_document)}}
+        }
+        
+        assert writer._parse_page_to_adf(page_data).to_dict() == simple_adf_document
+
+    def test_update_pages_preserving_formatting(self, mock_confluence_client):
+        """Test batch updates return one result per page in request order."""
+        def get_page_adf(page_id):
+            return {
+                "id": page_id,
+                "title": f"Page {page_id}",
+                "version": {"number": 1},
+                "body": {"atlas_doc_format": {"version": 1, "type": "doc", "content": [
+                    {"type": "paragraph", "content": [{"type": "text", "text": f"Old {page_id}"}]}
+                ]}}
+            }
+        
+        mock_confluence_client.get_page_adf.side_effect = get_page_adf
+        mock_confluence_client.update_page_adf.side_effect = lambda page_id, content, version: {"id": page_id}
+        writer = ADFWriter(mock_confluence_client)
+        
+        operation = {"operation_type": "update_text", "target_criteria": {"text": "Old"}, "new_content": "New"}
+        results = writer.update_pages_preserving_formatting(
+            {"1": [operation], "2": [operation], "3": [operation]},
+            max_concurrent_requests=2
+        )
+        
+        assert [r["page_id"] for r in results] == ["1", "2", "3"]
+        assert [r["updated_page"]["id"] for r in results] == ["1", "2", "3"]
+        assert all(r["successful_operations"] == 1 for r in results)
+        for call in mock_confluence_client.update_page_adf.call_args_list:
+            page_id, content, version = call.args
+            assert content["title"] == f"Page {page_id}"
+            assert content["body"]["content"][0]["content"][0]["text"] == "New"
+            assert version == 1
+
+    def test_update_pages_retries_conflicts(self, mock_confluence_client):
+        """Test that a page whose write conflicts is fetched and written again."""
+        mock_confluence_client.update_page_adf.side_effect = [
+            ValueError("Page version conflict"),
+            {"id": "123456"}
+        ]
+        writer = ADFWriter(mock_confluence_client)
+        
+        operation = {"operation_type": "update_text", "target_criteria": {"text": "Mock"}, "new_content": "New"}
+        results = writer.update_pages_preserving_formatting({"123456": [operation]})
+        
+        assert results[0]["retry_count"] == 1
+        assert mock_confluence_client.get_page_adf.call_count == 2
+        assert mock_confluence_client.update_page_adf.call_count == 2
+
 class TestADFWriterOperationApplication:
     """Test operation application functionality."""
 
@@ -211,6 +281,82 @@ class TestADFWriterOperationApplication:
         assert result is False  # No matches found
 
 
+    def test_batched_operations_share_search(self, mock_confluence_client, simple_adf_document):
+        """Test that consecutive operations on the same node type search only once."""
+        writer = ADFWriter(mock_confluence_client)
+        adf_document = ADFDocument(simple_adf_document)
+        
+        operations = [
+            UpdateOperation(operation_type="update_text", target_criteria={"node_type": "text"}, new_content="First"),
+            UpdateOperation(operation_type="update_text", target_criteria={"node_type": "text"}, new_content="Second"),
+            UpdateOperation(operation_type="update_text", target_criteria={"text": "Second"}, new_content="Third"),
+            UpdateOperation(operation_type="update_text", target_criteria={"text": "Second"}, new_content="Fourth"),
+        ]
+        
+        with patch.object(writer, "_find_target_elements", wraps=writer._find_target_elements) as find:
+            applied = writer._apply_operations_batched(adf_document, operations)
+        
+        # Text criteria can stop matching after an update, so they are searched each time
+        assert find.call_count == 3
+        assert [op["index"] for op in applied] == [0, 1, 2, 3]
+        assert [op["success"] for op in applied] == [True, True, True, False]
+        assert adf_document.get_plain_text().strip() == "Third"
+
+    def test_content_modification_not_shared(self, mock_confluence_client):
+        """Test that a modify replacing content is followed by a fresh search."""
+        def list_item(text, *nested):
+            return {"type": "listItem", "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": text}]}, *nested
+            ]}
+        
+        def apply(batched):
+            writer = ADFWriter(mock_confluence_client)
+            adf_document = ADFDocument({
+                "version": 1,
+                "type": "doc",
+                "content": [{"type": "bulletList", "content": [list_item("Outer")]}]
+            })
+            operations = [
+                UpdateOperation(
+                    operation_type="modify",
+                    target_criteria={"node_type": "bulletList"},
+                    modifications={"content": [list_item("Outer", {"type": "bulletList", "content": [list_item("Inner")]})]}
+                ),
+                UpdateOperation(
+                    operation_type="modify",
+                    target_criteria={"node_type": "bulletList"},
+                    modifications={"attrs": {"order": 3}}
+                ),
+            ]
+            if batched:
+                writer._apply_operations_batched(adf_document, operations)
+            else:
+                for operation in operations:
+                    writer._apply_operation(adf_document, operation)
+            return adf_document.to_dict()
+        
+        batched = apply(batched=True)
+        nested_list = batched["content"][0]["content"][0]["content"][1]
+        assert nested_list["attrs"] == {"order": 3}
+        assert batched == apply(batched=False)
+
+    def test_delete_all_matching_siblings(self, mock_confluence_client):
+        """Test that deleting several siblings removes each matched element."""
+        writer = ADFWriter(mock_confluence_client)
+        adf_document = ADFDocument({
+            "version": 1,
+            "type": "doc",
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": f"Remove {i}"}]}
+                for i in range(3)
+            ] + [{"type": "heading", "attrs": {"level": 1}, "content": [{"type": "text", "text": "Keep"}]}]
+        })
+        
+        operation = UpdateOperation(operation_type="delete", target_criteria={"node_type": "paragraph"})
+        
+        assert writer._apply_operation(adf_document, operation) is True
+        assert [node.type for node in adf_document.content] == ["heading"]
+
 class TestADFWriterReplaceOperation:
     """Test replace operation functionality."""
 
@@ -265,6 +411,27 @@ class TestADFWriterReplaceOperation:
         assert isinstance(result, int)  # Returns count of applied operations
 
 
+    def test_replace_does_not_share_new_content(self, mock_confluence_client):
+        """Test that each replaced element gets its own copy of the new content."""
+        writer = ADFWriter(mock_confluence_client)
+        adf_document = ADFDocument({
+            "version": 1,
+            "type": "doc",
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": f"Old {i}", "marks": [{"type": "strong"}]}]}
+                for i in range(2)
+            ]
+        })
+        new_content = {"type": "text", "text": "New", "marks": [{"type": "em"}]}
+        
+        operation = UpdateOperation(operation_type="replace", target_criteria={"text": "Old"}, new_content=new_content)
+        
+        assert writer._apply_operation(adf_document, operation) is True
+        assert new_content == {"type": "text", "text": "New", "marks": [{"type": "em"}]}
+        first, second = (paragraph.content[0] for paragraph in adf_document.content)
+        assert [mark.type for mark in first.marks] == ["em", "strong"]
+        assert first.marks is not second.marks
+
 class TestADFWriterModifyOperation:
     """Test modify operation functionality."""
 
@@ -542,6 +709,32 @@ class TestADFWriterBackupAndRecovery:
         assert isinstance(restored, ADFDocument)
         assert restored.to_dict() == simple_adf_document
 
+    def test_backup_independent_of_later_edits(self, mock_confluence_client, simple_adf_document):
+        """Test that edits after backup do not leak into the stored or restored copies."""
+        writer = ADFWriter(mock_confluence_client)
+        adf_document = ADFDocument(simple_adf_document)
+        
+        backup_id = writer._create_backup("123456", adf_document)
+        adf_document.add_paragraph("Added after backup")
+        
+        restored = writer._restore_from_backup(backup_id)
+        restored.add_paragraph("Added after restore")
+        
+        assert writer._restore_from_backup(backup_id).to_dict() == simple_adf_document
+
+    def test_backups_evict_least_recently_used(self, mock_confluence_client, simple_adf_document):
+        """Test that backups beyond capacity evict the least recently used one."""
+        writer = ADFWriter(mock_confluence_client, backup_capacity=2)
+        adf_document = ADFDocument(simple_adf_document)
+        
+        first = writer._create_backup("1", adf_document)
+        second = writer._create_backup("2", adf_document)
+        writer._restore_from_backup(first)
+        third = writer._create_backup("3", adf_document)
+        
+        assert list(writer.backup_documents) == [first, third]
+        assert writer._restore_from_backup(second) is None
+
     def test_restore_nonexistent_backup(self, mock_confluence_client):
         """Test restoring from non-existent backup."""
         writer = ADFWriter(mock_confluence_client)
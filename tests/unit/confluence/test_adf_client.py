@@ -4,11 +4,14 @@ Unit tests for Confluence client ADF functionality.
 Tests cover ADF-related methods in ConfluenceClient class.
 """
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 import requests
 
-from mcp_atlassian.confluence.client import ConfluenceClient
+from mcp_atlassian.confluence.client import ConfluenceClient, gather_with_concurrency
 from mcp_atlassian.confluence.config import ConfluenceConfig
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 
@@ -75,6 +78,81 @@ class TestConfluenceClientADFMethods:
             assert result["title"] == "Test Page"
             mock_confluence_session.get.assert_called_once()
 
+    def test_get_page_adf_conditional_request(self, mock_config_cloud, mock_confluence_session):
+        """Test that an unchanged page is served from cache after a 304 response."""
+        page = {"id": "123456", "title": "Test Page", "version": {"number": 3}}
+        first_response = Mock()
+        first_response.status_code = 200
+        first_response.headers = {"ETag": '"v3"'}
+        first_response.content = json.dumps(page).encode()
+        first_response.json.return_value = page
+        not_modified = Mock()
+        not_modified.status_code = 304
+        mock_confluence_session.get.side_effect = [first_response, not_modified]
+        ConfluenceClient._adf_page_cache.clear()
+        
+        with patch.object(ConfluenceClient, '__init__', lambda x, config=None: None):
+            client = ConfluenceClient()
+            client.config = mock_config_cloud
+            client.confluence = Mock()
+            client.confluence._session = mock_confluence_session
+            other_client = ConfluenceClient()
+            other_client.config = mock_config_cloud
+            other_client.confluence = client.confluence
+            
+            assert client.get_page_adf("123456") == page
+            # The cache is shared, so another client for the same site reuses it
+            assert other_client.get_page_adf("123456") == page
+            
+            second_call = mock_confluence_session.get.call_args_list[1]
+            assert second_call.kwargs["headers"] == {"If-None-Match": '"v3"'}
+            not_modified.json.assert_not_called()
+            
+            put_response = Mock()
+            put_response.status_code = 200
+            put_response.json.return_value = {"id": "123456"}
+            mock_confluence_session.put.return_value = put_response
+            client.update_page_adf("123456", {"type": "doc"}, version_number=3)
+            
+            assert client._get_cached_page_adf("123456") is None
+
+    def test_get_pages_adf_single_request(self, mock_config_cloud, mock_confluence_session):
+        """Test that several pages are fetched with one list request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "results": [{"id": "2", "title": "Second"}, {"id": "1", "title": "First"}]
+        }
+        mock_confluence_session.get.return_value = mock_response
+        
+        with patch.object(ConfluenceClient, '__init__', lambda x, config=None: None):
+            client = ConfluenceClient()
+            client.config = mock_config_cloud
+            client.confluence = Mock()
+            client.confluence._session = mock_confluence_session
+            
+            result = client.get_pages_adf(["1", "2", "1", "3"])
+            
+            assert list(result) == ["1", "2"]
+            assert result["2"]["title"] == "Second"
+            mock_confluence_session.get.assert_called_once()
+            params = mock_confluence_session.get.call_args.kwargs["params"]
+            assert [value for key, value in params if key == "id"] == ["1", "2", "3"]
+            assert ("body-format", "atlas_doc_format") in params
+
+    def test_get_pages_adf_server_fallback(self, mock_config_server):
+        """Test that server/datacenter fetches pages one at a time."""
+        with patch.object(ConfluenceClient, '__init__', lambda x, config=None: None):
+            client = ConfluenceClient()
+            client.config = mock_config_server
+            client.confluence = Mock()
+            
+            with patch.object(client, "get_page_adf", side_effect=lambda page_id: {"id": page_id}) as get_page:
+                result = client.get_pages_adf(["1", "2"])
+            
+            assert result == {"1": {"id": "1"}, "2": {"id": "2"}}
+            assert get_page.call_count == 2
+
     def test_get_page_adf_server_fallback(self, mock_config_server):
         """Test ADF page retrieval on Server (falls back to storage format)."""
         with patch.object(ConfluenceClient, '__init__', lambda x, config=None: None):
@@ -179,12 +257,9 @@ class TestConfluenceClientADFMethods:
             client.confluence = Mock()
             client.confluence._session = mock_confluence_session
             
-            # Mock get_page_adf to return current page
-            with patch.object(client, 'get_page_adf') as mock_get:
-                mock_get.return_value = {
-                    "id": "123456",
-                    "version": {"number": 1}
-                }
+            # Mock the version lookup for the current page
+            with patch.object(client, '_get_page_version') as mock_get_version:
+                mock_get_version.return_value = 1
                 
                 adf_content = {
                     "title": "Updated Page",
@@ -200,6 +275,24 @@ class TestConfluenceClientADFMethods:
                 assert result["id"] == "123456"
                 assert result["version"]["number"] == 2
                 mock_confluence_session.put.assert_called_once()
+                mock_get_version.assert_called_once_with("123456")
+                assert mock_confluence_session.put.call_args.kwargs["json"]["version"]["number"] == 2
+
+    def test_get_page_version_skips_body(self, mock_config_cloud, mock_confluence_session):
+        """Test that the version lookup does not request the page body."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"id": "123456", "version": {"number": 7}}
+        mock_confluence_session.get.return_value = mock_response
+        
+        with patch.object(ConfluenceClient, '__init__', lambda x, config=None: None):
+            client = ConfluenceClient()
+            client.config = mock_config_cloud
+            client.confluence = Mock()
+            client.confluence._session = mock_confluence_session
+            
+            assert client._get_page_version("123456") == 7
+            assert "params" not in mock_confluence_session.get.call_args.kwargs
 
     def test_update_page_adf_with_version(self, mock_config_cloud, mock_confluence_session):
         """Test ADF page update with explicit version."""
@@ -506,3 +599,32 @@ class TestConfluenceClientADFErrorHandling:
         # Verify query parameters
         params = call_args[1].get("params", {})
         assert params.get("body-format") == "atlas_doc_format"
+
+
+class TestConfluenceClientADFAsync:
+    """Test async wrappers for ADF methods."""
+
+    def test_get_pages_adf_concurrently(self):
+        """Test fetching several pages through the async wrapper."""
+        with patch.object(ConfluenceClient, '__init__', lambda x, config=None: None):
+            client = ConfluenceClient()
+        
+        with patch.object(client, "get_page_adf", side_effect=lambda page_id: {"id": page_id}):
+            results = asyncio.run(
+                gather_with_concurrency(
+                    2, *(client.get_page_adf_async(str(page_id)) for page_id in range(5))
+                )
+            )
+        
+        assert [result["id"] for result in results] == ["0", "1", "2", "3", "4"]
+
+    def test_update_page_adf_async_passes_arguments(self):
+        """Test that the async update wrapper forwards its arguments."""
+        with patch.object(ConfluenceClient, '__init__', lambda x, config=None: None):
+            client = ConfluenceClient()
+        
+        with patch.object(client, "update_page_adf", return_value={"id": "123"}) as update:
+            result = asyncio.run(client.update_page_adf_async("123", {"type": "doc"}, 4))
+        
+        assert result == {"id": "123"}
+        update.assert_called_once_with("123", {"type": "doc"}, 4)
@@ -260,3 +260,54 @@ def test_init_no_proxies(monkeypatch):
     )
     client = ConfluenceClient(config=config)
     assert mock_session.proxies == {}
+
+
+def test_init_mounts_sized_connection_pool():
+    """Test that a pooled HTTP adapter is mounted on the Confluence session."""
+    config = ConfluenceConfig(
+        url="https://test.atlassian.net/wiki",
+        auth_type="basic",
+        username="user",
+        api_token="token",
+        pool_connections=4,
+        pool_maxsize=12,
+    )
+    with (
+        patch("mcp_atlassian.confluence.client.configure_ssl_verification"),
+        patch("mcp_atlassian.preprocessing.confluence.ConfluencePreprocessor"),
+    ):
+        client = ConfluenceClient(config=config)
+
+    session = client.confluence._session
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(f"{prefix}test.atlassian.net")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 12
+        assert adapter.max_retries.total == 3
+        assert 429 in adapter.max_retries.status_forcelist
+
+
+def test_init_validates_authentication_once_per_credentials(monkeypatch):
+    """Test that opt-in auth validation runs only once for the same credentials."""
+    monkeypatch.setenv("MCP_ATLASSIAN_VALIDATE_AUTH", "1")
+    monkeypatch.setattr(
+        "mcp_atlassian.confluence.client._VALIDATED_CREDENTIALS", set()
+    )
+    config = ConfluenceConfig(
+        url="https://validate.atlassian.net/wiki",
+        auth_type="basic",
+        username="user",
+        api_token="token",
+    )
+    with (
+        patch("mcp_atlassian.confluence.client.Confluence") as mock_confluence,
+        patch("mcp_atlassian.confluence.client.configure_ssl_verification"),
+        patch("mcp_atlassian.preprocessing.confluence.ConfluencePreprocessor"),
+    ):
+        mock_confluence.return_value.get_all_spaces.return_value = {"results": []}
+        ConfluenceClient(config=config)
+        ConfluenceClient(config=config)
+
+    mock_confluence.return_value.get_all_spaces.assert_called_once_with(
+        start=0, limit=1
+    )
@@ -701,6 +701,31 @@ class TestGetConfluenceFetcher:
             mock_confluence_fetcher_class.reset_mock()
             mock_get_http_request.reset_mock()
 
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.ConfluenceFetcher")
+    async def test_global_fetcher_reused(
+        self,
+        mock_confluence_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+    ):
+        """Test that the global ConfluenceFetcher is built once per config."""
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        app_context = config_factory.create_app_context()
+        _setup_mock_context(mock_context, app_context)
+        mock_confluence_fetcher_class.return_value = _create_mock_fetcher(
+            ConfluenceFetcher
+        )
+
+        first = await get_confluence_fetcher(mock_context)
+        second = await get_confluence_fetcher(mock_context)
+
+        assert first is second
+        mock_confluence_fetcher_class.assert_called_once_with(
+            config=app_context.full_confluence_config
+        )
+
     @pytest.mark.parametrize(
         "email_scenario,expected_email",
         [
@@ -1,6 +1,7 @@
 """Tests for the OAuth utilities."""
 
 import json
+import threading
 import time
 import urllib.parse
 from unittest.mock import MagicMock, patch
@@ -15,6 +16,7 @@ from mcp_atlassian.utils.oauth import (
     configure_oauth_session,
     get_oauth_config_from_env,
 )
+from mcp_atlassian.utils.oauth_cache import clear_token_cache, get_or_refresh
 
 
 class TestOAuthConfig:
@@ -282,6 +284,42 @@ class TestOAuthConfig:
         assert result is False
         mock_refresh.assert_called_once()
 
+    @patch("requests.post")
+    def test_ensure_valid_token_reuses_cached_token(self, mock_post):
+        """Test that configs sharing a refresh token refresh only once."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "access_token": "shared-access-token",
+            "refresh_token": "rotated-refresh-token",
+            "expires_in": 3600,
+        }
+        mock_post.return_value = mock_response
+
+        def make_config():
+            return OAuthConfig(
+                client_id="cache-client-id",
+                client_secret="test-client-secret",
+                redirect_uri="https://example.com/callback",
+                scope="read:jira-work write:jira-work",
+                cloud_id="cache-cloud-id",
+                refresh_token="cache-refresh-token",
+            )
+
+        clear_token_cache()
+        try:
+            with patch.object(OAuthConfig, "_save_tokens"):
+                first = make_config()
+                second = make_config()
+                assert first.ensure_valid_token() is True
+                assert second.ensure_valid_token() is True
+        finally:
+            clear_token_cache()
+
+        mock_post.assert_called_once()
+        assert second.access_token == "shared-access-token"
+        assert second.refresh_token == "rotated-refresh-token"
+        assert second.expires_at == first.expires_at
+
     @patch("requests.get")
     def test_get_cloud_id_success(self, mock_get):
         """Test _get_cloud_id success case."""
@@ -835,3 +873,51 @@ def test_configure_oauth_session_byo_config_no_refresh_token_direct_use(mock_log
     mock_logger.info.assert_any_call(
         "configure_oauth_session: Using provided OAuth access token directly (no refresh_token)."
     )
+
+
+def test_get_or_refresh_does_not_block_other_credentials():
+    """Test that a slow refresh does not hold up refreshes of other credentials."""
+
+    def make_config(name):
+        return OAuthConfig(
+            client_id=f"{name}-client-id",
+            client_secret="test-client-secret",
+            redirect_uri="https://example.com/callback",
+            scope="read:jira-work write:jira-work",
+            refresh_token=f"{name}-refresh-token",
+        )
+
+    slow = make_config("slow")
+    fast = make_config("fast")
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_refresh():
+        started.set()
+        release.wait(5)
+        slow.access_token = "slow-access-token"
+        slow.expires_at = time.time() + 3600
+        return True
+
+    def fast_refresh():
+        fast.access_token = "fast-access-token"
+        fast.expires_at = time.time() + 3600
+        return True
+
+    clear_token_cache()
+    try:
+        with (
+            patch.object(slow, "refresh_access_token", side_effect=slow_refresh),
+            patch.object(fast, "refresh_access_token", side_effect=fast_refresh),
+        ):
+            thread = threading.Thread(target=get_or_refresh, args=(slow,))
+            thread.start()
+            try:
+                assert started.wait(5)
+                result = get_or_refresh(fast)
+                assert result == ("fast-access-token", fast.expires_at)
+            finally:
+                release.set()
+                thread.join(5)
+    finally:
+        clear_token_cache()